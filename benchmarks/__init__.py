@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for Chandojñānam.
+
+Run with ``make bench`` or ``python -m benchmarks.run --help``.
+"""
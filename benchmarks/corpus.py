@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic corpus generator for benchmarks.
+
+This module renders laghu-guru signatures from the loaded meter
+definitions as Devanagari lines, optionally with syllable-level noise,
+so that every lookup path (exact, wildcard, fuzzy, verse) can be
+exercised without an external corpus.
+
+Notes
+-----
+Syllables are a single consonant followed by a vowel, so the weight of
+each syllable is determined by its vowel alone: short vowels (अ, इ, उ)
+give laghu and long vowels (आ, ई, ऊ, ए, ओ) give guru.
+"""
+
+import random
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+###############################################################################
+
+CONSONANTS = 'कगचजतदनपबमयरलवसह'
+SHORT_VOWEL_SIGNS = ('', 'ि', 'ु')
+LONG_VOWEL_SIGNS = ('ा', 'ी', 'ू', 'े', 'ो')
+
+WILDCARD = re.compile(r'\[([^\]]+)\]')
+
+###############################################################################
+
+
+class SyntheticCorpus:
+    """
+    Generator of Devanagari lines and verses for meter signatures.
+
+    Parameters
+    ----------
+    analyzer : Chanda
+        Analyzer whose definitions provide the signatures.
+    seed : int, optional
+        Seed of the random number generator.
+    """
+
+    def __init__(self, analyzer, seed: int = 0) -> None:
+        self.analyzer = analyzer
+        self.random = random.Random(seed)
+        self.L = analyzer.L
+        self.G = analyzer.G
+
+    # ----------------------------------------------------------------------- #
+
+    def concretize(self, signature: str) -> str:
+        """
+        Replace wildcard classes (e.g. ``[LG]``) with one of their weights.
+
+        Parameters
+        ----------
+        signature : str
+            Laghu-guru signature, possibly with wildcards.
+
+        Returns
+        -------
+        str
+            Laghu-guru string without wildcards.
+        """
+        return WILDCARD.sub(lambda m: self.random.choice(m.group(1)), signature)
+
+    def add_noise(self, lg_str: str, rate: float) -> str:
+        """
+        Apply random syllable substitutions, insertions and deletions.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru string.
+        rate : float
+            Probability of an edit per syllable. At least one edit is
+            applied when ``rate`` is positive.
+
+        Returns
+        -------
+        str
+            Edited laghu-guru string (never empty).
+        """
+        if rate <= 0:
+            return lg_str
+        weights = list(lg_str)
+        edits = sum(self.random.random() < rate for _ in weights) or 1
+        for _ in range(edits):
+            position = self.random.randrange(len(weights))
+            operation = self.random.choice(('substitute', 'insert', 'delete'))
+            if operation == 'substitute':
+                weights[position] = self.L if weights[position] == self.G else self.G
+            elif operation == 'insert':
+                weights.insert(position, self.random.choice((self.L, self.G)))
+            elif len(weights) > 1:
+                del weights[position]
+        return ''.join(weights)
+
+    def render(self, lg_str: str) -> str:
+        """
+        Render a laghu-guru string as a Devanagari line.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru string without wildcards.
+
+        Returns
+        -------
+        str
+            Line with one syllable per weight, split into words of two to
+            five syllables.
+        """
+        syllables = [
+            self.random.choice(CONSONANTS) + self.random.choice(
+                SHORT_VOWEL_SIGNS if weight == self.L else LONG_VOWEL_SIGNS
+            )
+            for weight in lg_str
+        ]
+        words = []
+        while syllables:
+            size = self.random.randint(2, 5)
+            words.append(''.join(syllables[:size]))
+            syllables = syllables[size:]
+        return ' '.join(words)
+
+    # ----------------------------------------------------------------------- #
+
+    def signatures(self, wildcard: bool = False) -> List[str]:
+        """
+        List single and multi-pada signatures of the loaded definitions.
+
+        Parameters
+        ----------
+        wildcard : bool, optional
+            If ``True``, list only signatures with wildcards; otherwise
+            only signatures without them.
+
+        Returns
+        -------
+        list[str]
+            Signatures in definition order.
+        """
+        return [
+            signature for signature in self.analyzer.CHANDA
+            if ('[' in signature) == wildcard
+        ]
+
+    def lines(
+        self,
+        count: int,
+        signatures: Sequence[str],
+        noise: float = 0.0
+    ) -> List[Tuple[str, str]]:
+        """
+        Generate lines cycling through signatures.
+
+        Parameters
+        ----------
+        count : int
+            Number of lines.
+        signatures : sequence of str
+            Signatures to render.
+        noise : float, optional
+            Edit probability per syllable (see ``add_noise``).
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            ``(signature, line)`` pairs. Lines are unique, so caches do not
+            short-circuit the measurements.
+        """
+        result = []
+        seen = set()
+        for signature in self._cycle(signatures, count):
+            while True:
+                lg_str = self.add_noise(self.concretize(signature), noise)
+                line = self.render(lg_str)
+                if line not in seen:
+                    break
+            seen.add(line)
+            result.append((signature, line))
+        return result
+
+    def verses(self, count: int) -> List[Tuple[str, str]]:
+        """
+        Generate four-line verses of akṣaragaṇa meters.
+
+        Parameters
+        ----------
+        count : int
+            Number of verses.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            ``(signature, verse)`` pairs, where the signature is the
+            four-pada key and the verse has a daṇḍa after the second line
+            and a double daṇḍa after the fourth.
+        """
+        splits = {
+            signature: padas[0]
+            for signature, padas in self.analyzer.SPLITS.items()
+            if len(padas[0]) == 4
+        }
+        result = []
+        for signature in self._cycle(list(splits), count):
+            padas = [self.render(self.concretize(p)) for p in splits[signature]]
+            verse = '\n'.join([
+                padas[0], padas[1] + ' ।', padas[2], padas[3] + ' ॥'
+            ])
+            result.append((signature, verse))
+        return result
+
+    def _cycle(self, items: Sequence[str], count: int) -> Iterator[str]:
+        """
+        Yield ``count`` items, cycling through a shuffled copy of ``items``.
+        """
+        items = list(items)
+        self.random.shuffle(items)
+        for idx in range(count if items else 0):
+            yield items[idx % len(items)]
+
+
+###############################################################################
+
+
+def build_corpus(
+    analyzer,
+    lines: int = 200,
+    verses: int = 50,
+    noise: float = 0.1,
+    seed: int = 0
+) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Build the benchmark corpus for every mode.
+
+    Parameters
+    ----------
+    analyzer : Chanda
+        Analyzer whose definitions provide the signatures.
+    lines : int, optional
+        Number of lines for the exact, wildcard and fuzzy modes.
+    verses : int, optional
+        Number of verses for the verse mode.
+    noise : float, optional
+        Edit probability per syllable for the fuzzy mode.
+    seed : int, optional
+        Seed of the random number generator.
+
+    Returns
+    -------
+    dict
+        Mapping of mode name to ``(signature, text)`` pairs.
+    """
+    corpus = SyntheticCorpus(analyzer, seed=seed)
+    exact = corpus.signatures()
+    return {
+        'exact': corpus.lines(lines, exact),
+        'wildcard': corpus.lines(lines, corpus.signatures(wildcard=True)),
+        'fuzzy': corpus.lines(lines, exact, noise=noise),
+        'verse': corpus.verses(verses),
+    }
+
+
+def write_corpus(
+    corpus: Dict[str, List[Tuple[str, str]]],
+    path: str,
+    modes: Optional[Sequence[str]] = None
+) -> None:
+    """
+    Write corpus texts to a plain-text file (one line or verse per block).
+
+    Parameters
+    ----------
+    corpus : dict
+        Output of ``build_corpus``.
+    path : str
+        Output file path.
+    modes : sequence of str, optional
+        Modes to include. Defaults to all.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        for mode in modes or corpus:
+            for _, text in corpus[mode]:
+                f.write(text + '\n')
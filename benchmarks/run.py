@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark runner for Chandojñānam.
+
+Measures throughput (lines per second), latency percentiles, peak
+memory and accuracy of meter identification on a synthetic corpus
+(see ``benchmarks.corpus``) for the exact, wildcard, fuzzy and verse
+modes, and writes the results as JSON.
+
+Usage
+-----
+    python -m benchmarks.run --output bench_results.json
+    python -m benchmarks.run --baseline previous.json
+
+Notes
+-----
+Library caches are cleared before each mode, and generated lines are
+unique, so the numbers reflect uncached analysis. Peak memory is
+measured with ``tracemalloc`` in a second pass, so it does not distort
+the timings.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import chanda
+from chanda import Chanda
+from chanda.caches import clear_caches
+from chanda.utils import get_default_data_path
+
+from .corpus import build_corpus, write_corpus
+
+###############################################################################
+
+MODES = ('exact', 'wildcard', 'fuzzy', 'verse')
+
+###############################################################################
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Parameters
+    ----------
+    values : sequence of float
+        Sorted values.
+    q : float
+        Percentile in ``[0, 100]``.
+
+    Returns
+    -------
+    float
+        Value at the percentile, or ``0.0`` for no values.
+    """
+    if not values:
+        return 0.0
+    rank = max(int(round(q / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def _names(meters: Sequence) -> Set[str]:
+    """
+    Meter names from ``(name, padas)`` pairs.
+    """
+    return {name for name, _ in meters}
+
+
+def _line_hit(analyzer: Chanda, signature: str, result) -> bool:
+    """
+    Whether a line result identifies (or suggests) the generating meter.
+    """
+    expected = _names(analyzer.CHANDA[signature])
+    found = _names(result.chanda)
+    for match in result.fuzzy:
+        found |= _names(match['chanda'])
+    return bool(expected & found)
+
+
+def _verse_hit(analyzer: Chanda, signature: str, result) -> bool:
+    """
+    Whether a verse result identifies the generating meter.
+    """
+    expected = _names(analyzer.CHANDA[signature])
+    return any(
+        expected & set(verse.chanda[0]) for verse in result.result.verse
+    )
+
+
+def mode_runner(
+    analyzer: Chanda,
+    mode: str
+) -> Tuple[Callable[[str], Any], Callable[[str, Any], bool]]:
+    """
+    Analysis call and accuracy check for a benchmark mode.
+
+    Parameters
+    ----------
+    analyzer : Chanda
+        Analyzer instance.
+    mode : str
+        One of ``MODES``.
+
+    Returns
+    -------
+    callable
+        Function analyzing one corpus item.
+    callable
+        Function ``(signature, result) -> bool`` checking the result.
+    """
+    if mode == 'verse':
+        return (
+            lambda text: analyzer.analyze_text(text, verse=True, fuzzy=True),
+            lambda signature, result: _verse_hit(analyzer, signature, result)
+        )
+    fuzzy = mode == 'fuzzy'
+    return (
+        lambda text: analyzer.analyze_line(text, fuzzy=fuzzy),
+        lambda signature, result: _line_hit(analyzer, signature, result)
+    )
+
+
+def measure(
+    analyzer: Chanda,
+    mode: str,
+    items: List[Tuple[str, str]],
+    memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Benchmark one mode.
+
+    Parameters
+    ----------
+    analyzer : Chanda
+        Analyzer instance.
+    mode : str
+        One of ``MODES``.
+    items : list[tuple[str, str]]
+        ``(signature, text)`` pairs from the corpus.
+    memory : bool, optional
+        Measure peak memory in a second pass.
+
+    Returns
+    -------
+    dict
+        ``items``, ``lines``, ``seconds``, ``lines_per_sec``,
+        ``p50_ms``, ``p99_ms``, ``max_ms``, ``accuracy`` and
+        ``peak_memory_kib`` (``None`` if not measured).
+    """
+    analyze, check = mode_runner(analyzer, mode)
+
+    clear_caches()
+    latencies = []
+    hits = 0
+    start = time.perf_counter()
+    for signature, text in items:
+        t0 = time.perf_counter()
+        result = analyze(text)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        hits += check(signature, result)
+    seconds = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        clear_caches()
+        tracemalloc.start()
+        for _, text in items:
+            analyze(text)
+        peak = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+
+    latencies.sort()
+    lines = sum(text.count('\n') + 1 for _, text in items)
+    return {
+        'items': len(items),
+        'lines': lines,
+        'seconds': round(seconds, 4),
+        'lines_per_sec': round(lines / seconds, 2) if seconds else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'max_ms': round(latencies[-1], 3) if latencies else 0.0,
+        'accuracy': round(hits / len(items), 4) if items else 0.0,
+        'peak_memory_kib': round(peak, 1) if peak is not None else None,
+    }
+
+
+def run_benchmarks(
+    data_path: Optional[str] = None,
+    modes: Sequence[str] = MODES,
+    lines: int = 200,
+    verses: int = 50,
+    noise: float = 0.1,
+    seed: int = 0,
+    memory: bool = True,
+    corpus_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run the benchmark suite.
+
+    Parameters
+    ----------
+    data_path : str, optional
+        Meter definition data directory. Defaults to the packaged data.
+    modes : sequence of str, optional
+        Modes to run.
+    lines : int, optional
+        Lines per line mode.
+    verses : int, optional
+        Verses for the verse mode.
+    noise : float, optional
+        Edit probability per syllable in the fuzzy mode.
+    seed : int, optional
+        Corpus seed.
+    memory : bool, optional
+        Measure peak memory.
+    corpus_path : str, optional
+        If given, also write the generated corpus to this file.
+
+    Returns
+    -------
+    dict
+        Environment, configuration, definition load time and per-mode
+        results.
+    """
+    data_path = data_path or get_default_data_path()
+
+    start = time.perf_counter()
+    analyzer = Chanda(data_path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    corpus = build_corpus(analyzer, lines=lines, verses=verses, noise=noise, seed=seed)
+    if corpus_path:
+        write_corpus(corpus, corpus_path, modes)
+
+    return {
+        'chanda_version': chanda.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'config': {
+            'data_path': data_path,
+            'lines': lines,
+            'verses': verses,
+            'noise': noise,
+            'seed': seed,
+        },
+        'load_ms': round(load_ms, 3),
+        'modes': {
+            mode: measure(analyzer, mode, corpus[mode], memory=memory)
+            for mode in modes
+        },
+    }
+
+
+###############################################################################
+
+
+def format_report(
+    results: Dict[str, Any],
+    baseline: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Render benchmark results as a table.
+
+    Parameters
+    ----------
+    results : dict
+        Output of ``run_benchmarks``.
+    baseline : dict, optional
+        Earlier results; adds the throughput ratio against them.
+
+    Returns
+    -------
+    str
+        Plain-text report.
+    """
+    header = (
+        f"{'Mode':<10}{'Lines/s':>12}{'p50 (ms)':>11}{'p99 (ms)':>11}"
+        f"{'Peak KiB':>11}{'Accuracy':>10}"
+    )
+    if baseline:
+        header += f"{'vs base':>10}"
+    rows = [
+        f"chanda {results['chanda_version']}, load {results['load_ms']:.1f} ms",
+        header,
+        '-' * len(header)
+    ]
+    for mode, values in results['modes'].items():
+        peak = values['peak_memory_kib']
+        row = (
+            f"{mode:<10}{values['lines_per_sec']:>12.1f}{values['p50_ms']:>11.3f}"
+            f"{values['p99_ms']:>11.3f}{'-' if peak is None else f'{peak:.0f}':>11}"
+            f"{values['accuracy']:>10.1%}"
+        )
+        previous = (baseline or {}).get('modes', {}).get(mode)
+        if previous and previous['lines_per_sec']:
+            row += f"{values['lines_per_sec'] / previous['lines_per_sec']:>9.2f}x"
+        rows.append(row)
+    return '\n'.join(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        Command-line arguments (defaults to ``sys.argv[1:]``).
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run',
+        description='Benchmark meter identification on a synthetic corpus'
+    )
+    parser.add_argument('--data-path', metavar='PATH', help='Meter definition data directory')
+    parser.add_argument(
+        '--mode', dest='modes', action='append', choices=MODES,
+        help='Mode to run (repeatable; default: all)'
+    )
+    parser.add_argument('--lines', type=int, default=200, help='Lines per line mode (default: 200)')
+    parser.add_argument('--verses', type=int, default=50, help='Verses for verse mode (default: 50)')
+    parser.add_argument(
+        '--noise', type=float, default=0.1,
+        help='Edit probability per syllable in fuzzy mode (default: 0.1)'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed (default: 0)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip peak memory measurement')
+    parser.add_argument('--corpus', metavar='FILE', help='Also write the generated corpus to FILE')
+    parser.add_argument('-o', '--output', metavar='FILE', help='Write JSON results to FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare throughput with earlier JSON results')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        data_path=args.data_path,
+        modes=args.modes or MODES,
+        lines=args.lines,
+        verses=args.verses,
+        noise=args.noise,
+        seed=args.seed,
+        memory=not args.no_memory,
+        corpus_path=args.corpus
+    )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(format_report(results, baseline), file=sys.stderr)
+    else:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -33,19 +33,94 @@ Examples
 __version__ = "1.0.0"
 __author__ = "Hrishikesh Terdalkar"
 
-from .core import Chanda, analyze_line, analyze_text
-from .formatter import format_result, display_fields, format_chanda_list
-from .utils import get_supported_meters
-from .types import (
-    ChandaResult,
-    LineResult,
-    VerseResult,
-    AnalysisResult,
-    MeterStats,
-    TextAnalysisResult
-)
-from .constants import Language
-from .exceptions import ChandaError, InvalidInputError, MeterNotFoundError
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Chanda, analyze_line, analyze_text
+    from .formatter import format_result, display_fields, format_chanda_list
+    from .utils import get_supported_meters
+    from .summary import SummaryAccumulator
+    from .index import CorpusIndex
+    from .codec import GanaCodec
+    from .caches import cache_stats
+    from .types import (
+        ChandaResult,
+        LineResult,
+        VerseResult,
+        AnalysisResult,
+        MeterStats,
+        TextAnalysisResult
+    )
+    from .constants import Language
+    from .exceptions import ChandaError, InvalidInputError, MeterNotFoundError
+
+# Public attributes are imported on first access (PEP 562) so that
+# ``import chanda`` does not pull in the transliteration and
+# edit-distance dependencies until they are needed.
+_LAZY_ATTRIBUTES = {
+    'Chanda': '.core',
+    'analyze_line': '.core',
+    'analyze_text': '.core',
+    'format_result': '.formatter',
+    'display_fields': '.formatter',
+    'format_chanda_list': '.formatter',
+    'get_supported_meters': '.utils',
+    'SummaryAccumulator': '.summary',
+    'CorpusIndex': '.index',
+    'GanaCodec': '.codec',
+    'cache_stats': '.caches',
+    'ChandaResult': '.types',
+    'LineResult': '.types',
+    'VerseResult': '.types',
+    'AnalysisResult': '.types',
+    'MeterStats': '.types',
+    'TextAnalysisResult': '.types',
+    'Language': '.constants',
+    'ChandaError': '.exceptions',
+    'InvalidInputError': '.exceptions',
+    'MeterNotFoundError': '.exceptions',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public attributes on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name.
+
+    Returns
+    -------
+    object
+        The requested attribute.
+
+    Raises
+    ------
+    AttributeError
+        If ``name`` is not a public attribute of the package.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List module attributes, including lazily imported ones.
+
+    Returns
+    -------
+    list[str]
+        Attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     # Core classes and functions
@@ -58,6 +133,10 @@ __all__ = [
     'format_chanda_list',
     # Utilities
     'get_supported_meters',
+    'SummaryAccumulator',
+    'CorpusIndex',
+    'GanaCodec',
+    'cache_stats',
     # Types
     'ChandaResult',
     'LineResult',
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio interface for Chandojñānam.
+
+This module runs the CPU-bound analysis of a ``Chanda`` instance in an
+executor so that the event loop stays responsive, and streams line and
+verse results through an async iterator with bounded buffering.
+
+Notes
+-----
+With a thread executor (or the loop's default executor when
+``executor`` is ``None``), the analyzer instance itself is used. With a
+``concurrent.futures.ProcessPoolExecutor``, each worker process builds
+(once) its own ``Chanda`` from the analyzer's constructor arguments
+(``data_path``, ``symbols``, ``language`` and ``wildcard_limit``), and
+lines are analyzed in parallel.
+
+Examples
+--------
+>>> chanda = Chanda(get_default_data_path())
+>>> result = await chanda.analyze_line_async("रामो राजमणिः सदा विजयते")
+>>> async for item in chanda.aiter_analyze_text(text, verse=True):
+...     print(item)
+"""
+
+import asyncio
+import functools
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Tuple, Union
+
+from .constants import DEFAULT_VERSE_LINES
+from .types import ChandaResult, LineResult, VerseResult, TextAnalysisResult
+
+###############################################################################
+
+# Maximum number of results buffered ahead of the consumer
+DEFAULT_MAX_QUEUE = 32
+
+_DONE = object()
+
+# Per-process analyzers for process executors, by constructor arguments
+_WORKER_ANALYZERS: Dict[Tuple[str, str, str, int], Any] = {}
+
+###############################################################################
+
+
+def _analyzer_config(analyzer) -> Tuple[str, str, str, int]:
+    """
+    Get the constructor arguments to rebuild an analyzer in a worker.
+    """
+    return (
+        analyzer.data_path,
+        analyzer.symbols,
+        analyzer.language,
+        analyzer.wildcard_limit
+    )
+
+
+def _worker_call(
+    config: Tuple[str, str, str, int],
+    method: str,
+    args: Tuple,
+    kwargs: Dict[str, Any]
+) -> Any:
+    """
+    Call an analyzer method in a worker process.
+
+    Parameters
+    ----------
+    config : tuple
+        ``Chanda`` constructor arguments (see ``_analyzer_config``).
+    method : str
+        ``Chanda`` method name.
+    args : tuple
+        Positional arguments.
+    kwargs : dict
+        Keyword arguments.
+
+    Returns
+    -------
+    object
+        Method result.
+    """
+    return getattr(_worker_analyzer(config), method)(*args, **kwargs)
+
+
+def _worker_analyzer(config: Tuple[str, str, str, int]):
+    """
+    Get (or build, once per process) the analyzer of a worker process.
+    """
+    analyzer = _WORKER_ANALYZERS.get(config)
+    if analyzer is None:
+        from .core import Chanda
+        data_path, symbols, language, wildcard_limit = config
+        analyzer = Chanda(
+            data_path,
+            symbols=symbols,
+            language=language,
+            wildcard_limit=wildcard_limit
+        )
+        _WORKER_ANALYZERS[config] = analyzer
+    return analyzer
+
+
+def _worker_text_line(
+    config: Tuple[str, str, str, int],
+    line: str,
+    fuzzy: bool,
+    output_scheme: Optional[str],
+    wall_deadline: Optional[float],
+    max_candidates: Optional[int],
+    expected: Optional[Sequence[str]]
+):
+    """
+    Analyze a line of a text in a worker process.
+
+    ``wall_deadline`` is a ``time.time()`` value, since the
+    ``time.perf_counter()`` deadlines of ``Chanda._analyze_text_line`` are
+    not comparable across processes.
+    """
+    deadline = (
+        time.perf_counter() + (wall_deadline - time.time())
+        if wall_deadline is not None else None
+    )
+    return _worker_analyzer(config)._analyze_text_line(
+        line,
+        fuzzy,
+        output_scheme,
+        deadline=deadline,
+        max_candidates=max_candidates,
+        expected=expected
+    )
+
+
+def _bind(
+    analyzer,
+    executor: Optional[Executor],
+    method: str,
+    *args: Any,
+    **kwargs: Any
+):
+    """
+    Build the callable to submit to an executor.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        return functools.partial(
+            _worker_call,
+            _analyzer_config(analyzer),
+            method,
+            args,
+            kwargs
+        )
+    return functools.partial(getattr(analyzer, method), *args, **kwargs)
+
+
+async def _run(
+    analyzer,
+    executor: Optional[Executor],
+    method: str,
+    *args: Any,
+    **kwargs: Any
+) -> Any:
+    """
+    Run an analyzer method in an executor.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        _bind(analyzer, executor, method, *args, **kwargs)
+    )
+
+
+###############################################################################
+
+
+async def analyze_line_async(
+    analyzer,
+    line: str,
+    fuzzy: bool = False,
+    k: int = 10,
+    executor: Optional[Executor] = None,
+    deadline_ms: Optional[float] = None,
+    max_candidates: Optional[int] = None,
+    expected: Optional[Sequence[str]] = None
+) -> ChandaResult:
+    """
+    Identify chanda from a single line without blocking the event loop.
+
+    Parameters
+    ----------
+    analyzer : Chanda
+        Analyzer instance.
+    line : str
+        Input text line.
+    fuzzy : bool, optional
+        Enable fuzzy matching.
+    k : int, optional
+        Maximum number of fuzzy matches to return.
+    executor : concurrent.futures.Executor, optional
+        Executor for the analysis. Defaults to the loop's default executor.
+    deadline_ms : float, optional
+        Time budget for fuzzy search in milliseconds, counted from the
+        start of the analysis; results cut short are marked ``partial``.
+    max_candidates : int, optional
+        Maximum number of signatures aligned by the fuzzy search.
+    expected : sequence of str, optional
+        Names of the expected meters (see ``Chanda.analyze_line``).
+
+    Returns
+    -------
+    ChandaResult
+        Result containing identification details.
+    """
+    return await _run(
+        analyzer,
+        executor,
+        'analyze_line',
+        line,
+        fuzzy=fuzzy,
+        k=k,
+        deadline_ms=deadline_ms,
+        max_candidates=max_candidates,
+        expected=expected
+    )
+
+
+async def analyze_text_async(
+    analyzer,
+    text: str,
+    verse: bool = False,
+    fuzzy: bool = False,
+    scheme: Optional[str] = None,
+    verse_lines: int = DEFAULT_VERSE_LINES,
+    segment: bool = False,
+    executor: Optional[Executor] = None,
+    deadline_ms: Optional[float] = None,
+    max_candidates: Optional[int] = None,
+    expected: Optional[Sequence[str]] = None
+) -> TextAnalysisResult:
+    """
+    Identify meters from text without blocking the event loop.
+
+    Parameters
+    ----------
+    analyzer : Chanda
+        Analyzer instance.
+    text : str
+        Input Sanskrit text.
+    verse : bool, optional
+        If ``True``, treat input as collection of verses.
+    fuzzy : bool, optional
+        Enable fuzzy matching.
+    scheme : str, optional
+        Output transliteration scheme.
+    verse_lines : int, optional
+        Number of lines per verse.
+    segment : bool, optional
+        Detect verse boundaries automatically (verse mode).
+    executor : concurrent.futures.Executor, optional
+        Executor for the analysis. Defaults to the loop's default executor.
+    deadline_ms : float, optional
+        Time budget for fuzzy search over the whole text in milliseconds;
+        line results cut short are marked ``partial``.
+    max_candidates : int, optional
+        Maximum number of signatures aligned by each fuzzy search.
+    expected : sequence of str, optional
+        Names of the expected meters (see ``Chanda.analyze_line``).
+
+    Returns
+    -------
+    TextAnalysisResult
+        Analysis results with line and verse results.
+    """
+    return await _run(
+        analyzer,
+        executor,
+        'analyze_text',
+        text,
+        verse=verse,
+        fuzzy=fuzzy,
+        scheme=scheme,
+        verse_lines=verse_lines,
+        segment=segment,
+        deadline_ms=deadline_ms,
+        max_candidates=max_candidates,
+        expected=expected
+    )
+
+
+async def aiter_analyze_text(
+    analyzer,
+    text: str,
+    verse: bool = False,
+    fuzzy: bool = False,
+    scheme: Optional[str] = None,
+    verse_lines: int = DEFAULT_VERSE_LINES,
+    segment: bool = False,
+    executor: Optional[Executor] = None,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+    deadline_ms: Optional[float] = None,
+    max_candidates: Optional[int] = None,
+    expected: Optional[Sequence[str]] = None
+) -> AsyncIterator[Union[LineResult, VerseResult]]:
+    """
+    Stream line and verse results without blocking the event loop.
+
+    Parameters
+    ----------
+    analyzer : Chanda
+        Analyzer instance.
+    text : str
+        Input Sanskrit text.
+    verse : bool, optional
+        If ``True``, treat input as collection of verses.
+    fuzzy : bool, optional
+        Enable fuzzy matching.
+    scheme : str, optional
+        Output transliteration scheme.
+    verse_lines : int, optional
+        Number of lines per verse.
+    segment : bool, optional
+        Detect verse boundaries automatically (verse mode).
+    executor : concurrent.futures.Executor, optional
+        Executor for the analysis. Defaults to the loop's default executor.
+    max_queue : int, optional
+        Maximum number of results computed ahead of the consumer. The
+        producer pauses when the buffer is full (backpressure).
+    deadline_ms : float, optional
+        Time budget for fuzzy search over the whole text in milliseconds;
+        line results cut short are marked ``partial``.
+    max_candidates : int, optional
+        Maximum number of signatures aligned by each fuzzy search.
+    expected : sequence of str, optional
+        Names of the expected meters (see ``Chanda.analyze_line``).
+
+    Yields
+    ------
+    LineResult or VerseResult
+        Items in the order of ``Chanda.iter_analyze_text``.
+
+    Notes
+    -----
+    Closing the iterator (or cancelling the consuming task) stops the
+    analysis before the next line is started.
+    """
+    options = dict(
+        verse=verse,
+        fuzzy=fuzzy,
+        scheme=scheme,
+        verse_lines=verse_lines,
+        segment=segment,
+        deadline_ms=deadline_ms,
+        max_candidates=max_candidates,
+        expected=expected
+    )
+    if isinstance(executor, ProcessPoolExecutor):
+        iterator = _aiter_process(analyzer, text, executor, max_queue, **options)
+    else:
+        iterator = _aiter_thread(analyzer, text, executor, max_queue, **options)
+    try:
+        async for item in iterator:
+            yield item
+    finally:
+        await iterator.aclose()
+
+
+async def _aiter_thread(
+    analyzer,
+    text: str,
+    executor: Optional[Executor],
+    max_queue: int,
+    **options: Any
+) -> AsyncIterator[Union[LineResult, VerseResult]]:
+    """
+    Run ``iter_analyze_text`` on one executor thread feeding a bounded queue.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=max(max_queue, 1))
+    stopped = False
+
+    def produce() -> None:
+        try:
+            for item in analyzer.iter_analyze_text(text, **options):
+                # Blocks this thread while the queue is full
+                asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+                if stopped:
+                    return
+        except BaseException as e:
+            item = e
+        else:
+            item = _DONE
+        if not stopped:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    producer = loop.run_in_executor(executor, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped = True
+        while not producer.done():
+            # Unblock a producer waiting on a full queue
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.wait({producer}, timeout=0.01)
+
+
+async def _aiter_process(
+    analyzer,
+    text: str,
+    executor: ProcessPoolExecutor,
+    max_queue: int,
+    verse: bool,
+    fuzzy: bool,
+    scheme: Optional[str],
+    verse_lines: int,
+    segment: bool,
+    deadline_ms: Optional[float],
+    max_candidates: Optional[int],
+    expected: Optional[Sequence[str]]
+) -> AsyncIterator[Union[LineResult, VerseResult]]:
+    """
+    Analyze lines in worker processes with a bounded number in flight.
+    """
+    from .core import _TextResultGrouper
+
+    wall_deadline = (
+        time.time() + deadline_ms / 1000 if deadline_ms is not None else None
+    )
+    loop = asyncio.get_running_loop()
+    lines, output_scheme, markers = await loop.run_in_executor(
+        None,
+        functools.partial(
+            analyzer._prepare_text, text, verse=verse, segment=segment, scheme=scheme
+        )
+    )
+    grouper = _TextResultGrouper(
+        analyzer, verse, verse_lines, markers, expected=expected, fuzzy=fuzzy
+    )
+    config = _analyzer_config(analyzer)
+    pending = deque()
+    todo = ((idx, line) for idx, line in enumerate(lines) if line)
+    try:
+        while True:
+            while len(pending) < max(max_queue, 1):
+                item = next(todo, None)
+                if item is None:
+                    break
+                idx, line = item
+                future = loop.run_in_executor(executor, functools.partial(
+                    _worker_text_line,
+                    config,
+                    line,
+                    fuzzy,
+                    output_scheme,
+                    wall_deadline,
+                    max_candidates,
+                    expected
+                ))
+                pending.append((idx, future))
+            if not pending:
+                break
+            idx, future = pending.popleft()
+            for item in grouper.feed(idx, await future):
+                yield item
+        for item in grouper.finish():
+            yield item
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+###############################################################################
@@ -15,6 +15,7 @@ from typing import List, Tuple, Union
 
 import sanskrit_text as skt
 
+from .caches import sized
 from .constants import MAX_CACHE, SyllableWeight, Language
 
 ###############################################################################
@@ -86,6 +87,7 @@ class SanskritChandaAnalyzer(ChandaAnalyzer):
     """
 
     @functools.lru_cache(maxsize=MAX_CACHE)
+    @sized('SanskritChandaAnalyzer.mark_syllable_weights')
     def mark_syllable_weights(self, text: str) -> Tuple[Syllables, List[str]]:
         """
         Mark syllable weights according to Sanskrit prosodic rules.
@@ -183,6 +185,7 @@ class PrakritChandaAnalyzer(ChandaAnalyzer):
     """
 
     @functools.lru_cache(maxsize=MAX_CACHE)
+    @sized('PrakritChandaAnalyzer.mark_syllable_weights')
     def mark_syllable_weights(self, text: str) -> Tuple[Syllables, List[str]]:
         """
         Mark syllable weights according to Prakrit prosodic rules.
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache statistics for Chandojñānam.
+
+This module reports hits, misses, size and approximate memory of the
+``functools.lru_cache`` instances used by the library, so that
+``MAX_CACHE`` can be sized from measurements.
+
+Notes
+-----
+Byte sizes are estimates. Every cached function is decorated with
+``sized``, below its ``lru_cache``, so that it sees the arguments and
+result of each cache miss; a sample of these entries is measured with
+``sys.getsizeof`` through nested containers and strings, and the mean
+entry size is multiplied by the current cache size. Objects that are not
+plain data (e.g. the ``Chanda`` instance in method cache keys) and the
+bookkeeping of ``lru_cache`` itself are not counted.
+
+Examples
+--------
+>>> from chanda import cache_stats
+>>> cache_stats()['Chanda.mark_syllable_weights']['hits']
+42
+"""
+
+import functools
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Optional, Set
+
+###############################################################################
+
+# Cache name -> (module, attribute path)
+CACHES = {
+    'Chanda.mark_syllable_weights': ('.core', 'Chanda.mark_syllable_weights'),
+    'Chanda._editops': ('.core', 'Chanda._editops'),
+    'Chanda._pada_distance': ('.core', 'Chanda._pada_distance'),
+    'SanskritChandaAnalyzer.mark_syllable_weights': (
+        '.analyzer', 'SanskritChandaAnalyzer.mark_syllable_weights'
+    ),
+    'PrakritChandaAnalyzer.mark_syllable_weights': (
+        '.analyzer', 'PrakritChandaAnalyzer.mark_syllable_weights'
+    ),
+    'SanskritTextProcessor.process_and_detect_scheme': (
+        '.processor', 'SanskritTextProcessor.process_and_detect_scheme'
+    ),
+    'SanskritTextProcessor.process_and_detect_markers': (
+        '.processor', 'SanskritTextProcessor.process_and_detect_markers'
+    ),
+    'get_supported_meters': ('.utils', '_count_meters'),
+}
+
+# Containers whose contents are counted towards a cache entry
+_CONTAINERS = (tuple, list, dict, set, frozenset)
+_SCALARS = (str, bytes, int, float, bool, type(None))
+
+# The first ``SIZE_SAMPLE_FIRST`` misses of a cache are measured, then every
+# ``SIZE_SAMPLE_EVERY``-th
+SIZE_SAMPLE_FIRST = 16
+SIZE_SAMPLE_EVERY = 64
+
+# Cache name -> [misses seen, entries measured, bytes measured]
+_ENTRY_SIZES: Dict[str, List[int]] = {}
+
+###############################################################################
+
+
+def _resolve(name: str) -> Callable:
+    """
+    Find the ``lru_cache`` wrapper of a registered cache.
+
+    Parameters
+    ----------
+    name : str
+        Key of ``CACHES``.
+
+    Returns
+    -------
+    callable
+        The cache wrapper (outer decorators such as stage
+        instrumentation are unwrapped).
+    """
+    module_name, path = CACHES[name]
+    obj = importlib.import_module(module_name, __package__)
+    for attribute in path.split('.'):
+        obj = getattr(obj, attribute)
+    while not hasattr(type(obj), 'cache_info') and hasattr(obj, '__wrapped__'):
+        obj = obj.__wrapped__
+    return obj
+
+
+def _deep_size(obj: Any, seen: Set[int]) -> int:
+    """
+    Approximate the memory of plain data reachable from an object.
+
+    Parameters
+    ----------
+    obj : object
+        Object to measure.
+    seen : set[int]
+        Ids of objects already counted (updated in place).
+
+    Returns
+    -------
+    int
+        Size in bytes.
+    """
+    if id(obj) in seen or not isinstance(obj, _CONTAINERS + _SCALARS):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items()
+        )
+    elif isinstance(obj, _CONTAINERS):
+        size += sum(_deep_size(item, seen) for item in obj)
+    return size
+
+
+def sized(name: str) -> Callable:
+    """
+    Measure the entries of a cache.
+
+    Parameters
+    ----------
+    name : str
+        Key of ``CACHES``.
+
+    Returns
+    -------
+    callable
+        Decorator to apply below ``functools.lru_cache``, so that the
+        decorated function only runs on cache misses.
+    """
+    counts = _ENTRY_SIZES.setdefault(name, [0, 0, 0])
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            counts[0] += 1
+            if counts[0] <= SIZE_SAMPLE_FIRST or not counts[0] % SIZE_SAMPLE_EVERY:
+                seen = set()
+                counts[1] += 1
+                counts[2] += (
+                    _deep_size(args, seen) + _deep_size(kwargs, seen)
+                    + _deep_size(result, seen)
+                )
+            return result
+        return wrapper
+    return decorator
+
+
+def _cache_bytes(name: str, size: int) -> Optional[int]:
+    """
+    Estimate the memory held by the entries of a cache.
+
+    Parameters
+    ----------
+    name : str
+        Key of ``CACHES``.
+    size : int
+        Current number of entries.
+
+    Returns
+    -------
+    int or None
+        Mean measured entry size times ``size``, or ``None`` if entries
+        are cached but none was measured.
+    """
+    if not size:
+        return 0
+    counts = _ENTRY_SIZES.get(name)
+    if counts is None or not counts[1]:
+        return None
+    return round(counts[2] / counts[1] * size)
+
+
+###############################################################################
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Report the state of every library cache.
+
+    Returns
+    -------
+    dict
+        Mapping of cache name to ``hits``, ``misses``, ``size``,
+        ``maxsize``, ``hit_rate`` and approximate ``bytes``.
+    """
+    stats = {}
+    for name in CACHES:
+        wrapper = _resolve(name)
+        info = wrapper.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+            'hit_rate': round(info.hits / lookups, 4) if lookups else 0.0,
+            'bytes': _cache_bytes(name, info.currsize),
+        }
+    return stats
+
+
+def clear_caches() -> None:
+    """
+    Empty every library cache and reset its counters.
+    """
+    for name in CACHES:
+        _resolve(name).cache_clear()
+    for counts in _ENTRY_SIZES.values():
+        counts[:] = [0, 0, 0]
+
+
+def format_cache_stats(stats: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Render a cache statistics snapshot as a table.
+
+    Parameters
+    ----------
+    stats : dict
+        Output of ``cache_stats``.
+
+    Returns
+    -------
+    str
+        Plain-text table with one row per cache.
+    """
+    width = max(len(name) for name in stats) + 2
+    header = (
+        f"{'Cache':<{width}}{'Hits':>10}{'Misses':>10}{'Size':>8}"
+        f"{'Max':>8}{'Hit rate':>10}{'KiB':>10}"
+    )
+    rows = [header, '-' * len(header)]
+    for name, values in stats.items():
+        maxsize = '-' if values['maxsize'] is None else values['maxsize']
+        kib = '?' if values['bytes'] is None else f"{values['bytes'] / 1024:.1f}"
+        rows.append(
+            f"{name:<{width}}{values['hits']:>10}{values['misses']:>10}"
+            f"{values['size']:>8}{maxsize:>8}{values['hit_rate']:>10.1%}{kib:>10}"
+        )
+    return '\n'.join(rows)
+
+
+###############################################################################
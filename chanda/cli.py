@@ -8,25 +8,49 @@ the command line.
 """
 
 import argparse
+import os
 import sys
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from .core import Chanda, analyze_line, analyze_text
 from .formatter import format_result, format_analysis_summary
 from .utils import get_default_data_path, get_supported_meters
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Chanda
+    from .daemon import DaemonClient
+    from .profiling import Instrumentation
+    from .summary import SummaryAccumulator
+
+# NOTE: ``chanda.core`` (and with it the transliteration and edit-distance
+# dependencies) is imported inside the functions that analyze text, so that
+# ``--version``, ``--help`` and ``--list-meters`` stay fast.
+
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
 
+    Parameters
+    ----------
+    argv : list[str], optional
+        Command-line arguments (defaults to ``sys.argv[1:]``).
+
     Returns
     -------
     int
         Exit code.
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == 'daemon':
+        return daemon_main(argv[1:])
+    if argv and argv[0] == 'serve':
+        return serve_main(argv[1:])
+    if argv and argv[0] == 'compare':
+        return compare_main(argv[1:])
+
     parser = argparse.ArgumentParser(
         prog='chanda',
         description='Sanskrit Meter Identification Tool',
@@ -58,6 +82,11 @@ def main() -> int:
         action='store_true',
         help='Verse mode: group lines into 4-line verses'
     )
+    parser.add_argument(
+        '--segment',
+        action='store_true',
+        help='Verse mode: detect verse boundaries from daṇḍas and meters'
+    )
     parser.add_argument(
         '--no-fuzzy',
         action='store_true',
@@ -70,6 +99,13 @@ def main() -> int:
         metavar='K',
         help='Number of fuzzy matches to show (default: 10)'
     )
+    parser.add_argument(
+        '--expect',
+        type=str,
+        metavar='METERS',
+        help='Comma-separated names of the expected meters: match only '
+             'against them and flag lines that fit none'
+    )
 
     # Output options
     parser.add_argument(
@@ -84,6 +120,13 @@ def main() -> int:
         default='text',
         help='Output format (default: text)'
     )
+    parser.add_argument(
+        '--save-path',
+        type=str,
+        metavar='DIR',
+        help='Result store for multi-line analysis: reuse results saved '
+             'there for the same input and options, and save new ones'
+    )
     parser.add_argument(
         '-s', '--scheme',
         type=str,
@@ -95,6 +138,11 @@ def main() -> int:
         action='store_true',
         help='Show summary statistics'
     )
+    parser.add_argument(
+        '--summary-only',
+        action='store_true',
+        help='Only compute summary statistics (per-line results are not kept)'
+    )
 
     # Data options
     parser.add_argument(
@@ -104,6 +152,32 @@ def main() -> int:
         help='Path to meter definition data directory'
     )
 
+    # Daemon options
+    parser.add_argument(
+        '--connect',
+        action='store_true',
+        help='Analyze using a running `chanda daemon`; falls back to '
+             'in-process analysis if no daemon is running'
+    )
+    parser.add_argument(
+        '--socket',
+        type=str,
+        metavar='PATH',
+        help='Daemon socket path (default: $CHANDA_SOCKET or a per-user socket)'
+    )
+
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Print cache statistics to stderr after the run (of the '
+             'daemon with --connect)'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print per-stage timings to stderr (in-process analysis only)'
+    )
+
     # Info options
     parser.add_argument(
         '--list-meters',
@@ -116,7 +190,7 @@ def main() -> int:
         version='%(prog)s 1.0.0'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle list-meters option
     if args.list_meters:
@@ -129,15 +203,30 @@ def main() -> int:
         parser.print_help()
         return 1
 
+    instrumentation = None
+    if args.profile:
+        from .profiling import Instrumentation
+        instrumentation = Instrumentation()
+
     # Perform analysis
     try:
-        results = perform_analysis(text, args)
-        output_results(results, args)
-        return 0
+        if args.summary_only:
+            summary = perform_summary(text, args, instrumentation)
+            output_summary(summary, args)
+        else:
+            results = perform_analysis(text, args, instrumentation)
+            output_results(results, args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+    if instrumentation is not None:
+        from .profiling import format_stats
+        print(format_stats(instrumentation.stats()), file=sys.stderr)
+    if args.stats:
+        show_cache_stats(args)
+    return 0
+
 
 def get_input_text(args: argparse.Namespace) -> Optional[str]:
     """
@@ -163,7 +252,101 @@ def get_input_text(args: argparse.Namespace) -> Optional[str]:
     return None
 
 
-def perform_analysis(text: str, args: argparse.Namespace) -> Dict[str, Any]:
+def _connect_daemon(args: argparse.Namespace) -> Optional['DaemonClient']:
+    """
+    Connect to a running daemon if ``--connect`` was given.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed CLI arguments.
+
+    Returns
+    -------
+    DaemonClient or None
+        Connected client, or ``None`` if ``--connect`` was not given or no
+        daemon is reachable.
+    """
+    if not args.connect:
+        return None
+    from .daemon import DaemonClient
+
+    client = DaemonClient(args.socket)
+    try:
+        client.connect()
+    except OSError:
+        return None
+    return client
+
+
+def _daemon_data_path(args: argparse.Namespace) -> Optional[str]:
+    """
+    Resolve the data path to send to the daemon.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed CLI arguments.
+
+    Returns
+    -------
+    str or None
+        Absolute data path if ``--data-path`` was given; otherwise ``None``
+        (the daemon's default).
+    """
+    return os.path.abspath(args.data_path) if args.data_path else None
+
+
+def _expected_meters(args: argparse.Namespace) -> Optional[List[str]]:
+    """
+    Parse ``--expect``.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed CLI arguments.
+
+    Returns
+    -------
+    list[str] or None
+        Expected meter names, or ``None`` if not given.
+    """
+    if not args.expect:
+        return None
+    return [name.strip() for name in args.expect.split(',') if name.strip()] or None
+
+
+def _local_analyzer(
+    args: argparse.Namespace,
+    instrumentation: Optional['Instrumentation'] = None
+) -> 'Chanda':
+    """
+    Build an in-process analyzer.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed CLI arguments.
+    instrumentation : Instrumentation, optional
+        Recorder for per-stage timings.
+
+    Returns
+    -------
+    Chanda
+        Analyzer for ``--data-path`` (or the default data).
+    """
+    from .core import Chanda
+
+    analyzer = Chanda(args.data_path or get_default_data_path())
+    analyzer.instrumentation = instrumentation
+    return analyzer
+
+
+def perform_analysis(
+    text: str,
+    args: argparse.Namespace,
+    instrumentation: Optional['Instrumentation'] = None
+) -> Dict[str, Any]:
     """
     Perform meter identification analysis.
 
@@ -173,38 +356,164 @@ def perform_analysis(text: str, args: argparse.Namespace) -> Dict[str, Any]:
         Input text to analyze.
     args : argparse.Namespace
         Parsed CLI arguments.
+    instrumentation : Instrumentation, optional
+        Recorder for per-stage timings of in-process analysis.
 
     Returns
     -------
     dict
         Result payload tagged with ``type`` and ``result``.
     """
-    data_path = args.data_path or get_default_data_path()
     fuzzy = not args.no_fuzzy
+    expected = _expected_meters(args)
 
     # Check if single line or multiple lines
     lines = text.strip().split('\n')
-    if len(lines) == 1 and not args.verse:
+    single = len(lines) == 1 and not args.verse
+
+    client = _connect_daemon(args)
+    if client is not None:
+        with client:
+            if single:
+                result = client.analyze_line(
+                    text,
+                    fuzzy=fuzzy,
+                    scheme=args.scheme,
+                    data_path=_daemon_data_path(args),
+                    expected=expected
+                )
+                return {'type': 'single', 'result': result}
+            results = client.analyze_text(
+                text,
+                verse=args.verse,
+                fuzzy=fuzzy,
+                scheme=args.scheme,
+                segment=args.segment,
+                data_path=_daemon_data_path(args),
+                expected=expected
+            )
+            return {'type': 'multi', 'result': results}
+
+    from .core import apply_output_scheme
+
+    analyzer = _local_analyzer(args, instrumentation)
+    if single:
         # Single line analysis
-        result = analyze_line(
-            text,
-            fuzzy=fuzzy,
-            output_scheme=args.scheme,
-            data_path=data_path
+        result = apply_output_scheme(
+            analyzer.analyze_line(text, fuzzy=fuzzy, expected=expected),
+            args.scheme
         )
         return {'type': 'single', 'result': result}
     else:
         # Multi-line analysis
-        results = analyze_text(
+        results = analyzer.analyze_text(
             text,
-            verse_mode=args.verse,
+            verse=args.verse,
             fuzzy=fuzzy,
-            output_scheme=args.scheme,
-            data_path=data_path
+            scheme=args.scheme,
+            segment=args.segment,
+            save_path=args.save_path,
+            expected=expected
         )
         return {'type': 'multi', 'result': results}
 
 
+def perform_summary(
+    text: str,
+    args: argparse.Namespace,
+    instrumentation: Optional['Instrumentation'] = None
+) -> 'SummaryAccumulator':
+    """
+    Compute summary statistics without keeping per-line results.
+
+    Parameters
+    ----------
+    text : str
+        Input text to analyze.
+    args : argparse.Namespace
+        Parsed CLI arguments.
+    instrumentation : Instrumentation, optional
+        Recorder for per-stage timings of in-process analysis.
+
+    Returns
+    -------
+    SummaryAccumulator
+        Accumulated line and verse statistics.
+    """
+    from .summary import SummaryAccumulator
+
+    client = _connect_daemon(args)
+    if client is not None:
+        with client:
+            return SummaryAccumulator.from_summary(client.summary(
+                text,
+                verse=args.verse,
+                fuzzy=not args.no_fuzzy,
+                scheme=args.scheme,
+                segment=args.segment,
+                data_path=_daemon_data_path(args),
+                expected=_expected_meters(args)
+            ))
+
+    analyzer = _local_analyzer(args, instrumentation)
+    accumulator = SummaryAccumulator()
+    for item in analyzer.iter_analyze_text(
+        text,
+        verse=args.verse,
+        fuzzy=not args.no_fuzzy,
+        scheme=args.scheme,
+        segment=args.segment,
+        expected=_expected_meters(args)
+    ):
+        accumulator.add(item)
+    return accumulator
+
+
+def show_cache_stats(args: argparse.Namespace) -> None:
+    """
+    Print cache statistics to stderr.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed CLI arguments. With ``--connect``, the statistics of the
+        running daemon are shown.
+    """
+    from .caches import cache_stats, format_cache_stats
+
+    client = _connect_daemon(args)
+    if client is not None:
+        with client:
+            stats = client.cache_stats()
+    else:
+        stats = cache_stats()
+    print(format_cache_stats(stats), file=sys.stderr)
+
+
+def output_summary(summary: 'SummaryAccumulator', args: argparse.Namespace) -> None:
+    """
+    Output summary statistics in the specified format.
+
+    Parameters
+    ----------
+    summary : SummaryAccumulator
+        Accumulated statistics.
+    args : argparse.Namespace
+        Parsed CLI arguments.
+    """
+    if args.format == 'json':
+        output = json.dumps(summary.summary(), ensure_ascii=False, indent=2)
+    else:
+        from .core import Chanda
+        output = Chanda.format_summary(summary.summary())
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
 def output_results(results: Dict[str, Any], args: argparse.Namespace) -> None:
     """
     Output analysis results in the specified format.
@@ -284,8 +593,8 @@ def _format_chanda(result: Dict[str, Any]) -> str:
     """
     if not result.get('chanda'):
         return "Not found"
-    from .core import Chanda
-    return Chanda.format_chanda_list(result.get('chanda', []))
+    from .display import format_chanda_list
+    return format_chanda_list(result.get('chanda', []))
 
 
 def format_json_output(results: Dict[str, Any], args: argparse.Namespace) -> str:
@@ -420,6 +729,145 @@ def format_text_output(results: Dict[str, Any], args: argparse.Namespace) -> str
     return '\n'.join(output_lines)
 
 
+def daemon_main(argv: List[str]) -> int:
+    """
+    Entry point for ``chanda daemon``.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following ``daemon``.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='chanda daemon',
+        description='Keep a warm analyzer behind a Unix domain socket'
+    )
+    parser.add_argument(
+        '--socket',
+        type=str,
+        metavar='PATH',
+        help='Socket path (default: $CHANDA_SOCKET or a per-user socket)'
+    )
+    parser.add_argument(
+        '--data-path',
+        type=str,
+        metavar='PATH',
+        help='Path to meter definition data directory'
+    )
+    parser.add_argument(
+        '--language',
+        choices=['sanskrit', 'vedic', 'prakrit'],
+        default='sanskrit',
+        help='Language for prosody analysis (default: sanskrit)'
+    )
+    parser.add_argument(
+        '--stop',
+        action='store_true',
+        help='Stop a running daemon and exit'
+    )
+    args = parser.parse_args(argv)
+
+    from .daemon import DaemonClient, run_daemon
+
+    try:
+        if args.stop:
+            with DaemonClient(args.socket) as client:
+                client.shutdown()
+            return 0
+        return run_daemon(args.socket, data_path=args.data_path, language=args.language)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def serve_main(argv: List[str]) -> int:
+    """
+    Entry point for ``chanda serve``.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following ``serve``.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    from .server import DEFAULT_BATCH_WINDOW_MS, DEFAULT_MAX_BATCH
+
+    parser = argparse.ArgumentParser(
+        prog='chanda serve',
+        description='Serve meter identification as an HTTP JSON API'
+    )
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Host to bind (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8000,
+        help='Port to bind (default: 8000)'
+    )
+    parser.add_argument(
+        '--data-path',
+        type=str,
+        metavar='PATH',
+        help='Path to meter definition data directory'
+    )
+    parser.add_argument(
+        '--language',
+        choices=['sanskrit', 'vedic', 'prakrit'],
+        default='sanskrit',
+        help='Language for prosody analysis (default: sanskrit)'
+    )
+    parser.add_argument(
+        '--batch-window',
+        type=float,
+        default=DEFAULT_BATCH_WINDOW_MS,
+        metavar='MS',
+        help='Micro-batching window for /analyze_line in milliseconds '
+             f'(default: {DEFAULT_BATCH_WINDOW_MS})'
+    )
+    parser.add_argument(
+        '--max-batch',
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        metavar='N',
+        help=f'Maximum line requests per batch (default: {DEFAULT_MAX_BATCH})'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Suppress access logs'
+    )
+    args = parser.parse_args(argv)
+
+    from .server import run_server
+
+    try:
+        return run_server(
+            args.host,
+            args.port,
+            data_path=args.data_path,
+            language=args.language,
+            batch_window_ms=args.batch_window,
+            max_batch=args.max_batch,
+            quiet=args.quiet
+        )
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
 def show_meter_list(data_path: Optional[str] = None) -> None:
     """
     Display list of all supported meters.
@@ -451,5 +899,121 @@ def show_meter_list(data_path: Optional[str] = None) -> None:
     print("Use --help for more information on usage.")
 
 
+def compare_main(argv: List[str]) -> int:
+    """
+    Entry point for ``chanda compare``.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments following ``compare``.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='chanda compare',
+        description='Compare results and speed of two definition sets '
+                    '(or languages, or saved runs) on the same corpus'
+    )
+    parser.add_argument('corpus', help='Corpus file')
+    parser.add_argument(
+        '--data-path',
+        action='append',
+        default=[],
+        metavar='PATH',
+        help='Meter definition data directory (give twice: A and B; '
+             'missing ones use the packaged data)'
+    )
+    parser.add_argument(
+        '--language',
+        action='append',
+        default=[],
+        choices=['sanskrit', 'vedic', 'prakrit'],
+        help='Language for prosody analysis (give twice to compare languages)'
+    )
+    parser.add_argument('-v', '--verse', action='store_true', help='Verse mode')
+    parser.add_argument('--segment', action='store_true', help='Detect verse boundaries')
+    parser.add_argument('--no-fuzzy', action='store_true', help='Disable fuzzy matching')
+    parser.add_argument('--memory', action='store_true', help='Measure peak memory of each run')
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run both configurations at once in two processes'
+    )
+    parser.add_argument(
+        '--save-run',
+        metavar='FILE',
+        help='Only analyze with the first configuration and save the run as JSON'
+    )
+    parser.add_argument(
+        '--baseline',
+        metavar='FILE',
+        help='Use a run saved with --save-run as A (e.g. from another release)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['text', 'json'],
+        default='text',
+        help='Output format (default: text)'
+    )
+    parser.add_argument('-o', '--output', metavar='FILE', help='Output file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    if len(args.data_path) > 2 or len(args.language) > 2:
+        parser.error('--data-path and --language can be given at most twice')
+
+    from .compare import compare, compare_runs, format_comparison, run_configuration
+
+    data_paths = args.data_path + [None] * (2 - len(args.data_path))
+    languages = args.language or ['sanskrit']
+    options = dict(
+        verse=args.verse,
+        fuzzy=not args.no_fuzzy,
+        segment=args.segment,
+        memory=args.memory
+    )
+
+    try:
+        with open(args.corpus, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+        if args.save_run or args.baseline:
+            run = run_configuration(text, data_paths[0], languages[0], **options)
+            if args.save_run:
+                with open(args.save_run, 'w', encoding='utf-8') as f:
+                    json.dump(run, f, ensure_ascii=False, indent=2)
+                return 0
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                report = compare_runs(json.load(f), run)
+        else:
+            report = compare(
+                text,
+                data_paths[0],
+                data_paths[1],
+                language_a=languages[0],
+                language_b=languages[-1],
+                parallel=args.parallel,
+                **options
+            )
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.format == 'json':
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+    else:
+        output = format_comparison(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+    return 0
+
+
 if __name__ == '__main__':
     sys.exit(main())
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gaṇa and laghu-guru pattern conversion.
+
+This module provides a codec with precompiled translation tables for
+converting between gaṇa notation, laghu-guru strings and mātrā counts,
+along with batch helpers for bulk conversion. Patterns can also be packed
+into bitmasks (guru = set bit), where the mātrā count is the length plus
+the number of set bits.
+
+Notes
+-----
+NumPy is optional and imported only when an array form is requested
+(see ``GanaCodec.pack_many`` and ``GanaCodec.count_matra_packed``).
+"""
+
+###############################################################################
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+from .constants import SyllableWeight, GanaSymbol
+
+###############################################################################
+
+L = SyllableWeight.L.value
+G = SyllableWeight.G.value
+
+GANA_PATTERNS = {
+    GanaSymbol.Y.value: f'{L}{G}{G}',
+    GanaSymbol.R.value: f'{G}{L}{G}',
+    GanaSymbol.T.value: f'{G}{G}{L}',
+    GanaSymbol.N.value: f'{L}{L}{L}',
+    GanaSymbol.B.value: f'{G}{L}{L}',
+    GanaSymbol.J.value: f'{L}{G}{L}',
+    GanaSymbol.S.value: f'{L}{L}{G}',
+    GanaSymbol.M.value: f'{G}{G}{G}',
+}
+
+# Largest pattern length that fits in a packed 64-bit mask
+MAX_PACKED_LENGTH = 64
+
+###############################################################################
+
+
+class GanaCodec:
+    """
+    Converter between gaṇa notation, laghu-guru strings and mātrā counts.
+
+    Parameters
+    ----------
+    gana : dict, optional
+        Mapping of gaṇa symbols to three-syllable laghu-guru patterns.
+        Defaults to ``GANA_PATTERNS``.
+
+    Examples
+    --------
+    >>> codec = GanaCodec()
+    >>> codec.lg_to_gana('LGGGGG')
+    'YM'
+    >>> codec.count_matra_many(['YM', 'LLG'])
+    [11, 4]
+    >>> codec.lg_to_mask('LGG')
+    (6, 3)
+    """
+
+    def __init__(self, gana: Optional[Dict[str, str]] = None) -> None:
+        self.gana = dict(gana or GANA_PATTERNS)
+        self.gana_inv = {v: k for k, v in self.gana.items()}
+        self.ttable_gana = str.maketrans(self.gana)
+        self.ttable_bits = str.maketrans({L: '0', G: '1'})
+
+    # ----------------------------------------------------------------------- #
+
+    def lg_to_gana(self, lg_str: str) -> str:
+        """
+        Transform a laghu-guru string into gaṇa notation.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru pattern string.
+
+        Returns
+        -------
+        str
+            Gaṇa notation string; trailing syllables that do not form a
+            complete gaṇa are kept as laghu-guru symbols.
+        """
+        gana_inv = self.gana_inv
+        groups = [lg_str[i:i + 3] for i in range(0, len(lg_str), 3)]
+        return ''.join([gana_inv.get(group, group) for group in groups])
+
+    def gana_to_lg(self, gana_str: str) -> str:
+        """
+        Transform a gaṇa string into a laghu-guru string.
+
+        Parameters
+        ----------
+        gana_str : str
+            Gaṇa notation string.
+
+        Returns
+        -------
+        str
+            Laghu-guru pattern string.
+        """
+        return gana_str.translate(self.ttable_gana)
+
+    def count_matra(self, gana_str: str) -> int:
+        """
+        Count mātrās from a gaṇa or laghu-guru string.
+
+        Parameters
+        ----------
+        gana_str : str
+            Gaṇa or laghu-guru string.
+
+        Returns
+        -------
+        int
+            Mātrā count.
+        """
+        lg_str = gana_str.translate(self.ttable_gana)
+        return lg_str.count(L) + lg_str.count(G) * 2
+
+    # ----------------------------------------------------------------------- #
+    # Batch conversion
+
+    def lg_to_gana_many(self, lg_strs: Iterable[str]) -> List[str]:
+        """
+        Transform many laghu-guru strings into gaṇa notation.
+
+        Parameters
+        ----------
+        lg_strs : iterable of str
+            Laghu-guru pattern strings.
+
+        Returns
+        -------
+        list[str]
+            Gaṇa notation strings.
+        """
+        lg_to_gana = self.lg_to_gana
+        return [lg_to_gana(lg_str) for lg_str in lg_strs]
+
+    def gana_to_lg_many(self, gana_strs: Iterable[str]) -> List[str]:
+        """
+        Transform many gaṇa strings into laghu-guru strings.
+
+        Parameters
+        ----------
+        gana_strs : iterable of str
+            Gaṇa notation strings.
+
+        Returns
+        -------
+        list[str]
+            Laghu-guru pattern strings.
+        """
+        table = self.ttable_gana
+        return [gana_str.translate(table) for gana_str in gana_strs]
+
+    def count_matra_many(
+        self,
+        gana_strs: Iterable[str],
+        as_array: bool = False
+    ) -> Union[List[int], 'np.ndarray']:
+        """
+        Count mātrās for many gaṇa or laghu-guru strings.
+
+        Parameters
+        ----------
+        gana_strs : iterable of str
+            Gaṇa or laghu-guru strings.
+        as_array : bool, optional
+            Return a NumPy array (requires NumPy).
+
+        Returns
+        -------
+        list[int] or numpy.ndarray
+            Mātrā counts.
+        """
+        table = self.ttable_gana
+        counts = []
+        for gana_str in gana_strs:
+            lg_str = gana_str.translate(table)
+            counts.append(lg_str.count(L) + lg_str.count(G) * 2)
+        if as_array:
+            np = _require_numpy()
+            return np.asarray(counts, dtype=np.int64)
+        return counts
+
+    # ----------------------------------------------------------------------- #
+    # Bitmask form
+
+    def lg_to_mask(self, lg_str: str) -> Tuple[int, int]:
+        """
+        Pack a laghu-guru string into a bitmask.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru pattern string.
+
+        Returns
+        -------
+        tuple[int, int]
+            ``(mask, length)``, where bit ``i`` of ``mask`` is set if the
+            ``i``-th syllable is guru.
+        """
+        if not lg_str:
+            return 0, 0
+        return int(lg_str.translate(self.ttable_bits)[::-1], 2), len(lg_str)
+
+    @staticmethod
+    def mask_to_lg(mask: int, length: int) -> str:
+        """
+        Unpack a bitmask into a laghu-guru string.
+
+        Parameters
+        ----------
+        mask : int
+            Bitmask with guru syllables as set bits.
+        length : int
+            Number of syllables.
+
+        Returns
+        -------
+        str
+            Laghu-guru pattern string.
+        """
+        return ''.join(G if (mask >> i) & 1 else L for i in range(length))
+
+    @staticmethod
+    def mask_matra(mask: int, length: int) -> int:
+        """
+        Count mātrās of a packed pattern.
+
+        Parameters
+        ----------
+        mask : int
+            Bitmask with guru syllables as set bits.
+        length : int
+            Number of syllables.
+
+        Returns
+        -------
+        int
+            Mātrā count (length plus number of guru syllables).
+        """
+        return length + bin(mask).count('1')
+
+    def pack_many(
+        self,
+        lg_strs: Iterable[str]
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Pack many laghu-guru strings into NumPy arrays.
+
+        Parameters
+        ----------
+        lg_strs : iterable of str
+            Laghu-guru pattern strings of at most 64 syllables.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``uint64`` masks.
+        numpy.ndarray
+            ``int64`` lengths.
+
+        Raises
+        ------
+        ValueError
+            If a pattern is longer than ``MAX_PACKED_LENGTH``.
+        """
+        np = _require_numpy()
+        masks = []
+        lengths = []
+        for lg_str in lg_strs:
+            if len(lg_str) > MAX_PACKED_LENGTH:
+                raise ValueError(
+                    f"Pattern longer than {MAX_PACKED_LENGTH} syllables: {lg_str}"
+                )
+            mask, length = self.lg_to_mask(lg_str)
+            masks.append(mask)
+            lengths.append(length)
+        return np.asarray(masks, dtype=np.uint64), np.asarray(lengths, dtype=np.int64)
+
+    @staticmethod
+    def count_matra_packed(
+        masks: 'np.ndarray',
+        lengths: 'np.ndarray'
+    ) -> 'np.ndarray':
+        """
+        Count mātrās of packed patterns.
+
+        Parameters
+        ----------
+        masks : numpy.ndarray
+            ``uint64`` masks from ``pack_many``.
+        lengths : numpy.ndarray
+            Pattern lengths from ``pack_many``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Mātrā counts.
+        """
+        np = _require_numpy()
+        masks = np.ascontiguousarray(masks, dtype=np.uint64)
+        bits = np.unpackbits(masks.view(np.uint8)).reshape(-1, 64)
+        return np.asarray(lengths, dtype=np.int64) + bits.sum(axis=1, dtype=np.int64)
+
+
+def _require_numpy() -> Any:
+    """
+    Import NumPy on demand.
+
+    Returns
+    -------
+    module
+        The ``numpy`` module.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "NumPy is required for array output; install it with "
+            "`pip install chanda[numpy]`."
+        ) from e
+    return numpy
+
+
+###############################################################################
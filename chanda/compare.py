@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Differential comparison of two analyzer configurations.
+
+This module runs the same corpus through two configurations (meter
+definition directories and/or prosody languages) and reports per-line
+and per-verse result differences, changed meter counts from
+``Chanda.summarize_results``, and side-by-side timing, stage timings
+(see ``chanda.profiling``), cache sizes and peak memory.
+
+Notes
+-----
+A single run can be saved as JSON (``run_configuration``) and used as
+one side of a later comparison, e.g. to compare two releases of the
+library on the same corpus.
+
+Examples
+--------
+>>> report = compare(text, 'data/old', 'data/new', verse=True)
+>>> print(format_comparison(report))
+"""
+
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from . import __version__
+
+###############################################################################
+
+
+def _names(meters) -> List[str]:
+    """
+    Sorted unique meter names from ``(name, padas)`` pairs.
+    """
+    return sorted({name for name, _ in meters})
+
+
+def run_configuration(
+    text: str,
+    data_path: Optional[str] = None,
+    language: str = 'sanskrit',
+    verse: bool = False,
+    fuzzy: bool = True,
+    segment: bool = False,
+    memory: bool = False
+) -> Dict[str, Any]:
+    """
+    Analyze a corpus with one configuration and record its behavior.
+
+    Parameters
+    ----------
+    text : str
+        Corpus text.
+    data_path : str, optional
+        Meter definition data directory. Defaults to the packaged data.
+    language : str, optional
+        Language for prosody analysis.
+    verse : bool, optional
+        Group lines into verses.
+    fuzzy : bool, optional
+        Enable fuzzy matching.
+    segment : bool, optional
+        Detect verse boundaries automatically (verse mode).
+    memory : bool, optional
+        Also measure peak memory of the analysis with ``tracemalloc``
+        (in a second pass, so it does not distort the timings).
+
+    Returns
+    -------
+    dict
+        JSON-serializable run record with the configuration, ``lines``
+        and ``verses`` (meter names per item), ``summary``, ``seconds``,
+        ``load_seconds``, ``stages``, ``caches`` and
+        ``peak_memory_kib``.
+    """
+    from .caches import cache_stats, clear_caches
+    from .core import Chanda
+
+    if data_path is None:
+        from .utils import get_default_data_path
+        data_path = get_default_data_path()
+    options = dict(verse=verse, fuzzy=fuzzy, segment=segment)
+
+    clear_caches()
+    start = time.perf_counter()
+    analyzer = Chanda(data_path, language=language)
+    load_seconds = time.perf_counter() - start
+
+    instrumentation = analyzer.enable_instrumentation()
+    start = time.perf_counter()
+    results = analyzer.analyze_text(text, **options)
+    seconds = time.perf_counter() - start
+    analyzer.disable_instrumentation()
+    caches = cache_stats()
+
+    peak = None
+    if memory:
+        clear_caches()
+        tracemalloc.start()
+        analyzer.analyze_text(text, **options)
+        peak = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        tracemalloc.stop()
+
+    lines = []
+    for line_result in results.result.line:
+        result = line_result.result
+        lines.append({
+            'line': result.line,
+            'found': result.found,
+            'chanda': _names(result.chanda),
+            'fuzzy': _names(result.fuzzy[0]['chanda']) if result.fuzzy else [],
+        })
+    verses = [
+        {
+            'lines': verse_result.line_indices,
+            'chanda': sorted(verse_result.chanda[0]) if verse_result.chanda else [],
+        }
+        for verse_result in results.result.verse
+    ]
+
+    return {
+        'version': __version__,
+        'data_path': data_path,
+        'language': language,
+        'options': options,
+        'lines': lines,
+        'verses': verses,
+        'summary': analyzer.summarize_results(results),
+        'seconds': round(seconds, 4),
+        'load_seconds': round(load_seconds, 4),
+        'stages': instrumentation.stats(),
+        'caches': {
+            name: {'size': values['size'], 'bytes': values['bytes']}
+            for name, values in caches.items()
+        },
+        'peak_memory_kib': peak,
+    }
+
+
+###############################################################################
+
+
+def _meter_counts(summary: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """
+    Flatten the meter counters of a summary payload by category.
+    """
+    line = summary.get('line', {})
+    return {
+        'line_match': dict(line.get('match', {}).get('chanda', {})),
+        'line_fuzzy': dict(line.get('fuzzy', {}).get('chanda', {})),
+        'verse': dict(summary.get('verse', {}).get('chanda', {})),
+        'count': dict(summary.get('count', {})),
+    }
+
+
+def compare_runs(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compare two run records from ``run_configuration``.
+
+    Parameters
+    ----------
+    a : dict
+        Run record of the first configuration.
+    b : dict
+        Run record of the second configuration.
+
+    Returns
+    -------
+    dict
+        ``runs`` (configuration, timing and memory of each side),
+        ``line_differences``, ``verse_differences``, ``meter_counts``
+        (per category, meters whose counts changed, as ``[a, b]``) and
+        ``stages`` (per stage, total milliseconds as ``[a, b]``).
+
+    Raises
+    ------
+    ValueError
+        If the runs were made on different corpora.
+    """
+    if [x['line'] for x in a['lines']] != [x['line'] for x in b['lines']]:
+        raise ValueError('Runs were made on different corpora')
+
+    line_differences = [
+        {'index': idx, 'line': x['line'], 'a': x, 'b': y}
+        for idx, (x, y) in enumerate(zip(a['lines'], b['lines']))
+        if (x['found'], x['chanda'], x['fuzzy']) != (y['found'], y['chanda'], y['fuzzy'])
+    ]
+    verses_a = {tuple(v['lines']): v['chanda'] for v in a['verses']}
+    verses_b = {tuple(v['lines']): v['chanda'] for v in b['verses']}
+    verse_differences = [
+        {'lines': list(key), 'a': verses_a.get(key), 'b': verses_b.get(key)}
+        for key in sorted(set(verses_a) | set(verses_b))
+        if verses_a.get(key) != verses_b.get(key)
+    ]
+
+    counts_a = _meter_counts(a['summary'])
+    counts_b = _meter_counts(b['summary'])
+    meter_counts = {}
+    for category in counts_a:
+        x, y = counts_a[category], counts_b[category]
+        changed = {
+            name: [x.get(name, 0), y.get(name, 0)]
+            for name in sorted(set(x) | set(y))
+            if x.get(name, 0) != y.get(name, 0)
+        }
+        if changed:
+            meter_counts[category] = changed
+
+    stages = {
+        stage: [
+            a['stages'].get(stage, {}).get('total_ms', 0.0),
+            b['stages'].get(stage, {}).get('total_ms', 0.0),
+        ]
+        for stage in dict.fromkeys(list(a['stages']) + list(b['stages']))
+    }
+
+    keys = (
+        'version', 'data_path', 'language', 'seconds', 'load_seconds',
+        'peak_memory_kib', 'caches'
+    )
+    return {
+        'runs': [{key: run.get(key) for key in keys} for run in (a, b)],
+        'lines': len(a['lines']),
+        'line_differences': line_differences,
+        'verse_differences': verse_differences,
+        'meter_counts': meter_counts,
+        'stages': stages,
+    }
+
+
+def compare(
+    text: str,
+    data_path_a: Optional[str] = None,
+    data_path_b: Optional[str] = None,
+    language_a: str = 'sanskrit',
+    language_b: Optional[str] = None,
+    verse: bool = False,
+    fuzzy: bool = True,
+    segment: bool = False,
+    memory: bool = False,
+    parallel: bool = False
+) -> Dict[str, Any]:
+    """
+    Run two configurations over the same corpus and compare them.
+
+    Parameters
+    ----------
+    text : str
+        Corpus text.
+    data_path_a, data_path_b : str, optional
+        Meter definition data directories. Default to the packaged data.
+    language_a : str, optional
+        Language of the first configuration.
+    language_b : str, optional
+        Language of the second configuration. Defaults to ``language_a``.
+    verse : bool, optional
+        Group lines into verses.
+    fuzzy : bool, optional
+        Enable fuzzy matching.
+    segment : bool, optional
+        Detect verse boundaries automatically (verse mode).
+    memory : bool, optional
+        Measure peak memory of each run.
+    parallel : bool, optional
+        Run both configurations at once in two worker processes. Timings
+        are then subject to contention between the two.
+
+    Returns
+    -------
+    dict
+        Comparison report (see ``compare_runs``).
+    """
+    options = dict(verse=verse, fuzzy=fuzzy, segment=segment, memory=memory)
+    configurations = [
+        (data_path_a, language_a),
+        (data_path_b, language_b or language_a),
+    ]
+    if parallel:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(run_configuration, text, data_path, language, **options)
+                for data_path, language in configurations
+            ]
+            runs = [future.result() for future in futures]
+    else:
+        runs = [
+            run_configuration(text, data_path, language, **options)
+            for data_path, language in configurations
+        ]
+    return compare_runs(*runs)
+
+
+###############################################################################
+
+
+def format_comparison(report: Dict[str, Any], max_lines: int = 20) -> str:
+    """
+    Render a comparison report as plain text.
+
+    Parameters
+    ----------
+    report : dict
+        Output of ``compare`` or ``compare_runs``.
+    max_lines : int, optional
+        Maximum number of differing lines to list.
+
+    Returns
+    -------
+    str
+        Report text.
+    """
+    a, b = report['runs']
+    caches = [
+        name for name in a['caches']
+        if a['caches'][name]['size'] or (b['caches'].get(name) or {}).get('size')
+    ]
+    w = max([16] + [len(name) + 2 for name in caches])
+    out = [
+        f"A: {a['data_path']} ({a['language']}, chanda {a['version']})",
+        f"B: {b['data_path']} ({b['language']}, chanda {b['version']})",
+        '',
+        f"{'':<{w}}{'A':>14}{'B':>14}",
+        f"{'analysis (s)':<{w}}{a['seconds']:>14.3f}{b['seconds']:>14.3f}",
+        f"{'load (s)':<{w}}{a['load_seconds']:>14.3f}{b['load_seconds']:>14.3f}",
+    ]
+    if a['peak_memory_kib'] is not None and b['peak_memory_kib'] is not None:
+        out.append(
+            f"{'peak (KiB)':<{w}}{a['peak_memory_kib']:>14.1f}{b['peak_memory_kib']:>14.1f}"
+        )
+    out.append('')
+    out.append(f"{'stage (ms)':<{w}}{'A':>14}{'B':>14}")
+    for stage, (x, y) in report['stages'].items():
+        out.append(f"{stage:<{w}}{x:>14.3f}{y:>14.3f}")
+    if caches:
+        out.append('')
+        out.append(f"{'cache (KiB)':<{w}}{'A':>14}{'B':>14}")
+    for name in caches:
+        x = a['caches'][name]['bytes'] or 0
+        y = (b['caches'].get(name) or {}).get('bytes') or 0
+        out.append(f"{name:<{w}}{x / 1024:>14.1f}{y / 1024:>14.1f}")
+
+    differences = report['line_differences']
+    out.append('')
+    out.append(f"Lines with different results: {len(differences)} / {report['lines']}")
+    for item in differences[:max_lines]:
+        x, y = item['a'], item['b']
+        out.append(f"  [{item['index']}] {item['line']}")
+        out.append(f"      A: {', '.join(x['chanda'] or x['fuzzy']) or '-'}{'' if x['found'] else ' (fuzzy)'}")
+        out.append(f"      B: {', '.join(y['chanda'] or y['fuzzy']) or '-'}{'' if y['found'] else ' (fuzzy)'}")
+    if len(differences) > max_lines:
+        out.append(f"  ... {len(differences) - max_lines} more")
+
+    if report['verse_differences']:
+        out.append(f"Verses with different results: {len(report['verse_differences'])}")
+
+    if report['meter_counts']:
+        out.append('')
+        out.append('Changed meter counts (A -> B):')
+        for category, changed in report['meter_counts'].items():
+            out.append(f"  {category}:")
+            for name, (x, y) in changed.items():
+                out.append(f"    {name}: {x} -> {y}")
+    return '\n'.join(out)
+
+
+###############################################################################
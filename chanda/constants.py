@@ -16,6 +16,17 @@ from enum import Enum
 # Cache and configuration constants
 MAX_CACHE = 8192  # Size of LRU cache for memoization
 DEFAULT_VERSE_LINES = 4  # Number of lines per verse (śloka)
+RESULT_STORE_MAX_BYTES = 256 * 1024 * 1024  # Size limit of ``save_path`` stores
+RESULT_STORE_ACCESS_INTERVAL = 60.0  # seconds between index writes for hits
+MATRA_TOLERANCE = 1  # mātrās per line for approximate mātrā-vṛtta matches
+WILDCARD_EXPANSION_LIMIT = 4096  # concrete forms of a wildcard signature indexed
+
+# Verse segmentation (score weights per verse candidate)
+SEGMENT_DISAGREE_PENALTY = 1.0  # per line not supporting the verse meter
+SEGMENT_SIZE_PENALTY = 0.5  # per line of deviation from ``verse_lines``
+SEGMENT_END_BONUS = 2.0  # verse ends at a double daṇḍa (॥)
+SEGMENT_HALF_PENALTY = 0.5  # verse ends at a single daṇḍa (।)
+SEGMENT_SPLIT_PENALTY = 3.0  # per double daṇḍa inside a verse
 
 ###############################################################################
 
@@ -20,13 +20,17 @@ import os
 import re
 import csv
 import json
+import time
+import difflib
 import hashlib
 import functools
 import itertools
 from typing import Tuple, List, Dict, Optional, Any, Union
-from typing import Iterator
+from typing import AsyncIterator, Iterator, Sequence
+from concurrent.futures import Executor
 
 from collections import defaultdict, Counter
+from dataclasses import replace
 
 import Levenshtein as Lev
 
@@ -38,18 +42,38 @@ import sanskrit_text as skt
 from .constants import (
     MAX_CACHE,
     DEFAULT_VERSE_LINES,
+    MATRA_TOLERANCE,
+    WILDCARD_EXPANSION_LIMIT,
+    SEGMENT_DISAGREE_PENALTY,
+    SEGMENT_SIZE_PENALTY,
+    SEGMENT_END_BONUS,
+    SEGMENT_HALF_PENALTY,
+    SEGMENT_SPLIT_PENALTY,
     SyllableWeight,
     GanaSymbol
 )
 from .analyzer import get_chanda_analyzer
+from .caches import sized
+from .codec import GanaCodec, GANA_PATTERNS
 from .display import (
     format_chanda_pada as _format_chanda_pada,
     format_chanda_list as _format_chanda_list,
     format_line_result as _format_line_result,
     format_summary as _format_summary,
 )
-from .processor import SanskritTextProcessor
-from .types import ChandaResult, LineResult, VerseResult, AnalysisResult, TextAnalysisResult
+from .processor import SanskritTextProcessor, SINGLE_DANDA, DOUBLE_DANDA
+from .prefix import PrefixMatcher, SignatureTrie
+from .profiling import Instrumentation, StageHook, instrumented
+from .store import ResultStore
+from .summary import SummaryAccumulator
+from .types import (
+    ChandaResult,
+    LineResult,
+    VerseResult,
+    AnalysisResult,
+    TextAnalysisResult,
+    SignatureInfo
+)
 
 ###############################################################################
 
@@ -72,19 +96,14 @@ class Chanda:
         Custom gaṇa symbol ordering for output formatting.
     language : str, optional
         Language code for prosody rules (``'sanskrit'``, ``'vedic'``, ``'prakrit'``).
+    wildcard_limit : int, optional
+        Largest number of concrete forms for which a wildcard signature is
+        expanded into ``WILDCARD_KEYS``; larger signatures are matched with
+        compiled patterns.
     """
 
     # Build gaṇa pattern mappings
-    GANA_PATTERNS = {
-        GanaSymbol.Y.value: f'{SyllableWeight.L.value}{SyllableWeight.G.value}{SyllableWeight.G.value}',
-        GanaSymbol.R.value: f'{SyllableWeight.G.value}{SyllableWeight.L.value}{SyllableWeight.G.value}',
-        GanaSymbol.T.value: f'{SyllableWeight.G.value}{SyllableWeight.G.value}{SyllableWeight.L.value}',
-        GanaSymbol.N.value: f'{SyllableWeight.L.value}{SyllableWeight.L.value}{SyllableWeight.L.value}',
-        GanaSymbol.B.value: f'{SyllableWeight.G.value}{SyllableWeight.L.value}{SyllableWeight.L.value}',
-        GanaSymbol.J.value: f'{SyllableWeight.L.value}{SyllableWeight.G.value}{SyllableWeight.L.value}',
-        GanaSymbol.S.value: f'{SyllableWeight.L.value}{SyllableWeight.L.value}{SyllableWeight.G.value}',
-        GanaSymbol.M.value: f'{SyllableWeight.G.value}{SyllableWeight.G.value}{SyllableWeight.G.value}'
-    }
+    GANA_PATTERNS = GANA_PATTERNS
 
     # Convenience constants for internal use
     L = SyllableWeight.L.value
@@ -96,21 +115,26 @@ class Chanda:
         self,
         data_path: str,
         symbols: str = 'यरतनभजसमलग',
-        language: str = 'sanskrit'
+        language: str = 'sanskrit',
+        wildcard_limit: int = WILDCARD_EXPANSION_LIMIT
     ) -> None:
+        self.symbols = symbols
         self.input_map = dict(zip(symbols, self.SYMBOLS))
         self.output_map = dict(zip(self.SYMBOLS, symbols))
         self.ttable_in = str.maketrans(self.input_map)
         self.ttable_out = str.maketrans(self.output_map)
         self.gana = self.GANA.copy()
-        self.gana_inv = {
-            v: k for k, v in self.gana.items()
-        }
+        self.codec = GanaCodec(self.gana)
+        self.gana_inv = self.codec.gana_inv
 
         # Data Path
         self.data_path = data_path
 
+        # Stage instrumentation (see ``enable_instrumentation``)
+        self.instrumentation: Optional[Instrumentation] = None
+
         # Chanda analyzer (language-specific)
+        self.language = language
         self.chanda_analyzer = get_chanda_analyzer(language)
 
         # Definitions
@@ -119,15 +143,34 @@ class Chanda:
         self.MULTI_CHANDA = defaultdict(list)
         self.JAATI = defaultdict(list)
         self.SPLITS = defaultdict(list)
+        self.PADA_BOUNDARIES = {}
+        self.BOUNDARY_INDEX = defaultdict(dict)
+        self.SIGNATURES = {}
+        self.LENGTH_INDEX = defaultdict(list)
+        self.FUZZY_BUCKETS = defaultdict(list)
+        self.NAME_INDEX = defaultdict(list)
         self.MATRA_CHANDA = defaultdict(list)
         self.MATRA_PATTERNS = {}
+        self.MATRA_COLLAPSED = defaultdict(list)
+        self.MATRA_INDEX = {}
+        self.WILDCARD_KEYS = defaultdict(list)
+        self.wildcard_limit = wildcard_limit
+        self._wildcard_matchers: List[Tuple[int, str, Any]] = []
+        self._ranks: Dict[str, int] = {}
+        self.fingerprint = None
+        # Result stores of ``analyze_text(save_path=...)``, by directory
+        self._stores: Dict[str, ResultStore] = {}
+        self._prefix_trie: Optional[SignatureTrie] = None
+        self._expected_tables: Dict[Tuple[str, ...], Dict[str, Any]] = {}
 
         # Read Data
         self.read_data()
 
     ###########################################################################
 
+    @instrumented('scansion')
     @functools.lru_cache(maxsize=MAX_CACHE)
+    @sized('Chanda.mark_syllable_weights')
     def mark_syllable_weights(self, text: str) -> Tuple[Syllables, List[str]]:
         """
         Mark laghu-guru using the language-specific prosody analyzer.
@@ -220,7 +263,8 @@ class Chanda:
     def _lookup_lg(
         self,
         lg_str: str,
-        dictionary: Dict[str, List[Tuple[str, Tuple]]]
+        dictionary: Dict[str, List[Tuple[str, Tuple]]],
+        boundaries: bool = False
     ) -> Tuple[str, List[Tuple[str, Tuple]], bool]:
         """
         Lookup a laghu-guru pattern in a dictionary with last-syllable fallback.
@@ -231,6 +275,9 @@ class Chanda:
             Laghu-guru string.
         dictionary : dict
             Mapping of patterns to meter lists.
+        boundaries : bool, optional
+            Also accept laghu for guru at the internal pāda boundaries of
+            multi-pāda signatures (see ``BOUNDARY_INDEX``).
 
         Returns
         -------
@@ -243,12 +290,24 @@ class Chanda:
             alt = lg_str[:-1] + self.G
             if alt in dictionary:
                 return alt, dictionary.get(alt, []), True
+        if boundaries:
+            for positions, signatures in self.BOUNDARY_INDEX.get(
+                len(lg_str), {}
+            ).items():
+                marks = list(lg_str)
+                for position in positions:
+                    marks[position] = self.G
+                canonical = ''.join(marks)
+                if canonical in signatures and canonical in dictionary:
+                    return canonical, dictionary.get(canonical, []), True
         return lg_str, [], False
 
+    @instrumented('lookup')
     def _build_match(
         self,
         scan: Dict[str, Any],
-        multi: bool = False
+        multi: bool = False,
+        tables: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Build match details for a scanned line.
@@ -259,16 +318,23 @@ class Chanda:
             Output from ``_scan_line``.
         multi : bool, optional
             Whether to use multi-pada dictionary.
+        tables : dict, optional
+            Definition tables restricted to expected meters (see
+            ``_expected_signatures``).
 
         Returns
         -------
         dict
             Match dictionary compatible with ``find_direct_match`` output.
         """
-        dictionary = self.MULTI_CHANDA if multi else self.SINGLE_CHANDA
+        if tables is None:
+            dictionary = self.MULTI_CHANDA if multi else self.SINGLE_CHANDA
+        else:
+            dictionary = tables['MULTI_CHANDA' if multi else 'SINGLE_CHANDA']
         match_lg, chanda_list, found = self._lookup_lg(
             scan['lg_str'],
-            dictionary
+            dictionary,
+            boundaries=multi
         )
 
         chanda = []
@@ -281,45 +347,163 @@ class Chanda:
             chanda += chanda_list
 
         if not multi:
-            jaati = self.JAATI.get(len(match_lg), self.JAATI[-1])
-            gana = [self.lg_to_gana(match_lg)]
-            length = [str(len(match_lg))]
-            matra = [str(self.count_matra(match_lg))]
+            info = self._signature_info(match_lg)
+            jaati = info.jaati
+            gana = [info.gana]
+            length = [str(info.length)]
+            matra = [str(info.matra)]
         elif found:
-            splits = self.SPLITS.get(match_lg, [])
-            jaati = [
+            info = self._signature_info(match_lg)
+            jaati = list(info.split_jaati)
+            gana = list(info.split_gana)
+            length = list(info.split_length)
+            matra = list(info.split_matra)
+
+        return {
+            'found': found,
+            'syllables': scan['syllables'],
+            'lg': scan['lg_marks'],
+            'gana': gana,
+            'chanda': chanda,
+            'jaati': jaati,
+            'length': length,
+            'matra': matra
+        }
+
+    def _build_signature_info(self, lg_str: str) -> SignatureInfo:
+        """
+        Compute metadata for a laghu-guru signature.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru signature.
+
+        Returns
+        -------
+        SignatureInfo
+            Gaṇa, length, mātrā and jāti of the signature, with per split
+            group summaries if the signature has ``SPLITS``.
+        """
+        splits = self.SPLITS.get(lg_str, [])
+        gana = self.lg_to_gana(lg_str)
+        return SignatureInfo(
+            signature=lg_str,
+            gana=gana,
+            display_gana=gana.translate(self.ttable_out),
+            length=len(lg_str),
+            matra=self.count_matra(lg_str),
+            jaati=self.JAATI.get(len(lg_str), self.JAATI[-1]),
+            split_jaati=tuple(
                 "(" + ', '.join(
                     ' / '.join(self.JAATI.get(len(split), self.JAATI[-1]))
                     for split in split_group
                 ) + ")"
                 for split_group in splits
-            ]
-            gana = [
+            ),
+            split_gana=tuple(
                 f"({', '.join(self.lg_to_gana(s) for s in split_group)})"
                 for split_group in splits
-            ]
-            length = [
+            ),
+            split_length=tuple(
                 f"({' + '.join(str(len(s)) for s in split_group)})"
                 for split_group in splits
-            ]
-            matra = [
+            ),
+            split_matra=tuple(
                 f"({' + '.join(str(self.count_matra(s)) for s in split_group)})"
                 for split_group in splits
-            ]
+            ),
+        )
 
-        return {
-            'found': found,
-            'syllables': scan['syllables'],
-            'lg': scan['lg_marks'],
-            'gana': gana,
-            'chanda': chanda,
-            'jaati': jaati,
-            'length': length,
-            'matra': matra
-        }
+    def _signature_info(self, lg_str: str) -> SignatureInfo:
+        """
+        Get metadata for a laghu-guru string.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru string.
+
+        Returns
+        -------
+        SignatureInfo
+            Record precomputed at load time for known signatures; computed
+            on the fly otherwise.
+        """
+        info = self.SIGNATURES.get(lg_str)
+        if info is None:
+            info = self._build_signature_info(lg_str)
+        return info
 
     # ----------------------------------------------------------------------- #
 
+    def _expected_signatures(self, expected: Sequence[str]) -> Dict[str, Any]:
+        """
+        Restrict the definition tables to expected meters.
+
+        Parameters
+        ----------
+        expected : sequence of str
+            Meter names (as in the definition files).
+
+        Returns
+        -------
+        dict
+            ``CHANDA``, ``SINGLE_CHANDA``, ``MULTI_CHANDA`` and
+            ``FUZZY_BUCKETS`` holding only the signatures of the expected
+            meters (looked up in ``NAME_INDEX``) and, for each signature,
+            only those meters; ``names`` is the set of expected names.
+            Tables are cached per set of names.
+
+        Raises
+        ------
+        ValueError
+            If a name is not a defined meter.
+        """
+        key = tuple(sorted(set(expected)))
+        tables = self._expected_tables.get(key)
+        if tables is not None:
+            return tables
+
+        unknown = [
+            name for name in key
+            if name not in self.NAME_INDEX and name not in self.MATRA_PATTERNS
+        ]
+        if unknown:
+            raise ValueError(f"Unknown meter(s): {', '.join(unknown)}")
+
+        names = frozenset(key)
+        signatures = {
+            signature
+            for name in key
+            for signature in self.NAME_INDEX.get(name, ())
+        }
+
+        def restrict(dictionary):
+            # A signature shared with unexpected meters can leave an empty
+            # list (e.g. a single-pada signature of one meter that is the
+            # half-line of another); drop it so it does not count as a match
+            restricted = {}
+            for signature, meters in dictionary.items():
+                if signature in signatures:
+                    meters = [meter for meter in meters if meter[0] in names]
+                    if meters:
+                        restricted[signature] = meters
+            return restricted
+
+        tables = {
+            'names': names,
+            'CHANDA': restrict(self.CHANDA),
+            'SINGLE_CHANDA': restrict(self.SINGLE_CHANDA),
+            'MULTI_CHANDA': restrict(self.MULTI_CHANDA),
+            'FUZZY_BUCKETS': {
+                length: [entry for entry in bucket if entry[1] in signatures]
+                for length, bucket in self.FUZZY_BUCKETS.items()
+            },
+        }
+        self._expected_tables[key] = tables
+        return tables
+
     def _matra_options_from_result(
         self,
         result: Union[Dict[str, Any], ChandaResult]
@@ -362,23 +546,24 @@ class Chanda:
 
         return list(dict.fromkeys(options))
 
-    def _iter_matra_tuples(self, matra_options: List[List[int]]) -> Iterator[Tuple[int, ...]]:
+    # ----------------------------------------------------------------------- #
+
+    def _pattern_length(self, pattern: str) -> int:
         """
-        Yield all mātrā combinations from per-line options.
+        Count syllables in a laghu-guru signature.
 
         Parameters
         ----------
-        matra_options : list[list[int]]
-            Per-line mātrā count options.
+        pattern : str
+            Laghu-guru signature, possibly containing ``[LG]`` wildcards.
 
         Returns
         -------
-        iterator
-            Iterator of mātrā tuples across all combinations.
+        int
+            Number of syllables matched by the signature.
         """
-        if not matra_options:
-            return iter(())
-        return (tuple(combo) for combo in itertools.product(*matra_options))
+        wildcard = f"[{self.L}{self.G}]"
+        return len(pattern) - pattern.count(wildcard) * (len(wildcard) - 1)
 
     # ----------------------------------------------------------------------- #
 
@@ -396,13 +581,7 @@ class Chanda:
         str
             Gaṇa notation string.
         """
-        gana = []
-        for i in range(0, len(lg_str), 3):
-            group = lg_str[i:i+3]
-            gana.append(self.gana_inv.get(group, group))
-        gana_str = ''.join(gana)
-
-        return gana_str
+        return self.codec.lg_to_gana(lg_str)
 
     def gana_to_lg(self, gana_str: str) -> str:
         """
@@ -418,7 +597,7 @@ class Chanda:
         str
             Laghu-guru pattern string.
         """
-        return gana_str.translate(str.maketrans(self.gana))
+        return self.codec.gana_to_lg(gana_str)
 
     # ----------------------------------------------------------------------- #
 
@@ -436,8 +615,7 @@ class Chanda:
         int
             Mātrā count.
         """
-        lg_str = self.gana_to_lg(gana_str)
-        return lg_str.count(self.L) + lg_str.count(self.G) * 2
+        return self.codec.count_matra(gana_str)
 
     ###########################################################################
 
@@ -565,7 +743,8 @@ class Chanda:
                         (_name, tuple(multi_pada)) for _name in _chanda_names
                     )
                     multi_chanda[''.join(multi_lakshana)].extend(names)
-                    splits[''.join(multi_lakshana)].append(multi_lakshana)
+                    # copy, since `multi_lakshana` keeps growing up to 4 padas
+                    splits[''.join(multi_lakshana)].append(list(multi_lakshana))
 
 
                     if len(multi_pada) == 4:
@@ -579,6 +758,15 @@ class Chanda:
                         multi_pada = []
                         multi_lakshana = []
 
+        # (rank = position in ``CHANDA``, to order ties in fuzzy search)
+        rank = len(self.CHANDA)
+        for k in dict.fromkeys(itertools.chain(chanda, multi_chanda)):
+            if k not in self.CHANDA:
+                self.LENGTH_INDEX[self._pattern_length(k)].append(k)
+                self.FUZZY_BUCKETS[len(k)].append((rank, k))
+                self._ranks[k] = rank
+                self._index_wildcard_signature(k)
+                rank += 1
         for k, v in chanda.items():
             self.SINGLE_CHANDA[k].extend(v)
             self.CHANDA[k].extend(v)
@@ -587,8 +775,113 @@ class Chanda:
             self.CHANDA[k].extend(v)
 
         self.SPLITS.update(splits)
+        self._index_pada_boundaries()
+        for k in itertools.chain(chanda, multi_chanda):
+            self.SIGNATURES[k] = self._build_signature_info(k)
+        for k, v in itertools.chain(chanda.items(), multi_chanda.items()):
+            for name in dict(v):
+                if k not in self.NAME_INDEX[name]:
+                    self.NAME_INDEX[name].append(k)
+        self._prefix_trie = None
+        self._expected_tables = {}
         return chanda
 
+    def _index_pada_boundaries(self) -> None:
+        """
+        Index the pāda boundaries of the multi-pāda signatures.
+
+        Notes
+        -----
+        ``PADA_BOUNDARIES`` maps every multi-pāda signature to the
+        positions of its pāda-final syllables, one tuple per split group
+        of ``SPLITS``. As at the end of a line, a laghu in the text counts
+        as guru there. ``BOUNDARY_INDEX`` groups the signatures by length
+        and by the tuple of those positions at which they have guru, so
+        that setting these positions of a line to guru gives its candidate
+        signature directly, with one lookup per group. Signatures with
+        wildcards are matched by ``_match_wildcards`` and not indexed.
+        """
+        self.PADA_BOUNDARIES = {}
+        self.BOUNDARY_INDEX = defaultdict(dict)
+        for signature in self.MULTI_CHANDA:
+            if '[' in signature:
+                continue
+            boundaries = []
+            for split_group in self.SPLITS.get(signature, []):
+                ends = tuple(itertools.accumulate(len(s) for s in split_group))
+                boundaries.append(tuple(end - 1 for end in ends))
+            self.PADA_BOUNDARIES[signature] = tuple(boundaries)
+            for positions in dict.fromkeys(boundaries):
+                positions = tuple(p for p in positions if signature[p] == self.G)
+                if positions and positions != (len(signature) - 1,):
+                    self.BOUNDARY_INDEX[len(signature)].setdefault(
+                        positions, set()
+                    ).add(signature)
+
+    def _index_wildcard_signature(self, signature: str) -> None:
+        """
+        Make a wildcard signature available to ``_match_wildcards``.
+
+        Parameters
+        ----------
+        signature : str
+            Laghu-guru signature. Signatures without ``[LG]`` wildcards are
+            ignored.
+
+        Notes
+        -----
+        A signature with at most ``wildcard_limit`` concrete forms is
+        expanded: every form becomes a key of ``WILDCARD_KEYS``, listing
+        the wildcard signatures it matches, so that matching is a single
+        lookup. Larger signatures (e.g. the full Anuṣṭubh verse, with
+        ``2 ** 22`` forms) are compiled once instead.
+        """
+        wildcard = f"[{self.L}{self.G}]"
+        parts = signature.split(wildcard)
+        if len(parts) == 1:
+            return
+        if 2 ** (len(parts) - 1) > self.wildcard_limit:
+            self._wildcard_matchers.append((
+                self._pattern_length(signature),
+                signature,
+                re.compile(signature)
+            ))
+            return
+        for weights in itertools.product(
+            (self.L, self.G), repeat=len(parts) - 1
+        ):
+            form = parts[0] + ''.join(
+                weight + part for weight, part in zip(weights, parts[1:])
+            )
+            self.WILDCARD_KEYS[form].append(signature)
+
+    def wildcard_stats(self) -> Dict[str, int]:
+        """
+        Report the size of the wildcard signature index.
+
+        Returns
+        -------
+        dict
+            ``limit`` (``wildcard_limit``), ``expanded`` (signatures
+            expanded), ``keys`` (concrete forms in ``WILDCARD_KEYS``),
+            ``compiled`` (signatures matched with compiled patterns) and
+            approximate ``bytes`` of ``WILDCARD_KEYS``.
+        """
+        from .caches import _deep_size
+
+        expanded = {
+            signature
+            for signatures in self.WILDCARD_KEYS.values()
+            for signature in signatures
+        }
+        return {
+            'limit': self.wildcard_limit,
+            'expanded': len(expanded),
+            'keys': len(self.WILDCARD_KEYS),
+            'compiled': len(self._wildcard_matchers),
+            'bytes': _deep_size(dict(self.WILDCARD_KEYS), set()),
+        }
+
     # ----------------------------------------------------------------------- #
 
     def read_matra_definitions(self, matra_file: str) -> Dict[Tuple[int, ...], Tuple[str, ...]]:
@@ -634,9 +927,47 @@ class Chanda:
                     meters = tuple((name, ()) for name in names)
                     self.MATRA_CHANDA[matra_pattern].extend(meters)
                     matra_chanda[matra_pattern] = names
+                    self._index_matra_pattern(matra_pattern, meters)
 
         return matra_chanda
 
+    def _index_matra_pattern(
+        self,
+        matra_pattern: Tuple[int, ...],
+        meters: Tuple[Tuple[str, Tuple], ...]
+    ) -> None:
+        """
+        Add a mātrā pattern to the verse-level lookup index.
+
+        Parameters
+        ----------
+        matra_pattern : tuple[int, ...]
+            Mātrā counts per pada.
+        meters : tuple
+            Meter tuples ``(name, pada)`` defined by the pattern.
+
+        Notes
+        -----
+        ``MATRA_INDEX`` is a trie over mātrā counts containing every
+        pattern and, for 4-pada patterns, the collapsed 2-line pattern
+        ``(p1 + p2, p3 + p4)``, which is also recorded in
+        ``MATRA_COLLAPSED``. Leaf nodes are marked with a ``None`` key.
+        """
+        patterns = [matra_pattern]
+        if len(matra_pattern) == 4:
+            collapsed = (
+                matra_pattern[0] + matra_pattern[1],
+                matra_pattern[2] + matra_pattern[3]
+            )
+            self.MATRA_COLLAPSED[collapsed].extend(meters)
+            patterns.append(collapsed)
+
+        for pattern in patterns:
+            node = self.MATRA_INDEX
+            for matra_count in pattern:
+                node = node.setdefault(matra_count, {})
+            node[None] = True
+
     # ----------------------------------------------------------------------- #
 
     def read_data(self) -> None:
@@ -646,18 +977,33 @@ class Chanda:
         Returns
         -------
         None
+
+        Notes
+        -----
+        Also sets ``fingerprint``, a SHA-256 digest of the definition
+        files that were read, so that saved results can be matched to the
+        definitions that produced them.
         """
-        self.read_jaati(os.path.join(self.data_path, 'chanda_jaati.csv'))
+        digest = hashlib.sha256()
+
+        def fingerprint(path: str) -> str:
+            digest.update(os.path.basename(path).encode('utf-8') + b'\0')
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+            return path
+
+        self.read_jaati(fingerprint(os.path.join(self.data_path, 'chanda_jaati.csv')))
         definition_files = [
             'chanda_sama.csv', 'chanda_ardhasama.csv', 'chanda_vishama.csv'
         ]
         for chanda_file in definition_files:
             self.read_chanda_definitions(
-                os.path.join(self.data_path, chanda_file)
+                fingerprint(os.path.join(self.data_path, chanda_file))
             )
         matra_file = os.path.join(self.data_path, 'chanda_matra.csv')
         if os.path.exists(matra_file):
-            self.read_matra_definitions(matra_file)
+            self.read_matra_definitions(fingerprint(matra_file))
+        self.fingerprint = digest.hexdigest()
 
     # ----------------------------------------------------------------------- #
 
@@ -677,6 +1023,7 @@ class Chanda:
 
     ###########################################################################
 
+    @instrumented('process_text')
     def process_text(self, text: str) -> Tuple[List[str], str]:
         """
         Process input text and detect transliteration scheme.
@@ -698,6 +1045,7 @@ class Chanda:
     ###########################################################################
 
     @functools.lru_cache(maxsize=MAX_CACHE)
+    @sized('Chanda._editops')
     def _editops(
         self,
         lg_str: str,
@@ -749,6 +1097,7 @@ class Chanda:
         cost = sum(op_cost[op[0]] for op in ops)
         return cost, ops
 
+    @instrumented('transform')
     def transform(
         self,
         syllables: Syllables,
@@ -894,6 +1243,312 @@ class Chanda:
 
     ###########################################################################
 
+    def _slice_scan(
+        self,
+        scan: Dict[str, Any],
+        start: int,
+        end: int
+    ) -> Dict[str, Any]:
+        """
+        Extract the part of a scanned line between two laghu-guru positions.
+
+        Parameters
+        ----------
+        scan : dict
+            Output from ``_scan_line``.
+        start : int
+            Start position in ``lg_str``.
+        end : int
+            End position (exclusive) in ``lg_str``.
+
+        Returns
+        -------
+        dict
+            Scan payload for the slice with an additional ``text`` key.
+            Unmarked syllables belong to the preceding marked syllable
+            (leading ones to the first slice).
+        """
+        marked = [
+            idx for idx, mark in enumerate(scan['lg_marks']) if mark
+        ]
+        syllable_start = marked[start] if start > 0 else 0
+        syllable_end = (
+            marked[end] if end < len(marked) else len(scan['lg_marks'])
+        )
+
+        nested = []
+        idx = 0
+        for line in scan['syllables_nested']:
+            output_line = []
+            for word in line:
+                output_word = []
+                for syllable in word:
+                    if syllable_start <= idx < syllable_end:
+                        output_word.append(syllable)
+                    idx += 1
+                if output_word:
+                    output_line.append(output_word)
+            if output_line:
+                nested.append(output_line)
+
+        lg_marks = scan['lg_marks'][syllable_start:syllable_end]
+        return {
+            'syllables': scan['syllables'][syllable_start:syllable_end],
+            'syllables_nested': nested,
+            'lg_marks': lg_marks,
+            'lg_str': ''.join(lg_marks),
+            'text': ' '.join(
+                ''.join(word) for line in nested for word in line
+            )
+        }
+
+    @functools.lru_cache(maxsize=MAX_CACHE)
+    @sized('Chanda._pada_distance')
+    def _pada_distance(
+        self,
+        piece: str,
+        pattern: str,
+        max_diff: int
+    ) -> Optional[int]:
+        """
+        Compute the edit distance between a pāda candidate and a signature.
+
+        Parameters
+        ----------
+        piece : str
+            Laghu-guru string of the candidate pāda.
+        pattern : str
+            Laghu-guru signature of the pāda, possibly with ``[LG]``
+            wildcards.
+        max_diff : int
+            Maximum allowed edit distance.
+
+        Returns
+        -------
+        int or None
+            Edit distance, or ``None`` if it exceeds ``max_diff``.
+            A pāda-final laghu may count as guru.
+        """
+        candidates = [piece]
+        if piece.endswith(self.L):
+            candidates.append(piece[:-1] + self.G)
+
+        wildcard = f"[{self.L}{self.G}]"
+        if wildcard in pattern:
+            tokens = re.findall(re.escape(wildcard) + f"|{self.L}|{self.G}", pattern)
+            distances = []
+            for candidate in candidates:
+                previous = list(range(len(tokens) + 1))
+                for i, weight in enumerate(candidate, start=1):
+                    current = [i]
+                    for j, token in enumerate(tokens, start=1):
+                        substitute = previous[j - 1] + (
+                            0 if token in (weight, wildcard) else 1
+                        )
+                        current.append(min(
+                            previous[j] + 1, current[j - 1] + 1, substitute
+                        ))
+                    previous = current
+                distances.append(previous[-1])
+            distance = min(distances)
+        else:
+            distance = min(Lev.distance(c, pattern) for c in candidates)
+
+        return distance if distance <= max_diff else None
+
+    def _align_padas(
+        self,
+        lg_str: str,
+        padas: List[str],
+        max_diff: int
+    ) -> Optional[Tuple[int, List[int]]]:
+        """
+        Align a laghu-guru string to a sequence of pāda signatures.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru string of the full line.
+        padas : list[str]
+            Pāda signatures in order (an entry of ``SPLITS``).
+        max_diff : int
+            Maximum edit distance allowed for each pāda.
+
+        Returns
+        -------
+        tuple or None
+            ``(cost, boundaries)`` with the total edit distance and the
+            pāda boundaries in ``lg_str`` (including ``0`` and the end),
+            or ``None`` if no alignment fits the tolerance.
+        """
+        n = len(lg_str)
+        # states: end position -> (cost, boundaries)
+        states = {0: (0, [0])}
+        for idx, pada in enumerate(padas):
+            pada_length = self._pattern_length(pada)
+            if idx == len(padas) - 1:
+                ends = lambda start: [n]  # noqa: E731
+            else:
+                ends = lambda start: range(  # noqa: E731
+                    max(start + 1, start + pada_length - max_diff),
+                    min(n, start + pada_length + max_diff) + 1
+                )
+            next_states = {}
+            for start, (cost, boundaries) in states.items():
+                for end in ends(start):
+                    if abs(end - start - pada_length) > max_diff:
+                        continue
+                    distance = self._pada_distance(
+                        lg_str[start:end], pada, max_diff
+                    )
+                    if distance is None:
+                        continue
+                    total = cost + distance
+                    if end not in next_states or total < next_states[end][0]:
+                        next_states[end] = (total, boundaries + [end])
+            states = next_states
+            if not states:
+                return None
+        return states.get(n)
+
+    def find_pada_boundaries(
+        self,
+        lg_str: str,
+        max_diff: int = 1
+    ) -> Optional[List[int]]:
+        """
+        Find the best split of a laghu-guru string into pādas.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru string of a line holding several pādas.
+        max_diff : int, optional
+            Maximum edit distance allowed for each pāda.
+
+        Returns
+        -------
+        list[int] or None
+            Pāda boundaries in ``lg_str`` (including ``0`` and the end),
+            or ``None`` if no multi-pāda signature fits.
+
+        Notes
+        -----
+        An exact multi-pāda match is split according to ``SPLITS``; a
+        match at relaxed pāda boundaries uses the split group those
+        boundaries belong to.
+        Otherwise, only the multi-pāda signatures whose length is within
+        tolerance are considered (via ``LENGTH_INDEX``), and each of their
+        pāda sequences is aligned by dynamic programming over pāda end
+        positions. The alignment with the lowest total distance wins.
+        """
+        match_lg, _, found = self._lookup_lg(
+            lg_str, self.MULTI_CHANDA, boundaries=True
+        )
+        if found and self.SPLITS.get(match_lg):
+            # Split with the group whose pāda ends account for every laghu
+            # read as guru (the first group for an exact match)
+            relaxed = {
+                position
+                for position, (mark, expected) in enumerate(zip(lg_str, match_lg))
+                if mark != expected
+            }
+            group = next((
+                index
+                for index, ends in enumerate(self.PADA_BOUNDARIES.get(match_lg, ()))
+                if relaxed.issubset(ends)
+            ), 0)
+            boundaries = [0]
+            for pada in self.SPLITS[match_lg][group]:
+                boundaries.append(boundaries[-1] + len(pada))
+            return boundaries
+
+        n = len(lg_str)
+        slack = max_diff * 4
+        best = None
+        for length in range(max(1, n - slack), n + slack + 1):
+            for signature in self.LENGTH_INDEX.get(length, []):
+                for padas in self.SPLITS.get(signature, []):
+                    if abs(n - length) > max_diff * len(padas):
+                        continue
+                    alignment = self._align_padas(lg_str, padas, max_diff)
+                    if alignment is not None and (
+                        best is None or alignment[0] < best[0]
+                    ):
+                        best = alignment
+                    if best is not None and best[0] == 0:
+                        return best[1]
+        return best[1] if best else None
+
+    def segment_padas(
+        self,
+        line: str,
+        max_diff: int = 1,
+        fuzzy: bool = False,
+        k: int = 10
+    ) -> List[ChandaResult]:
+        """
+        Split a line without pāda breaks into pādas and identify each.
+
+        Parameters
+        ----------
+        line : str
+            Input text line holding a half-verse or a full verse.
+        max_diff : int, optional
+            Maximum edit distance allowed for each pāda.
+        fuzzy : bool, optional
+            Enable fuzzy matching for pādas without an exact match.
+        k : int, optional
+            Maximum number of fuzzy matches to return per pāda.
+
+        Returns
+        -------
+        list[ChandaResult]
+            Per-pāda results, or an empty list if the line could not be
+            split into pādas of a known meter.
+
+        Raises
+        ------
+        ValueError
+            If the input contains more than one line.
+
+        Examples
+        --------
+        >>> padas = chanda.segment_padas(
+        ...     "को न्वस्मिन् साम्प्रतं लोके गुणवान् कश्च वीर्यवान्"
+        ... )
+        >>> [result.line for result in padas]
+        ['को न्वस्मिन् साम्प्रतं लोके', 'गुणवान् कश्च वीर्यवान्']
+        """
+        lines, scheme = self.process_text(line)
+        if len(lines) > 1:
+            raise ValueError('Input contains more than one line.')
+        if not lines:
+            return []
+
+        scan = self._scan_line(lines[0], clean=False)
+        if scan is None:
+            return []
+
+        boundaries = self.find_pada_boundaries(scan['lg_str'], max_diff=max_diff)
+        if not boundaries:
+            return []
+
+        results = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            pada_scan = self._slice_scan(scan, start, end)
+            output_line = (
+                transliterate(pada_scan['text'], sanscript.DEVANAGARI, scheme)
+                if scheme and scheme != sanscript.DEVANAGARI
+                else pada_scan['text']
+            )
+            results.append(
+                self._analyze_scan(pada_scan, output_line, scheme, fuzzy=fuzzy, k=k)
+            )
+        return results
+
+    ###########################################################################
+
     def find_matra_match(self, matra_counts: Tuple[int, ...]) -> Dict[str, Any]:
         """
         Find mātrā-vṛtta based on mātrā counts per pada.
@@ -915,11 +1570,7 @@ class Chanda:
             chanda = self.MATRA_CHANDA.get(matra_counts, [])
         elif len(matra_counts) == 2:
             # Allow 2-line verses by collapsing 4-pada patterns (p1+p2, p3+p4)
-            collapsed = []
-            for pattern, meters in self.MATRA_CHANDA.items():
-                if len(pattern) == 4:
-                    if (pattern[0] + pattern[1], pattern[2] + pattern[3]) == matra_counts:
-                        collapsed.extend(meters)
+            collapsed = self.MATRA_COLLAPSED.get(matra_counts, [])
             if collapsed:
                 found = True
                 chanda = collapsed
@@ -935,137 +1586,873 @@ class Chanda:
         }
         return match
 
-    ###########################################################################
-
-    def analyze_text(
+    def find_matra_verse_match(
         self,
-        text: str,
-        verse: bool = False,
-        fuzzy: bool = False,
-        save_path: Optional[str] = None,
-        scheme: Optional[str] = None,
-        verse_lines: int = DEFAULT_VERSE_LINES
-    ) -> TextAnalysisResult:
+        matra_options: List[List[int]]
+    ) -> Dict[str, Any]:
         """
-        Identify meters from text.
+        Find mātrā-vṛtta for a verse given per-line mātrā options.
 
         Parameters
         ----------
-        text : str
-            Input Sanskrit text.
-        verse : bool, optional
-            If ``True``, treat input as collection of verses.
-        fuzzy : bool, optional
-            Enable fuzzy matching.
-        save_path : str, optional
-            Path to save results (JSON and text files).
-        scheme : str, optional
-            Output transliteration scheme.
-        verse_lines : int, optional
-            Number of lines per verse (default: 4 for ślokas).
+        matra_options : list[list[int]]
+            Possible mātrā counts for each line of the verse
+            (see ``_matra_options_from_result``).
 
         Returns
         -------
-        TextAnalysisResult
-            Result object containing line and verse analyses.
+        dict
+            Match payload as returned by ``find_matra_match`` for the
+            selected mātrā tuple. If no combination matches, ``found`` is
+            ``False`` and ``matra_pattern`` holds the base counts.
 
         Notes
         -----
-        Supports configurable verse line grouping; mātrā-vṛtta matching
-        also allows two-line collapse of four-pāda patterns.
+        Walks ``MATRA_INDEX`` with the allowed options of each line, so the
+        cost is linear in the number of lines instead of enumerating every
+        combination. When several combinations match, the one that comes
+        first in option order (base counts preferred) is selected.
         """
-        line_results: List[LineResult] = []
-        verse_results: List[VerseResult] = []
+        # frontier entries: (trie node, option ranks, mātrā counts)
+        frontier = [(self.MATRA_INDEX, (), ())]
+        for options in matra_options:
+            next_frontier = []
+            for node, rank, counts in frontier:
+                for option_idx, matra_count in enumerate(options):
+                    child = node.get(matra_count)
+                    if child is not None:
+                        next_frontier.append((
+                            child,
+                            rank + (option_idx,),
+                            counts + (matra_count,)
+                        ))
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        leaves = [(rank, counts) for node, rank, counts in frontier if None in node]
+        if leaves:
+            _, counts = min(leaves)
+            return self.find_matra_match(counts)
+
+        base_counts = tuple(options[0] for options in matra_options if options)
+        return self.find_matra_match(base_counts)
+
+    def find_matra_nearest(
+        self,
+        matra_options: List[List[int]],
+        tolerance: int = MATRA_TOLERANCE,
+        k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find mātrā-vṛtta patterns close to per-line mātrā options.
 
-        lines, detected_scheme = self.process_text(text)
-        output_scheme = scheme or detected_scheme
+        Parameters
+        ----------
+        matra_options : list[list[int]]
+            Possible mātrā counts for each line of the verse
+            (see ``_matra_options_from_result``).
+        tolerance : int, optional
+            Maximum difference in mātrās per line.
+        k : int, optional
+            Maximum number of patterns to return.
 
-        for line in lines:
-            if not line:
-                continue
-            result = self.analyze_line(
+        Returns
+        -------
+        list[dict]
+            Match payloads as returned by ``find_matra_match``, with
+            ``deviation`` (total difference from the nearest option of
+            every line) and ``similarity`` (``1 - deviation / mātrās of
+            the pattern``), nearest first. Ties keep option order (base
+            counts preferred).
+
+        Notes
+        -----
+        Walks ``MATRA_INDEX`` following only the counts within
+        ``tolerance`` of an option of each line, so the cost depends on
+        the patterns near the verse rather than on the number of patterns.
+        """
+        # frontier entries: (trie node, deviation, option ranks, mātrā counts)
+        frontier = [(self.MATRA_INDEX, 0, (), ())]
+        for options in matra_options:
+            if not options:
+                continue
+            next_frontier = []
+            low = max(min(options) - tolerance, 0)
+            high = max(options) + tolerance
+            for node, deviation, rank, counts in frontier:
+                for matra_count in range(low, high + 1):
+                    child = node.get(matra_count)
+                    if child is None:
+                        continue
+                    diff, option_idx = min(
+                        (abs(matra_count - option), option_idx)
+                        for option_idx, option in enumerate(options)
+                    )
+                    if diff <= tolerance:
+                        next_frontier.append((
+                            child,
+                            deviation + diff,
+                            rank + (option_idx,),
+                            counts + (matra_count,)
+                        ))
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        leaves = sorted(
+            (deviation, rank, counts)
+            for node, deviation, rank, counts in frontier if None in node
+        )
+        matches = []
+        for deviation, _, counts in leaves[:k]:
+            match = self.find_matra_match(counts)
+            match['deviation'] = deviation
+            match['similarity'] = 1 - deviation / sum(counts)
+            matches.append(match)
+        return matches
+
+    ###########################################################################
+
+    def _analyze_text_line(
+        self,
+        line: str,
+        fuzzy: bool,
+        output_scheme: Optional[str],
+        deadline: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> ChandaResult:
+        """
+        Analyze a processed line and render it in the output scheme.
+
+        Parameters
+        ----------
+        line : str
+            Cleaned Devanagari line from ``process_text``.
+        fuzzy : bool
+            Enable fuzzy matching.
+        output_scheme : str or None
+            Output transliteration scheme.
+        deadline : float, optional
+            ``time.perf_counter()`` value after which fuzzy search stops.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by the fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``analyze_line``).
+
+        Returns
+        -------
+        ChandaResult
+            Line result in the output scheme.
+        """
+        deadline_ms = (
+            max(deadline - time.perf_counter(), 0.0) * 1000
+            if deadline is not None else None
+        )
+        result = self.analyze_line(
+            line,
+            fuzzy=fuzzy,
+            deadline_ms=deadline_ms,
+            max_candidates=max_candidates,
+            expected=expected
+        )
+        return self._format_line(result, output_scheme)
+
+    @instrumented('format')
+    def _format_line(
+        self,
+        result: ChandaResult,
+        output_scheme: Optional[str]
+    ) -> ChandaResult:
+        """
+        Render the line of a result in the output scheme.
+
+        Parameters
+        ----------
+        result : ChandaResult
+            Line result (modified in place).
+        output_scheme : str or None
+            Output transliteration scheme.
+
+        Returns
+        -------
+        ChandaResult
+            The same result object.
+        """
+        if output_scheme:
+            if result.scheme and result.scheme != output_scheme:
+                result.line = transliterate(result.line, result.scheme, output_scheme)
+            result.scheme = output_scheme
+        return result
+
+    @instrumented('verse')
+    def _aggregate_verse(
+        self,
+        line_results: List[LineResult],
+        expected: Optional[Sequence[str]] = None,
+        fuzzy: bool = False
+    ) -> VerseResult:
+        """
+        Aggregate line results into a verse result.
+
+        Parameters
+        ----------
+        line_results : list[LineResult]
+            Line results belonging to the verse, in order.
+        expected : sequence of str, optional
+            Names of the expected meters; other mātrā-vṛtta matches of the
+            verse are ignored.
+        fuzzy : bool, optional
+            Without an exact mātrā-vṛtta match, let patterns within
+            ``MATRA_TOLERANCE`` mātrās per line contribute, weighted by
+            their similarity as fuzzy matches of the lines are.
+
+        Returns
+        -------
+        VerseResult
+            Verse-level scores and best matches. Fuzzy matches of the
+            lines are re-ordered in place to prioritize the best meters.
+        """
+        verse_result = VerseResult()
+        ongoing_score = Counter()
+        verse_matra_options = []
+
+        for line_result in line_results:
+            result = line_result.result
+            if result.matra:
+                matra_options = self._matra_options_from_result(result)
+                if matra_options:
+                    verse_matra_options.append(matra_options)
+            if result.found:
+                _chanda = result.chanda
+                _unique_chanda = list(dict(_chanda))
+                for _c in _unique_chanda:
+                    ongoing_score[_c] += 1
+                # TODO:
+                # If the exact match is by accident, other matches don't
+                # get a score. Decide if we want to calculate fuzzy matches
+                # irrespective of an exact match or not.
+            else:
+                for fuzzy_match in result.fuzzy:
+                    _chanda = fuzzy_match['chanda']
+                    _unique_chanda = list(dict(_chanda))
+                    for _c in _unique_chanda:
+                        ongoing_score[_c] += fuzzy_match['similarity']
+
+            verse_result.line_indices.append(line_result.index)
+
+        if len(verse_matra_options) >= 2:
+            matra_match = self.find_matra_verse_match(verse_matra_options)
+            if matra_match['found']:
+                for name, pada in matra_match['chanda']:
+                    if expected and name not in expected:
+                        continue
+                    ongoing_score[name] += len(verse_result.line_indices)
+            elif fuzzy:
+                seen = set()
+                for near_match in self.find_matra_nearest(verse_matra_options):
+                    for name in dict(near_match['chanda']):
+                        if name in seen or (expected and name not in expected):
+                            continue
+                        seen.add(name)
+                        ongoing_score[name] += (
+                            len(verse_result.line_indices) * near_match['similarity']
+                        )
+
+        verse_scores = ongoing_score.most_common()
+        if verse_scores:
+            best_score = verse_scores[0][1]
+            best_matches = ([
+                _c
+                for _c, _score in verse_scores
+                if _score == best_score
+            ], best_score)
+            verse_result.scores = verse_scores
+            verse_result.chanda = best_matches
+            for line_result in line_results:
+                priority_fuzzy = []
+                remaining_fuzzy = []
+                existing_fuzzy = list(line_result.result.fuzzy)
+                for fuzzy_match in existing_fuzzy:
+                    if any(
+                        (x in best_matches[0])
+                        for x in [c[0] for c in fuzzy_match['chanda']]
+                    ):
+                        priority_fuzzy.append(fuzzy_match)
+                    else:
+                        remaining_fuzzy.append(fuzzy_match)
+                line_result.result.fuzzy = priority_fuzzy + remaining_fuzzy
+
+        verse_result.line_results = list(line_results)
+        return verse_result
+
+    @staticmethod
+    def _verse_candidates(result: ChandaResult) -> Dict[str, float]:
+        """
+        Collect meter support of a line for verse segmentation.
+
+        Parameters
+        ----------
+        result : ChandaResult
+            Line result.
+
+        Returns
+        -------
+        dict
+            Mapping of meter name to support weight: ``1`` for exact
+            matches, otherwise the best fuzzy similarity.
+        """
+        if result.found:
+            return {name: 1.0 for name in dict(result.chanda)}
+        candidates = {}
+        for fuzzy_match in result.fuzzy:
+            for name in dict(fuzzy_match['chanda']):
+                candidates[name] = max(
+                    candidates.get(name, 0.0),
+                    fuzzy_match['similarity']
+                )
+        return candidates
+
+    def segment_verses(
+        self,
+        line_results: List[LineResult],
+        markers: Optional[List[str]] = None,
+        verse_lines: int = DEFAULT_VERSE_LINES
+    ) -> List[List[int]]:
+        """
+        Choose verse boundaries for a sequence of analyzed lines.
+
+        Parameters
+        ----------
+        line_results : list[LineResult]
+            Line results in input order.
+        markers : list[str], optional
+            Daṇḍa marker ending each line (``'॥'``, ``'।'`` or ``''``),
+            as returned by ``SanskritTextProcessor.process_and_detect_markers``.
+        verse_lines : int, optional
+            Expected number of lines per verse.
+
+        Returns
+        -------
+        list[list[int]]
+            Positions in ``line_results`` for each verse, in order.
+
+        Notes
+        -----
+        A dynamic program over line positions maximizes the total verse
+        score. A candidate verse scores the support of its best meter
+        (as in verse scoring), minus penalties for lines not supporting
+        that meter, for deviating from ``verse_lines``, for ending at a
+        single daṇḍa, and for containing a double daṇḍa; ending at a
+        double daṇḍa earns a bonus. Verse sizes are bounded by
+        ``1.5 * verse_lines``, so the cost is linear in the number of lines.
+        """
+        n = len(line_results)
+        if not n:
+            return []
+        if not markers or len(markers) != n:
+            markers = [''] * n
+        use_markers = any(markers)
+        max_size = verse_lines + max(1, verse_lines // 2)
+
+        candidates = [
+            self._verse_candidates(line_result.result)
+            for line_result in line_results
+        ]
+
+        best = [0.0] + [float('-inf')] * n
+        back = [0] * (n + 1)
+        for end in range(1, n + 1):
+            support = Counter()
+            internal_splits = 0
+            for size in range(1, min(max_size, end) + 1):
+                start = end - size
+                support.update(candidates[start])
+                if size > 1 and markers[start] == DOUBLE_DANDA:
+                    internal_splits += 1
+
+                coherence = max(support.values()) if support else 0.0
+                score = (
+                    coherence
+                    - (size - coherence) * SEGMENT_DISAGREE_PENALTY
+                    - abs(size - verse_lines) * SEGMENT_SIZE_PENALTY
+                )
+                if use_markers:
+                    if markers[end - 1] == DOUBLE_DANDA:
+                        score += SEGMENT_END_BONUS
+                    elif markers[end - 1] == SINGLE_DANDA:
+                        score -= SEGMENT_HALF_PENALTY
+                    score -= internal_splits * SEGMENT_SPLIT_PENALTY
+
+                total = best[start] + score
+                if total > best[end]:
+                    best[end] = total
+                    back[end] = start
+
+        verses = []
+        end = n
+        while end > 0:
+            start = back[end]
+            verses.append(list(range(start, end)))
+            end = start
+        return verses[::-1]
+
+    def iter_analyze_text(
+        self,
+        text: str,
+        verse: bool = False,
+        fuzzy: bool = False,
+        scheme: Optional[str] = None,
+        verse_lines: int = DEFAULT_VERSE_LINES,
+        segment: bool = False,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> Iterator[Union[LineResult, VerseResult]]:
+        """
+        Identify meters from text, yielding results as they are ready.
+
+        Parameters
+        ----------
+        text : str
+            Input Sanskrit text.
+        verse : bool, optional
+            If ``True``, treat input as collection of verses.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        scheme : str, optional
+            Output transliteration scheme.
+        verse_lines : int, optional
+            Number of lines per verse (default: 4 for ślokas).
+        segment : bool, optional
+            If ``True`` (verse mode), choose verse boundaries with
+            ``segment_verses`` instead of fixed groups of ``verse_lines``.
+        deadline_ms : float, optional
+            Time budget for the whole text in milliseconds. Once it is
+            exhausted, fuzzy searches stop early and the affected line
+            results are marked ``partial``.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the meters the text is expected to be in (see
+            ``analyze_line``).
+
+        Yields
+        ------
+        LineResult or VerseResult
+            Line results in input order. In verse mode, the line results of
+            a verse are yielded once the verse is complete, followed by the
+            ``VerseResult`` itself.
+
+        Notes
+        -----
+        Only the lines of the current verse are held in memory, which makes
+        this suitable for summary-only processing of large corpora.
+        Segmentation needs every line before the first verse is decided.
+        """
+        deadline = (
+            time.perf_counter() + deadline_ms / 1000
+            if deadline_ms is not None else None
+        )
+        lines, output_scheme, markers = self._prepare_text(
+            text, verse=verse, segment=segment, scheme=scheme
+        )
+        yield from self._iter_prepared_text(
+            lines,
+            output_scheme,
+            markers,
+            verse=verse,
+            fuzzy=fuzzy,
+            verse_lines=verse_lines,
+            deadline=deadline,
+            max_candidates=max_candidates,
+            expected=expected
+        )
+
+    def _iter_prepared_text(
+        self,
+        lines: List[str],
+        output_scheme: Optional[str],
+        markers: Optional[List[str]],
+        verse: bool = False,
+        fuzzy: bool = False,
+        verse_lines: int = DEFAULT_VERSE_LINES,
+        deadline: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> Iterator[Union[LineResult, VerseResult]]:
+        """
+        Analyze the lines of ``_prepare_text``, yielding results as they are ready.
+
+        Parameters
+        ----------
+        lines, output_scheme, markers
+            Output of ``_prepare_text``.
+        verse, fuzzy, verse_lines, max_candidates, expected
+            As in ``iter_analyze_text``.
+        deadline : float, optional
+            ``time.perf_counter()`` value after which fuzzy search stops.
+
+        Yields
+        ------
+        LineResult or VerseResult
+            As in ``iter_analyze_text``.
+        """
+        grouper = _TextResultGrouper(
+            self, verse, verse_lines, markers, expected=expected, fuzzy=fuzzy
+        )
+        for line_idx, line in enumerate(lines):
+            if not line:
+                continue
+            result = self._analyze_text_line(
                 line,
-                fuzzy=fuzzy
+                fuzzy,
+                output_scheme,
+                deadline=deadline,
+                max_candidates=max_candidates,
+                expected=expected
+            )
+            yield from grouper.feed(line_idx, result)
+        yield from grouper.finish()
+
+    # ----------------------------------------------------------------------- #
+    # asyncio interface (see ``chanda.aio``)
+
+    async def analyze_line_async(
+        self,
+        line: str,
+        fuzzy: bool = False,
+        k: int = 10,
+        executor: Optional[Executor] = None,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> ChandaResult:
+        """
+        Identify chanda from a single line in an executor.
+
+        Parameters
+        ----------
+        line : str
+            Input text line.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        k : int, optional
+            Maximum number of fuzzy matches to return.
+        executor : concurrent.futures.Executor, optional
+            Thread or process executor. Defaults to the loop's default
+            executor.
+        deadline_ms : float, optional
+            Time budget for fuzzy search in milliseconds (see
+            ``analyze_line``).
+        max_candidates : int, optional
+            Maximum number of signatures aligned by the fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``analyze_line``).
+
+        Returns
+        -------
+        ChandaResult
+            Result containing identification details.
+        """
+        from .aio import analyze_line_async
+        return await analyze_line_async(
+            self,
+            line,
+            fuzzy=fuzzy,
+            k=k,
+            executor=executor,
+            deadline_ms=deadline_ms,
+            max_candidates=max_candidates,
+            expected=expected
+        )
+
+    async def analyze_text_async(
+        self,
+        text: str,
+        verse: bool = False,
+        fuzzy: bool = False,
+        scheme: Optional[str] = None,
+        verse_lines: int = DEFAULT_VERSE_LINES,
+        segment: bool = False,
+        executor: Optional[Executor] = None,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> TextAnalysisResult:
+        """
+        Identify meters from text in an executor.
+
+        Parameters
+        ----------
+        text : str
+            Input Sanskrit text.
+        verse : bool, optional
+            If ``True``, treat input as collection of verses.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        scheme : str, optional
+            Output transliteration scheme.
+        verse_lines : int, optional
+            Number of lines per verse.
+        segment : bool, optional
+            Detect verse boundaries automatically (verse mode).
+        executor : concurrent.futures.Executor, optional
+            Thread or process executor. Defaults to the loop's default
+            executor.
+        deadline_ms : float, optional
+            Time budget for fuzzy search over the whole text in
+            milliseconds (see ``iter_analyze_text``).
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``analyze_line``).
+
+        Returns
+        -------
+        TextAnalysisResult
+            Analysis results with line and verse results.
+        """
+        from .aio import analyze_text_async
+        return await analyze_text_async(
+            self,
+            text,
+            verse=verse,
+            fuzzy=fuzzy,
+            scheme=scheme,
+            verse_lines=verse_lines,
+            segment=segment,
+            executor=executor,
+            deadline_ms=deadline_ms,
+            max_candidates=max_candidates,
+            expected=expected
+        )
+
+    def aiter_analyze_text(
+        self,
+        text: str,
+        verse: bool = False,
+        fuzzy: bool = False,
+        scheme: Optional[str] = None,
+        verse_lines: int = DEFAULT_VERSE_LINES,
+        segment: bool = False,
+        executor: Optional[Executor] = None,
+        max_queue: Optional[int] = None,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Union[LineResult, VerseResult]]:
+        """
+        Stream line and verse results from an executor.
+
+        Parameters
+        ----------
+        text : str
+            Input Sanskrit text.
+        verse : bool, optional
+            If ``True``, treat input as collection of verses.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        scheme : str, optional
+            Output transliteration scheme.
+        verse_lines : int, optional
+            Number of lines per verse.
+        segment : bool, optional
+            Detect verse boundaries automatically (verse mode).
+        executor : concurrent.futures.Executor, optional
+            Thread or process executor. Defaults to the loop's default
+            executor.
+        max_queue : int, optional
+            Maximum number of results computed ahead of the consumer
+            (default: ``chanda.aio.DEFAULT_MAX_QUEUE``).
+        deadline_ms : float, optional
+            Time budget for fuzzy search over the whole text in
+            milliseconds (see ``iter_analyze_text``).
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``analyze_line``).
+
+        Returns
+        -------
+        AsyncIterator[LineResult or VerseResult]
+            Items in the order of ``iter_analyze_text``.
+        """
+        from .aio import aiter_analyze_text, DEFAULT_MAX_QUEUE
+        return aiter_analyze_text(
+            self,
+            text,
+            verse=verse,
+            fuzzy=fuzzy,
+            scheme=scheme,
+            verse_lines=verse_lines,
+            segment=segment,
+            executor=executor,
+            max_queue=DEFAULT_MAX_QUEUE if max_queue is None else max_queue,
+            deadline_ms=deadline_ms,
+            max_candidates=max_candidates,
+            expected=expected
+        )
+
+    # ----------------------------------------------------------------------- #
+
+    def _prepare_text(
+        self,
+        text: str,
+        verse: bool = False,
+        segment: bool = False,
+        scheme: Optional[str] = None
+    ) -> Tuple[List[str], Optional[str], Optional[List[str]]]:
+        """
+        Split text into lines and resolve the output scheme.
+
+        Parameters
+        ----------
+        text : str
+            Input Sanskrit text.
+        verse : bool, optional
+            Verse mode.
+        segment : bool, optional
+            Detect verse boundaries (verse mode); daṇḍa markers are
+            returned only in this case.
+        scheme : str, optional
+            Output transliteration scheme.
+
+        Returns
+        -------
+        list[str]
+            Devanāgarī lines (possibly empty).
+        str or None
+            Output scheme (``scheme`` or the detected input scheme).
+        list[str] or None
+            Daṇḍa marker per line, or ``None`` if not segmenting.
+        """
+        if verse and segment:
+            lines, detected_scheme, markers = (
+                SanskritTextProcessor.process_and_detect_markers(text)
+            )
+        else:
+            lines, detected_scheme = self.process_text(text)
+            markers = None
+        return lines, scheme or detected_scheme, markers
+
+    def analyze_text(
+        self,
+        text: str,
+        verse: bool = False,
+        fuzzy: bool = False,
+        save_path: Optional[Union[str, ResultStore]] = None,
+        scheme: Optional[str] = None,
+        verse_lines: int = DEFAULT_VERSE_LINES,
+        segment: bool = False,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> TextAnalysisResult:
+        """
+        Identify meters from text.
+
+        Parameters
+        ----------
+        text : str
+            Input Sanskrit text.
+        verse : bool, optional
+            If ``True``, treat input as collection of verses.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        save_path : str or ResultStore, optional
+            Result store directory (or store). A result saved earlier for
+            the same text, options and definitions is read from the store
+            instead of being recomputed; otherwise the new result is saved
+            (JSON and text files). Stores given by directory are kept for
+            later calls, so their hit counts are written in batches. See
+            ``chanda.store``.
+        scheme : str, optional
+            Output transliteration scheme.
+        verse_lines : int, optional
+            Number of lines per verse (default: 4 for ślokas).
+        segment : bool, optional
+            If ``True`` (verse mode), choose verse boundaries from daṇḍa
+            markers and per-line meter candidates (see ``segment_verses``)
+            instead of fixed groups of ``verse_lines``. The chosen lines
+            are reported in ``VerseResult.line_indices``.
+        deadline_ms : float, optional
+            Time budget for the whole text in milliseconds. Once it is
+            exhausted, fuzzy searches stop early and the affected line
+            results are marked ``partial``.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the meters the text is expected to be in. Lines are
+            matched only against their signatures and flagged
+            ``unexpected`` when they fit none (see ``analyze_line``).
+
+        Returns
+        -------
+        TextAnalysisResult
+            Result object containing line and verse analyses.
+
+        Notes
+        -----
+        Supports configurable verse line grouping; mātrā-vṛtta matching
+        also allows two-line collapse of four-pāda patterns.
+
+        Results cut short by ``deadline_ms`` or ``max_candidates`` are not
+        saved to the store (their ``path`` entries are ``None``).
+        """
+        store = None
+        if save_path is not None:
+            if isinstance(save_path, ResultStore):
+                store = save_path
+            else:
+                store = self._stores.get(save_path)
+                if store is None:
+                    store = self._stores[save_path] = ResultStore(save_path)
+            result_id = store.result_id(
+                text,
+                verse,
+                fuzzy,
+                scheme=scheme,
+                verse_lines=verse_lines,
+                segment=segment,
+                language=self.language,
+                symbols=self.output_map,
+                fingerprint=self.fingerprint,
+                expected=sorted(set(expected)) if expected else None
             )
-            if output_scheme:
-                if result.scheme and result.scheme != output_scheme:
-                    result.line = transliterate(result.line, result.scheme, output_scheme)
-                result.scheme = output_scheme
-            line_results.append(LineResult(result=result, index=len(line_results)))
+            saved = store.get(result_id)
+            if saved is not None:
+                return TextAnalysisResult.from_dict({
+                    'result': saved,
+                    'path': store.filenames(result_id)
+                })
 
-        if verse:
-            verse_result = VerseResult()
-
-            line_count = 0
-            ongoing_score = Counter()
-            verse_matra_options = []
-
-            for line_idx, line_result in enumerate(line_results):
-                result = line_result.result
-                if result.matra:
-                    matra_options = self._matra_options_from_result(result)
-                    if matra_options:
-                        verse_matra_options.append(matra_options)
-                if result.found:
-                    _chanda = result.chanda
-                    _unique_chanda = list(dict(_chanda))
-                    for _c in _unique_chanda:
-                        ongoing_score[_c] += 1
-                    # TODO:
-                    # If the exact match is by accident, other matches don't
-                    # get a score. Decide if we want to calculate fuzzy matches
-                    # irrespective of an exact match or not.
-                else:
-                    for fuzzy_match in result.fuzzy:
-                        _chanda = fuzzy_match['chanda']
-                        _unique_chanda = list(dict(_chanda))
-                        for _c in _unique_chanda:
-                            ongoing_score[_c] += fuzzy_match['similarity']
-
-                verse_result.line_indices.append(line_idx)
-                line_count += 1
-                if line_count % verse_lines == 0 or line_idx == len(line_results) - 1:
-                    if len(verse_matra_options) >= 2:
-                        for matra_tuple in self._iter_matra_tuples(verse_matra_options):
-                            matra_match = self.find_matra_match(matra_tuple)
-                            if matra_match['found']:
-                                for name, pada in matra_match['chanda']:
-                                    ongoing_score[name] += len(verse_result.line_indices)
-                                break
-
-                    verse_scores = ongoing_score.most_common()
-                    if verse_scores:
-                        best_score = verse_scores[0][1]
-                        best_matches = ([
-                            _c
-                            for _c, _score in verse_scores
-                            if _score == best_score
-                        ], best_score)
-                        verse_result.scores = verse_scores
-                        verse_result.chanda = best_matches
-                        for _line_idx in verse_result.line_indices:
-                            line_result = line_results[_line_idx]
-                            priority_fuzzy = []
-                            remaining_fuzzy = []
-                            existing_fuzzy = list(line_result.result.fuzzy)
-                            for fuzzy_match in existing_fuzzy:
-                                if any(
-                                    (x in best_matches[0])
-                                    for x in [c[0] for c in fuzzy_match['chanda']]
-                                ):
-                                    priority_fuzzy.append(fuzzy_match)
-                                else:
-                                    remaining_fuzzy.append(fuzzy_match)
-                            line_result.result.fuzzy = priority_fuzzy + remaining_fuzzy
-
-                    verse_result.line_results = [
-                        line_results[i] for i in verse_result.line_indices
-                    ]
-                    verse_results.append(verse_result)
-                    # reset
-                    verse_result = VerseResult()
-                    ongoing_score = Counter()
-                    verse_matra_options = []
+        line_results: List[LineResult] = []
+        verse_results: List[VerseResult] = []
+
+        deadline = (
+            time.perf_counter() + deadline_ms / 1000
+            if deadline_ms is not None else None
+        )
+        lines, output_scheme, markers = self._prepare_text(
+            text, verse=verse, segment=segment, scheme=scheme
+        )
+        for item in self._iter_prepared_text(
+            lines,
+            output_scheme,
+            markers,
+            verse=verse,
+            fuzzy=fuzzy,
+            verse_lines=verse_lines,
+            deadline=deadline,
+            max_candidates=max_candidates,
+            expected=expected
+        ):
+            if isinstance(item, VerseResult):
+                verse_results.append(item)
+            else:
+                line_results.append(item)
 
         analysis = AnalysisResult(
             scheme=output_scheme,
@@ -1094,31 +2481,183 @@ class Chanda:
                 )
                 simple_result.append("")
 
-        if save_path is not None:
-            os.makedirs(save_path, exist_ok=True)
+        paths = {
+            'json': None,
+            'txt': None
+        }
+        if store is not None and not any(lr.result.partial for lr in line_results):
+            paths = store.put(
+                result_id,
+                analysis.to_dict(),
+                "\n".join(simple_result)
+            )
+        return TextAnalysisResult(result=analysis, path=paths)
+
+    def reanalyze(
+        self,
+        previous: TextAnalysisResult,
+        new_text: str,
+        verse: bool = False,
+        fuzzy: bool = False,
+        scheme: Optional[str] = None,
+        verse_lines: int = DEFAULT_VERSE_LINES,
+        segment: bool = False,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> TextAnalysisResult:
+        """
+        Identify meters from an edited text, reusing a previous result.
+
+        Parameters
+        ----------
+        previous : TextAnalysisResult
+            Result of ``analyze_text`` (or ``reanalyze``) for the text
+            before the edit, made with the same options.
+        new_text : str
+            Edited Sanskrit text.
+        verse : bool, optional
+            If ``True``, treat input as collection of verses.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        scheme : str, optional
+            Output transliteration scheme.
+        verse_lines : int, optional
+            Number of lines per verse (default: 4 for ślokas).
+        segment : bool, optional
+            Detect verse boundaries automatically (verse mode).
+        deadline_ms : float, optional
+            Time budget for the changed lines in milliseconds.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``analyze_text``).
 
-            md5sum = hashlib.md5(text.encode('utf-8')).hexdigest()
-            result_id = f"result_{md5sum}_{int(verse)}_{int(fuzzy)}"
+        Returns
+        -------
+        TextAnalysisResult
+            Same result as ``analyze_text(new_text, ...)`` (not saved, so
+            ``path`` entries are ``None``). ``previous`` is not modified.
 
-            json_filename = f"{result_id}.json"
-            json_path = os.path.join(save_path, json_filename)
-            with open(json_path, mode="w", encoding="utf-8") as f:
-                json.dump(analysis.to_dict(), f, ensure_ascii=False)
+        Notes
+        -----
+        Lines are diffed against the lines of ``previous``; only inserted
+        or changed lines are scanned, and partial line results are never
+        reused. In verse mode, a verse is taken over from ``previous``
+        when it consists of the same unchanged lines, and aggregated again
+        otherwise. With fixed grouping, inserting or deleting lines shifts
+        the verses after the edit, which are then aggregated again (but not
+        scanned). Segmentation is always redone, since boundaries may move
+        anywhere; it does not scan lines either.
+        """
+        analysis = previous.result
+        if isinstance(analysis, dict):
+            analysis = AnalysisResult.from_dict(analysis)
+        deadline = (
+            time.perf_counter() + deadline_ms / 1000
+            if deadline_ms is not None else None
+        )
 
-            txt_filename = f"{result_id}.txt"
-            txt_path = os.path.join(save_path, txt_filename)
-            with open(txt_path, mode="w", encoding="utf-8") as f:
-                f.write("\n".join(simple_result))
-        else:
-            md5sum = None
-            json_filename = None
-            txt_filename = None
+        lines, output_scheme, markers = self._prepare_text(
+            new_text, verse=verse, segment=segment, scheme=scheme
+        )
+        positions = [line_idx for line_idx, line in enumerate(lines) if line]
+        old_lines = analysis.line if analysis.scheme == output_scheme else []
+        mapping = _match_lines(
+            [
+                None if line_result.result.partial else line_result.result.line
+                for line_result in old_lines
+            ],
+            [
+                transliterate(lines[line_idx], sanscript.DEVANAGARI, output_scheme)
+                if output_scheme and output_scheme != sanscript.DEVANAGARI
+                else lines[line_idx]
+                for line_idx in positions
+            ]
+        )
 
-        paths = {
-            'json': json_filename,
-            'txt': txt_filename
-        }
-        return TextAnalysisResult(result=analysis, path=paths)
+        line_results: List[LineResult] = []
+        for idx, (line_idx, old_idx) in enumerate(zip(positions, mapping)):
+            if old_idx is None:
+                result = self._analyze_text_line(
+                    lines[line_idx],
+                    fuzzy,
+                    output_scheme,
+                    deadline=deadline,
+                    max_candidates=max_candidates,
+                    expected=expected
+                )
+            else:
+                result = old_lines[old_idx].result
+            line_results.append(LineResult(result=result, index=idx))
+
+        verse_results: List[VerseResult] = []
+        if verse:
+            if markers is not None:
+                windows = self.segment_verses(
+                    line_results,
+                    markers=[markers[line_idx] for line_idx in positions],
+                    verse_lines=verse_lines
+                )
+            else:
+                windows = [
+                    list(range(start, min(start + verse_lines, len(line_results))))
+                    for start in range(0, len(line_results), verse_lines)
+                ]
+            old_verses = {
+                tuple(verse_result.line_indices): verse_result
+                for verse_result in analysis.verse
+            } if old_lines else {}
+            ranks = None
+
+            for window in windows:
+                old_verse = old_verses.get(tuple(mapping[idx] for idx in window))
+                if old_verse is not None:
+                    verse_results.append(VerseResult(
+                        chanda=old_verse.chanda,
+                        scores=old_verse.scores,
+                        line_indices=list(window),
+                        line_results=[line_results[idx] for idx in window]
+                    ))
+                    continue
+
+                # Aggregation re-orders fuzzy matches in place, so reused
+                # lines get copies in the order of ``analyze_line``
+                # (similarity, then definition order)
+                for idx in window:
+                    if mapping[idx] is None:
+                        continue
+                    if ranks is None:
+                        ranks = {
+                            (name, tuple(pada)): rank
+                            for rank, meters in reversed(list(enumerate(self.CHANDA.values())))
+                            for name, pada in meters
+                        }
+                    result = line_results[idx].result
+                    line_results[idx].result = replace(result, fuzzy=sorted(
+                        result.fuzzy,
+                        key=lambda match: (
+                            -match['similarity'],
+                            ranks.get(
+                                (match['chanda'][0][0], tuple(match['chanda'][0][1])),
+                                len(ranks)
+                            )
+                        )
+                    ))
+                verse_results.append(self._aggregate_verse(
+                    [line_results[idx] for idx in window],
+                    expected=expected,
+                    fuzzy=fuzzy
+                ))
+
+        return TextAnalysisResult(
+            result=AnalysisResult(
+                scheme=output_scheme,
+                line=line_results,
+                verse=verse_results
+            ),
+            path={'json': None, 'txt': None}
+        )
 
     # ----------------------------------------------------------------------- #
 
@@ -1126,7 +2665,8 @@ class Chanda:
         self,
         direct_match: Dict[str, Any],
         multi_match: Dict[str, Any],
-        regex_matches: List[str]
+        regex_matches: List[str],
+        tables: Optional[Dict[str, Any]] = None
     ) -> Dict[str, List]:
         """
         Collect all matching chanda information from different match types.
@@ -1139,6 +2679,8 @@ class Chanda:
             Multi-pada match results.
         regex_matches : list[str]
             Regex pattern matches.
+        tables : dict, optional
+            Definition tables restricted to expected meters.
 
         Returns
         -------
@@ -1168,21 +2710,26 @@ class Chanda:
             result['matra'] += multi_match['matra']
 
         if regex_matches:
+            chanda_table = self.CHANDA if tables is None else tables['CHANDA']
             result['chanda'] += [
                 c
                 for m in regex_matches
-                for c in self.CHANDA.get(m)
+                for c in chanda_table.get(m)
                 if c not in result['chanda']
             ]
 
         return result
 
+    @instrumented('fuzzy')
     def _compute_fuzzy_matches(
         self,
         scan: Dict[str, Any],
         k: int,
-        max_diff: int = 3
-    ) -> List[Dict[str, Any]]:
+        max_diff: int = 3,
+        deadline: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        tables: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """
         Compute fuzzy matches for a line that didn't have an exact match.
 
@@ -1194,48 +2741,88 @@ class Chanda:
             Maximum number of fuzzy matches to return.
         max_diff : int, optional
             Maximum edit distance to consider.
+        deadline : float, optional
+            ``time.perf_counter()`` value after which the search stops.
+        max_candidates : int, optional
+            Maximum number of signatures to align.
+        tables : dict, optional
+            Definition tables restricted to expected meters; only their
+            signatures are aligned.
 
         Returns
         -------
         list[dict]
             Fuzzy match dictionaries sorted by similarity.
+        bool
+            ``True`` if the search stopped before all candidates were
+            aligned.
+
+        Notes
+        -----
+        Signatures are visited in buckets of increasing length difference
+        (``FUZZY_BUCKETS``), so a truncated search has already seen the
+        most likely candidates. Ties in similarity keep definition order.
         """
         fuzzy_matches = []
+        partial = False
+        if tables is None:
+            chanda_table, fuzzy_buckets = self.CHANDA, self.FUZZY_BUCKETS
+        else:
+            chanda_table, fuzzy_buckets = tables['CHANDA'], tables['FUZZY_BUCKETS']
 
         lg_str = scan['lg_str']
-        for chanda_lg, chanda_names in self.CHANDA.items():
-            if abs(len(chanda_lg) - len(lg_str)) > max_diff:
-                continue
-            chanda_gana = self.lg_to_gana(chanda_lg)
-            cost, suggestion = self.transform(
-                syllables=scan['syllables_nested'],
-                lg_marks=scan['lg_marks'],
-                lg_str=lg_str,
-                signature=chanda_lg,
-                max_diff=max_diff,
-            )
-
-            if len(chanda_lg) > 0:
-                similarity = (1 - cost / len(chanda_lg))
-            else:
-                similarity = 0
-
-            if suggestion:
-                fuzzy_matches.append({
-                    "chanda": chanda_names,
-                    "gana": chanda_gana.translate(self.ttable_out),
-                    "suggestion": suggestion,
-                    "cost": cost,
-                    "similarity": similarity,
-                })
+        length = len(lg_str)
+        buckets = [length] + [
+            length + sign * diff
+            for diff in range(1, max_diff + 1)
+            for sign in (-1, 1)
+        ]
+        evaluated = 0
+        for bucket in buckets:
+            for rank, chanda_lg in fuzzy_buckets.get(bucket, ()):
+                if (
+                    (max_candidates is not None and evaluated >= max_candidates)
+                    or (deadline is not None and time.perf_counter() >= deadline)
+                ):
+                    partial = True
+                    break
+                evaluated += 1
+
+                cost, suggestion = self.transform(
+                    syllables=scan['syllables_nested'],
+                    lg_marks=scan['lg_marks'],
+                    lg_str=lg_str,
+                    signature=chanda_lg,
+                    max_diff=max_diff,
+                )
 
-        return sorted(fuzzy_matches, key=lambda x: x["similarity"], reverse=True)[:k]
+                if len(chanda_lg) > 0:
+                    similarity = (1 - cost / len(chanda_lg))
+                else:
+                    similarity = 0
+
+                if suggestion:
+                    fuzzy_matches.append((rank, {
+                        "chanda": chanda_table[chanda_lg],
+                        "gana": self._signature_info(chanda_lg).display_gana,
+                        "suggestion": suggestion,
+                        "cost": cost,
+                        "similarity": similarity,
+                    }))
+            if partial:
+                break
+
+        fuzzy_matches.sort(key=lambda x: (-x[1]["similarity"], x[0]))
+        return [match for _, match in fuzzy_matches[:k]], partial
 
     def analyze_line(
         self,
         line: str,
         fuzzy: bool = False,
-        k: int = 10
+        k: int = 10,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
     ) -> ChandaResult:
         """
         Identify chanda from a single text line.
@@ -1248,12 +2835,33 @@ class Chanda:
             Enable fuzzy matching.
         k : int, optional
             Maximum number of fuzzy matches to return.
+        deadline_ms : float, optional
+            Time budget for the call in milliseconds. When it is exhausted,
+            the fuzzy search stops and the result is marked ``partial``.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by the fuzzy search.
+        expected : sequence of str, optional
+            Names of the meters the line is expected to be in. Exact,
+            wildcard and fuzzy matching then consider only their
+            signatures, and the result is flagged ``unexpected`` if the
+            line fits none of them.
 
         Returns
         -------
         ChandaResult
             Result containing identification details and optional fuzzy matches.
+
+        Raises
+        ------
+        ValueError
+            If the input has more than one line, or an expected meter is
+            not defined.
         """
+        tables = self._expected_signatures(expected) if expected else None
+        deadline = (
+            time.perf_counter() + deadline_ms / 1000
+            if deadline_ms is not None else None
+        )
         lines, scheme = self.process_text(line)
         output_line = line
 
@@ -1275,34 +2883,125 @@ class Chanda:
             empty = self._empty_result(output_line, scheme)
             return ChandaResult.from_dict(empty)
 
-        # Get matches using a single scan
-        direct_match = self._build_match(scan, multi=False)
-        multi_match = self._build_match(scan, multi=True)
+        return self._analyze_scan(
+            scan,
+            output_line,
+            scheme,
+            fuzzy=fuzzy,
+            k=k,
+            deadline=deadline,
+            max_candidates=max_candidates,
+            tables=tables
+        )
 
-        # Check for pattern matches
-        lg_str = scan['lg_str']
+    @instrumented('wildcard')
+    def _match_wildcards(
+        self,
+        lg_str: str,
+        tables: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Find signatures that match a laghu-guru string as patterns.
+
+        Parameters
+        ----------
+        lg_str : str
+            Laghu-guru string of the line.
+        tables : dict, optional
+            Definition tables restricted to expected meters.
+
+        Returns
+        -------
+        list[str]
+            Matching signatures, in definition order. A final laghu is
+            also tried as guru.
+
+        Notes
+        -----
+        Concrete signatures and expanded wildcard signatures (see
+        ``_index_wildcard_signature``) are found by lookup; only the few
+        signatures too large to expand are matched as patterns.
+        """
         lg_candidates = [lg_str]
         if lg_str.endswith(self.L):
             lg_candidates.append(lg_str[:-1] + self.G)
-        regex_matches = [
-            pattern
-            for pattern in self.CHANDA
-            if any(re.match(f'^{pattern}$', candidate) for candidate in lg_candidates)
-        ]
+        chanda_table = self.CHANDA if tables is None else tables['CHANDA']
+        matches = set()
+        for candidate in lg_candidates:
+            if candidate in chanda_table:
+                matches.add(candidate)
+            matches.update(self.WILDCARD_KEYS.get(candidate, ()))
+            for length, signature, matcher in self._wildcard_matchers:
+                if length == len(candidate) and matcher.fullmatch(candidate):
+                    matches.add(signature)
+        return sorted(
+            (pattern for pattern in matches if pattern in chanda_table),
+            key=self._ranks.__getitem__
+        )
+
+    def _analyze_scan(
+        self,
+        scan: Dict[str, Any],
+        output_line: str,
+        scheme: Optional[str],
+        fuzzy: bool = False,
+        k: int = 10,
+        deadline: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        tables: Optional[Dict[str, Any]] = None
+    ) -> ChandaResult:
+        """
+        Identify chanda for a scanned line.
+
+        Parameters
+        ----------
+        scan : dict
+            Output from ``_scan_line``.
+        output_line : str
+            Line text in the output scheme.
+        scheme : str or None
+            Output transliteration scheme.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        k : int, optional
+            Maximum number of fuzzy matches to return.
+        deadline : float, optional
+            ``time.perf_counter()`` value after which fuzzy search stops.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by the fuzzy search.
+        tables : dict, optional
+            Definition tables restricted to expected meters (see
+            ``_expected_signatures``).
+
+        Returns
+        -------
+        ChandaResult
+            Result containing identification details and optional fuzzy matches.
+        """
+        # Get matches using a single scan
+        direct_match = self._build_match(scan, multi=False, tables=tables)
+        multi_match = self._build_match(scan, multi=True, tables=tables)
+
+        # Check for pattern matches
+        lg_str = scan['lg_str']
+        regex_matches = self._match_wildcards(lg_str, tables=tables)
 
         found = direct_match['found'] or multi_match['found'] or bool(regex_matches)
 
         # Collect all matches
-        matches = self._collect_matches(direct_match, multi_match, regex_matches) if found else {
+        matches = self._collect_matches(
+            direct_match, multi_match, regex_matches, tables=tables
+        ) if found else {
             'chanda': [], 'jaati': [], 'gana': [], 'length': [], 'matra': []
         }
 
         # Compute full properties
+        full_info = self._signature_info(lg_str)
         full_lg = [self.output_map.get(c, c) for c in scan['lg_marks']]
-        full_length = len(lg_str)
-        full_matra = self.count_matra(lg_str)
-        full_gana = self.lg_to_gana(lg_str).translate(self.ttable_out)
-        full_jaati = self.JAATI.get(len(lg_str), self.JAATI[-1])
+        full_length = full_info.length
+        full_matra = full_info.matra
+        full_gana = full_info.display_gana
+        full_jaati = full_info.jaati
         jaati = matches['jaati'] if matches['jaati'] else list(full_jaati)
 
         # Build result
@@ -1316,17 +3015,126 @@ class Chanda:
             'length': full_length,
             'matra': full_matra,
             'chanda': matches['chanda'],
-            'jaati': jaati
+            'jaati': jaati,
+            'unexpected': tables is not None and not found
         }
 
         # Add fuzzy matches if needed
-        answer['fuzzy'] = (
-            self._compute_fuzzy_matches(scan, k)
-            if not found and fuzzy else []
-        )
+        answer['fuzzy'] = []
+        if not found and fuzzy:
+            answer['fuzzy'], answer['partial'] = self._compute_fuzzy_matches(
+                scan,
+                k,
+                deadline=deadline,
+                max_candidates=max_candidates,
+                tables=tables
+            )
 
         return ChandaResult.from_dict(answer)
 
+    ###########################################################################
+    # As-you-type matching (see ``chanda.prefix``)
+
+    def prefix_trie(self) -> SignatureTrie:
+        """
+        Trie over single-pāda signatures, built on first use.
+
+        Returns
+        -------
+        SignatureTrie
+            Trie over ``SINGLE_CHANDA``.
+        """
+        if self._prefix_trie is None:
+            self._prefix_trie = SignatureTrie(self.SINGLE_CHANDA, L=self.L, G=self.G)
+        return self._prefix_trie
+
+    def match_prefix(self, lg_prefix: str) -> List[Dict[str, Any]]:
+        """
+        List the meters consistent with the beginning of a pāda.
+
+        Parameters
+        ----------
+        lg_prefix : str
+            Laghu-guru string of the syllables typed so far.
+
+        Returns
+        -------
+        list[dict]
+            Candidates with ``signature``, ``chanda``, the expected
+            ``next`` syllable weight, the number of ``remaining``
+            syllables and ``complete`` (see ``SignatureTrie.candidates``).
+        """
+        return self.prefix_trie().candidates(lg_prefix)
+
+    def prefix_matcher(self) -> PrefixMatcher:
+        """
+        Create an incremental matcher for a pāda being typed.
+
+        Returns
+        -------
+        PrefixMatcher
+            Matcher to feed with ``update`` or ``append``.
+        """
+        return PrefixMatcher(self)
+
+    ###########################################################################
+
+    def enable_instrumentation(
+        self,
+        hooks: Optional[List[StageHook]] = None
+    ) -> Instrumentation:
+        """
+        Start recording per-stage wall time and call counts.
+
+        Parameters
+        ----------
+        hooks : list of callable, optional
+            Callables invoked as ``hook(stage, elapsed_ms)`` after each
+            stage call.
+
+        Returns
+        -------
+        Instrumentation
+            The active recorder. If instrumentation is already enabled,
+            the hooks are added to the existing recorder.
+        """
+        if self.instrumentation is None:
+            self.instrumentation = Instrumentation(hooks)
+        else:
+            for hook in hooks or []:
+                self.instrumentation.add_hook(hook)
+        return self.instrumentation
+
+    def disable_instrumentation(self) -> Optional[Instrumentation]:
+        """
+        Stop recording stage measurements.
+
+        Returns
+        -------
+        Instrumentation or None
+            The detached recorder (with its measurements), if any.
+        """
+        instrumentation, self.instrumentation = self.instrumentation, None
+        return instrumentation
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Snapshot of the per-stage measurements.
+
+        Returns
+        -------
+        dict
+            Mapping of stage name to ``calls``, ``total_ms``, ``mean_ms``
+            and ``max_ms``. Empty when instrumentation is disabled.
+
+        Notes
+        -----
+        Stage times are inclusive; ``transform`` is part of ``fuzzy``.
+        """
+        if self.instrumentation is None:
+            return {}
+        return self.instrumentation.stats()
+
     ###########################################################################
 
     @classmethod
@@ -1347,67 +3155,7 @@ class Chanda:
         dict
             Summary statistics for line and verse matches.
         """
-        if isinstance(results, TextAnalysisResult):
-            results = results.result
-        if isinstance(results, AnalysisResult):
-            results = results.to_dict()
-
-        line_results = results.get('line', [])
-        verse_results = results.get('verse', [])
-
-        match_line_statistics = defaultdict(Counter)
-        fuzzy_line_statistics = defaultdict(Counter)
-        verse_statistics = defaultdict(Counter)
-
-        counts = defaultdict(int)
-
-        for line_answer in line_results:
-            counts['line'] += 1
-            line_result = line_answer.get('result', line_answer)
-            if line_result['found']:
-                counts['match_line'] += 1
-                chanda_list = [
-                    cls.format_chanda_pada(c, p)
-                    for c, p in line_result.get('chanda', [])
-                ]
-                gana_list = [line_result.get('gana', "")]
-
-                match_line_statistics['chanda'].update(chanda_list)
-                match_line_statistics['gana'].update(gana_list)
-            else:
-                counts['fuzzy_line'] += 1
-                for idx, fuzzy_match in enumerate(line_result['fuzzy']):
-                    if idx == 0:
-                        counts['mismatch_syllable'] += fuzzy_match['cost']
-                    chanda_list = cls.format_chanda_list(
-                        fuzzy_match.get('chanda', [])
-                    ).split('/') if fuzzy_match.get('chanda') else []
-                    fuzzy_line_statistics['chanda'].update(chanda_list)
-                    break
-
-        for verse_result in verse_results:
-            counts['verse'] += 1
-            if not verse_result.get('chanda'):
-                counts['fuzzy_verse'] += 1
-                continue
-            chanda_list, chanda_score = verse_result['chanda']
-            verse_len = len(verse_result.get('line_indices', []))
-            if not verse_len and verse_result.get('line_results'):
-                verse_len = len(verse_result['line_results'])
-            if chanda_score == verse_len:
-                counts['match_verse'] += 1
-            else:
-                counts['fuzzy_verse'] += 1
-            verse_statistics['chanda'].update(chanda_list)
-
-        return {
-            'verse': verse_statistics,
-            'line': {
-                'fuzzy': fuzzy_line_statistics,
-                'match': match_line_statistics,
-            },
-            'count': counts
-        }
+        return SummaryAccumulator().update(results).summary()
 
     ###########################################################################
     # Formatters
@@ -1431,13 +3179,183 @@ class Chanda:
     ###########################################################################
 
 
+class _TextResultGrouper:
+    """
+    Group line results into verses as they arrive.
+
+    Parameters
+    ----------
+    chanda : Chanda
+        Analyzer used for verse aggregation and segmentation.
+    verse : bool
+        Verse mode; if ``False``, line results are passed through.
+    verse_lines : int
+        Number of lines per verse.
+    markers : list[str], optional
+        Daṇḍa marker per input line; enables ``segment_verses``.
+    expected : sequence of str, optional
+        Names of the expected meters (see ``_aggregate_verse``).
+    fuzzy : bool, optional
+        Score approximate mātrā-vṛtta matches (see ``_aggregate_verse``).
+
+    Notes
+    -----
+    ``feed`` and ``finish`` return the items that ``iter_analyze_text``
+    yields, so the same grouping can be driven by synchronous and
+    asynchronous producers.
+    """
+
+    def __init__(
+        self,
+        chanda: Chanda,
+        verse: bool,
+        verse_lines: int,
+        markers: Optional[List[str]] = None,
+        expected: Optional[Sequence[str]] = None,
+        fuzzy: bool = False
+    ) -> None:
+        self.chanda = chanda
+        self.verse = verse
+        self.verse_lines = verse_lines
+        self.markers = markers
+        self.expected = expected
+        self.fuzzy = fuzzy
+        self.line_count = 0
+        self.pending: List[LineResult] = []
+        self.pending_markers: List[str] = []
+
+    def feed(
+        self,
+        line_idx: int,
+        result: ChandaResult
+    ) -> List[Union[LineResult, VerseResult]]:
+        """
+        Consume the result of a non-empty input line.
+
+        Parameters
+        ----------
+        line_idx : int
+            Position of the line in the processed input lines.
+        result : ChandaResult
+            Line result.
+
+        Returns
+        -------
+        list[LineResult or VerseResult]
+            Items that are ready to be emitted.
+        """
+        line_result = LineResult(result=result, index=self.line_count)
+        self.line_count += 1
+
+        if not self.verse:
+            return [line_result]
+
+        self.pending.append(line_result)
+        if self.markers is not None:
+            self.pending_markers.append(self.markers[line_idx])
+        elif len(self.pending) == self.verse_lines:
+            items = self._flush(self.pending)
+            self.pending = []
+            return items
+        return []
+
+    def finish(self) -> List[Union[LineResult, VerseResult]]:
+        """
+        Emit the remaining verses.
+
+        Returns
+        -------
+        list[LineResult or VerseResult]
+            Remaining items.
+        """
+        items = []
+        if self.markers is not None:
+            pending = self.pending
+            for positions in self.chanda.segment_verses(
+                pending,
+                markers=self.pending_markers,
+                verse_lines=self.verse_lines
+            ):
+                items.extend(self._flush([pending[i] for i in positions]))
+        elif self.pending:
+            items.extend(self._flush(self.pending))
+        self.pending = []
+        return items
+
+    def _flush(
+        self,
+        line_results: List[LineResult]
+    ) -> List[Union[LineResult, VerseResult]]:
+        verse_result = self.chanda._aggregate_verse(
+            line_results, expected=self.expected, fuzzy=self.fuzzy
+        )
+        return list(line_results) + [verse_result]
+
+
+def _match_lines(
+    old: List[Optional[str]],
+    new: List[str]
+) -> List[Optional[int]]:
+    """
+    Match the lines of an edited text to the lines before the edit.
+
+    Parameters
+    ----------
+    old : list[str or None]
+        Lines before the edit (``None`` never matches).
+    new : list[str]
+        Lines after the edit.
+
+    Returns
+    -------
+    list[int or None]
+        Position in ``old`` of each unchanged line in ``new``, or ``None``
+        for inserted or changed lines.
+
+    Notes
+    -----
+    The common prefix and suffix are matched first, so only the edited
+    region goes through ``difflib.SequenceMatcher``.
+    """
+    mapping: List[Optional[int]] = [None] * len(new)
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] is not None and old[prefix] == new[prefix]:
+        mapping[prefix] = prefix
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and old[-1 - suffix] is not None
+        and old[-1 - suffix] == new[-1 - suffix]
+    ):
+        mapping[len(new) - 1 - suffix] = len(old) - 1 - suffix
+        suffix += 1
+
+    old_middle = old[prefix:len(old) - suffix]
+    new_middle = new[prefix:len(new) - suffix]
+    if old_middle and new_middle:
+        matcher = difflib.SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+        for a, b, size in matcher.get_matching_blocks():
+            for offset in range(size):
+                if old_middle[a + offset] is not None:
+                    mapping[prefix + b + offset] = prefix + a + offset
+    return mapping
+
+
+###############################################################################
+
+
 def analyze_line(
     text: str,
     fuzzy: bool = True,
     k: int = 10,
     output_scheme: Optional[str] = None,
     data_path: Optional[str] = None,
-    language: str = 'sanskrit'
+    language: str = 'sanskrit',
+    deadline_ms: Optional[float] = None,
+    max_candidates: Optional[int] = None,
+    expected: Optional[Sequence[str]] = None
 ) -> ChandaResult:
     """
     Identify meter from a single line of Sanskrit text.
@@ -1456,6 +3374,14 @@ def analyze_line(
         Path to meter definition data directory. If ``None``, uses package default.
     language : str, optional
         Language for prosody analysis (``'sanskrit'``, ``'vedic'``, ``'prakrit'``).
+    deadline_ms : float, optional
+        Time budget for fuzzy search in milliseconds (see
+        ``Chanda.analyze_line``).
+    max_candidates : int, optional
+        Maximum number of signatures aligned by the fuzzy search.
+    expected : sequence of str, optional
+        Names of the meters the line is expected to be in (see
+        ``Chanda.analyze_line``).
 
     Returns
     -------
@@ -1465,7 +3391,8 @@ def analyze_line(
     Raises
     ------
     ValueError
-        If text contains more than one line.
+        If text contains more than one line, or an expected meter is not
+        defined.
 
     Examples
     --------
@@ -1485,9 +3412,34 @@ def analyze_line(
     result = analyzer.analyze_line(
         text,
         fuzzy=fuzzy,
-        k=k
+        k=k,
+        deadline_ms=deadline_ms,
+        max_candidates=max_candidates,
+        expected=expected
     )
+    return apply_output_scheme(result, output_scheme)
+
+
+def apply_output_scheme(
+    result: ChandaResult,
+    output_scheme: Optional[str] = None
+) -> ChandaResult:
+    """
+    Transliterate the line of a result into an output scheme.
 
+    Parameters
+    ----------
+    result : ChandaResult
+        Line identification result (modified in place).
+    output_scheme : str, optional
+        Transliteration scheme for output. If ``None``, the result is
+        returned unchanged.
+
+    Returns
+    -------
+    ChandaResult
+        The same result object.
+    """
     if output_scheme:
         if result.scheme:
             result.line = transliterate(result.line, result.scheme, output_scheme)
@@ -1502,7 +3454,11 @@ def analyze_text(
     fuzzy: bool = True,
     output_scheme: Optional[str] = None,
     data_path: Optional[str] = None,
-    language: str = 'sanskrit'
+    language: str = 'sanskrit',
+    segment: bool = False,
+    deadline_ms: Optional[float] = None,
+    max_candidates: Optional[int] = None,
+    expected: Optional[Sequence[str]] = None
 ) -> TextAnalysisResult:
     """
     Identify meters for multi-line Sanskrit text.
@@ -1521,6 +3477,17 @@ def analyze_text(
         Path to meter definition data directory.
     language : str, optional
         Language for prosody analysis (``'sanskrit'``, ``'vedic'``, ``'prakrit'``).
+    segment : bool, optional
+        If ``True`` (verse mode), detect verse boundaries automatically
+        instead of grouping lines in fours.
+    deadline_ms : float, optional
+        Time budget for fuzzy search over the whole text in milliseconds
+        (see ``Chanda.analyze_text``).
+    max_candidates : int, optional
+        Maximum number of signatures aligned by each fuzzy search.
+    expected : sequence of str, optional
+        Names of the meters the text is expected to be in (see
+        ``Chanda.analyze_text``).
 
     Returns
     -------
@@ -1544,7 +3511,11 @@ def analyze_text(
         text,
         verse=verse_mode,
         fuzzy=fuzzy,
-        scheme=output_scheme
+        scheme=output_scheme,
+        segment=segment,
+        deadline_ms=deadline_ms,
+        max_candidates=max_candidates,
+        expected=expected
     )
 
     return results
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent analysis daemon and client over a Unix domain socket.
+
+The daemon keeps a warm ``ChandaService`` (definitions loaded, caches
+populated) behind a Unix domain socket, so short-lived clients such as
+``chanda --connect`` skip interpreter-heavy imports and definition
+loading.
+
+Notes
+-----
+The wire protocol is newline-delimited JSON: each request is one JSON
+object on a line and each response is one JSON object on a line (see
+``chanda.service`` for the request format). A connection can carry any
+number of requests. The additional ``shutdown`` operation stops the
+daemon.
+
+This module only imports ``chanda.core`` on the daemon side, so the
+client stays cheap to import.
+"""
+
+import os
+import sys
+import json
+import socket
+import stat
+import tempfile
+import threading
+import socketserver
+from typing import Any, Dict, Optional
+
+from .exceptions import ChandaError
+from .types import ChandaResult, MeterStats, TextAnalysisResult
+
+###############################################################################
+
+SOCKET_ENV = 'CHANDA_SOCKET'
+
+###############################################################################
+
+
+class DaemonError(ChandaError):
+    """
+    Raised when the daemon reports an error for a request.
+    """
+    pass
+
+
+def get_default_socket_path() -> str:
+    """
+    Get the default daemon socket path.
+
+    Returns
+    -------
+    str
+        Value of ``$CHANDA_SOCKET`` if set; otherwise a per-user socket in
+        the temporary directory.
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    uid = os.getuid() if hasattr(os, 'getuid') else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f'chanda-{uid}.sock')
+
+
+###############################################################################
+# Client
+
+
+class DaemonClient:
+    """
+    Client for a running analysis daemon.
+
+    Parameters
+    ----------
+    socket_path : str, optional
+        Daemon socket path. Defaults to ``get_default_socket_path()``.
+    timeout : float, optional
+        Socket timeout in seconds.
+
+    Notes
+    -----
+    The connection is opened on the first request and reused until
+    ``close`` is called. Connection failures are raised as ``OSError``
+    (e.g. ``FileNotFoundError`` or ``ConnectionRefusedError`` if no daemon
+    is running), so callers can fall back to in-process analysis.
+
+    Examples
+    --------
+    >>> with DaemonClient() as client:
+    ...     result = client.analyze_line("रामो राजमणिः सदा विजयते")
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> None:
+        self.socket_path = socket_path or get_default_socket_path()
+        self.timeout = timeout
+        self._socket = None
+        self._file = None
+
+    def __enter__(self) -> 'DaemonClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ----------------------------------------------------------------------- #
+
+    def connect(self) -> None:
+        """
+        Open the connection to the daemon if it is not open yet.
+
+        Raises
+        ------
+        OSError
+            If the daemon socket cannot be reached.
+        """
+        if self._socket is not None:
+            return
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError("Unix domain sockets are not supported on this platform")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self._socket = sock
+        self._file = sock.makefile('rwb')
+
+    def close(self) -> None:
+        """
+        Close the connection.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def request(self, op: str, **params: Any) -> Any:
+        """
+        Send a request and wait for its result.
+
+        Parameters
+        ----------
+        op : str
+            Operation name.
+        **params
+            Operation parameters.
+
+        Returns
+        -------
+        object
+            Operation result.
+
+        Raises
+        ------
+        OSError
+            If the daemon cannot be reached or closes the connection.
+        DaemonError
+            If the daemon reports an error.
+        """
+        self.connect()
+        payload = dict(params, op=op)
+        try:
+            self._file.write(json.dumps(payload, ensure_ascii=False).encode('utf-8') + b'\n')
+            self._file.flush()
+            line = self._file.readline()
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise ConnectionError("Daemon closed the connection")
+
+        response = json.loads(line)
+        if not response.get('ok'):
+            raise DaemonError(
+                f"{response.get('type', 'Error')}: {response.get('error')}"
+            )
+        return response.get('result')
+
+    # ----------------------------------------------------------------------- #
+
+    def ping(self) -> Dict[str, Any]:
+        """
+        Check that the daemon is alive.
+
+        Returns
+        -------
+        dict
+            Daemon process id and default data path.
+        """
+        return self.request('ping')
+
+    def analyze_line(self, text: str, **params: Any) -> ChandaResult:
+        """
+        Identify meter from a single line (see ``ChandaService.analyze_line``).
+
+        Returns
+        -------
+        ChandaResult
+            Identification result for the line.
+        """
+        return ChandaResult.from_dict(self.request('analyze_line', text=text, **params))
+
+    def analyze_text(self, text: str, **params: Any) -> TextAnalysisResult:
+        """
+        Identify meters for multi-line text (see ``ChandaService.analyze_text``).
+
+        Returns
+        -------
+        TextAnalysisResult
+            Analysis results with line and verse results.
+        """
+        return TextAnalysisResult.from_dict(
+            self.request('analyze_text', text=text, **params)
+        )
+
+    def summary(self, text: str, **params: Any) -> Dict[str, Any]:
+        """
+        Compute summary statistics (see ``ChandaService.summary``).
+
+        Returns
+        -------
+        dict
+            Summary payload.
+        """
+        return self.request('summary', text=text, **params)
+
+    def meters(self, data_path: Optional[str] = None) -> MeterStats:
+        """
+        Get statistics about supported meters.
+
+        Returns
+        -------
+        MeterStats
+            Meter counts.
+        """
+        return MeterStats.from_dict(self.request('meters', data_path=data_path))
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the cache statistics of the daemon process.
+
+        Returns
+        -------
+        dict
+            Output of ``chanda.caches.cache_stats`` in the daemon.
+        """
+        return self.request('cache_stats')
+
+    def shutdown(self) -> None:
+        """
+        Ask the daemon to stop.
+        """
+        self.request('shutdown')
+        self.close()
+
+
+###############################################################################
+# Server
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Serve newline-delimited JSON requests on one connection.
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {'ok': False, 'error': str(e), 'type': type(e).__name__}
+            else:
+                if isinstance(request, dict) and request.get('op') == 'shutdown':
+                    self._respond({'ok': True, 'result': None})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                response = self.server.service.handle(request)
+            self._respond(response)
+
+    def _respond(self, response: Dict[str, Any]) -> None:
+        data = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        self.wfile.write(data + b'\n')
+        self.wfile.flush()
+
+
+class ChandaDaemon(
+    socketserver.ThreadingMixIn,
+    getattr(socketserver, 'UnixStreamServer', socketserver.TCPServer)
+):
+    """
+    Threaded Unix socket server backed by a ``ChandaService``.
+
+    Parameters
+    ----------
+    socket_path : str, optional
+        Socket path. Defaults to ``get_default_socket_path()``.
+    service : ChandaService, optional
+        Service to dispatch requests to. If ``None``, one is created for
+        ``data_path`` and ``language`` and its default analyzer is loaded
+        before serving.
+    data_path : str, optional
+        Meter definition data directory.
+    language : str, optional
+        Language for prosody analysis.
+
+    Raises
+    ------
+    ChandaError
+        If Unix sockets are unsupported, another daemon is listening on
+        ``socket_path``, or ``socket_path`` exists and is not a socket.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        service=None,
+        data_path: Optional[str] = None,
+        language: str = 'sanskrit'
+    ) -> None:
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ChandaError("Unix domain sockets are not supported on this platform")
+
+        self.socket_path = socket_path or get_default_socket_path()
+        if os.path.lexists(self.socket_path):
+            if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                raise ChandaError(f"Not a socket: {self.socket_path}")
+            try:
+                with DaemonClient(self.socket_path, timeout=1.0) as client:
+                    client.ping()
+            except (OSError, ValueError, DaemonError):
+                os.unlink(self.socket_path)  # stale socket
+            else:
+                raise ChandaError(f"Daemon already running on {self.socket_path}")
+
+        if service is None:
+            from .service import ChandaService
+            service = ChandaService(data_path=data_path, language=language)
+            service.get_analyzer()
+        self.service = service
+
+        super().__init__(self.socket_path, _DaemonRequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def run_daemon(
+    socket_path: Optional[str] = None,
+    data_path: Optional[str] = None,
+    language: str = 'sanskrit'
+) -> int:
+    """
+    Run the analysis daemon until it is shut down or interrupted.
+
+    Parameters
+    ----------
+    socket_path : str, optional
+        Socket path. Defaults to ``get_default_socket_path()``.
+    data_path : str, optional
+        Meter definition data directory.
+    language : str, optional
+        Language for prosody analysis.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    server = ChandaDaemon(socket_path, data_path=data_path, language=language)
+    print(f"chanda daemon listening on {server.socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+###############################################################################
@@ -119,13 +119,14 @@ def format_line_result(line_result) -> str:
         if jaati_list else "Unknown"
     )
 
+    unexpected_str = " [unexpected]" if line_result.get('unexpected') else ""
     output_lines = [
         line_result.get('line', ''),
         f"  Syllables: {syllables or '[]'}",
         f"  LG: {lg or '[]'}",
         f"  Ga\u1e47a: {gana}",
         f"  Counts: {length} syllables, {matra} morae",
-        f"  Chanda: {display_chanda}",
+        f"  Chanda: {display_chanda}{unexpected_str}",
         f"  J\u0101ti: {display_jaati}",
     ]
     if line_result.get('fuzzy'):
@@ -138,8 +139,9 @@ def format_line_result(line_result) -> str:
             format_chanda_list(best_match.get('chanda', []))
             if best_match.get('chanda') else "Not found"
         )
+        partial_str = " [partial]" if line_result.get('partial') else ""
         output_lines.extend([
-            f"  Fuzzy: {fuzzy_chanda} ({similarity_str})",
+            f"  Fuzzy: {fuzzy_chanda} ({similarity_str}){partial_str}",
             f"    {best_match['suggestion']}"
         ])
     return "\n".join(output_lines)
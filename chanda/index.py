@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Inverted index over analyzed corpora.
+
+This module provides ``CorpusIndex``, which ingests ``TextAnalysisResult``
+objects (one per document) and keeps postings from meter names, gaṇa
+strings, syllable lengths and mātrā counts to line ids, so that questions
+such as "all Vasantatilakā lines in book 3" are answered without running
+the analysis again or scanning saved results.
+
+Notes
+-----
+Line ids are assigned in ingestion order, so every posting list is a
+sorted ``array('I')`` and documents own contiguous id ranges. Boolean
+queries combine posting lists with ``intersect``, ``union`` and
+``difference`` in linear time.
+
+The laghu-guru string of every line is kept as well (one byte per
+syllable), for pattern search with ``chanda.search.ScansionSearch``.
+
+An index is saved as a single binary file: a JSON header (documents and
+the position of every posting list) followed by the raw arrays and the
+scansions. Posting lists of a loaded index are decoded on first use.
+
+Examples
+--------
+>>> index = CorpusIndex()
+>>> index.add(analyzer.analyze_text(text, verse=True), document='book3')
+>>> lines = index.find(chanda='वसन्ततिलका', document='book3')
+>>> index.locate(lines)
+"""
+
+import heapq
+import json
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .types import AnalysisResult, TextAnalysisResult
+
+###############################################################################
+
+MAGIC = b'CHANDAIX1\n'
+NO_VERSE = 0xFFFFFFFF
+
+# Fields with postings; ``document`` is answered from the id ranges
+FIELDS = (
+    'chanda',        # exactly matched meter
+    'fuzzy',         # meter of the best fuzzy match (lines without a match)
+    'gana',          # gaṇa string
+    'length',        # number of syllables
+    'matra',         # number of mātrās
+    'verse_chanda',  # best meter of the verse containing the line
+    'position',      # position of the line in its verse
+)
+
+Postings = array
+
+###############################################################################
+
+
+def intersect(*postings: Postings) -> Postings:
+    """
+    Intersect sorted posting lists.
+
+    Parameters
+    ----------
+    *postings : array
+        Sorted line ids.
+
+    Returns
+    -------
+    array
+        Ids present in every list.
+    """
+    if not postings:
+        return array('I')
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for other in postings[1:]:
+        merged = array('I')
+        i = j = 0
+        while i < len(result) and j < len(other):
+            if result[i] == other[j]:
+                merged.append(result[i])
+                i += 1
+                j += 1
+            elif result[i] < other[j]:
+                i += 1
+            else:
+                j += 1
+        result = merged
+    return result
+
+
+def union(*postings: Postings) -> Postings:
+    """
+    Merge sorted posting lists.
+
+    Parameters
+    ----------
+    *postings : array
+        Sorted line ids.
+
+    Returns
+    -------
+    array
+        Ids present in any list.
+    """
+    result = array('I')
+    for line_id in heapq.merge(*postings):
+        if not result or result[-1] != line_id:
+            result.append(line_id)
+    return result
+
+
+def difference(postings: Postings, exclude: Postings) -> Postings:
+    """
+    Remove the ids of one sorted posting list from another.
+
+    Parameters
+    ----------
+    postings : array
+        Sorted line ids.
+    exclude : array
+        Sorted line ids to remove.
+
+    Returns
+    -------
+    array
+        Ids of ``postings`` not in ``exclude``.
+    """
+    result = array('I')
+    j = 0
+    for line_id in postings:
+        while j < len(exclude) and exclude[j] < line_id:
+            j += 1
+        if j == len(exclude) or exclude[j] != line_id:
+            result.append(line_id)
+    return result
+
+
+###############################################################################
+
+
+class CorpusIndex:
+    """
+    Inverted index from meter properties to corpus lines.
+
+    Parameters
+    ----------
+    symbols : str, optional
+        Gaṇa symbols of the analyzer producing the results (as in
+        ``Chanda``); the last two are the laghu and guru symbols.
+
+    Attributes
+    ----------
+    documents : list[str]
+        Document names, in ingestion order.
+    """
+
+    def __init__(self, symbols: str = 'यरतनभजसमलग') -> None:
+        self.symbols = symbols
+        self._weights = str.maketrans({symbols[-2]: 'L', symbols[-1]: 'G'})
+        self.documents: List[str] = []
+        # Laghu-guru strings of the lines, separated by newlines
+        self._scansions = bytearray(b'\n')
+        # Line id ranges of the documents: document ``d`` owns
+        # ``[starts[d], starts[d + 1])``
+        self._starts = array('I', [0])
+        # Locator of every line id
+        self._verse = array('I')
+        self._line = array('I')
+        self._postings: Dict[str, Dict[Any, Postings]] = {
+            name: {} for name in FIELDS
+        }
+        # Undecoded posting lists of a loaded index: (offset, count)
+        self._buffer: Optional[bytes] = None
+        self._swap = False
+        self._pending: Dict[str, Dict[Any, Tuple[int, int]]] = {
+            name: {} for name in FIELDS
+        }
+
+    def __len__(self) -> int:
+        return len(self._line)
+
+    # ----------------------------------------------------------------------- #
+
+    def add(
+        self,
+        result: Union[TextAnalysisResult, AnalysisResult, Dict[str, Any]],
+        document: Optional[str] = None
+    ) -> int:
+        """
+        Index the lines of an analyzed document.
+
+        Parameters
+        ----------
+        result : TextAnalysisResult, AnalysisResult or dict
+            Analysis of the document (e.g. a saved result payload).
+        document : str, optional
+            Document name (default: its position, e.g. ``'0'``).
+
+        Returns
+        -------
+        int
+            Document id.
+
+        Raises
+        ------
+        ValueError
+            If a document with the same name is already indexed.
+        """
+        if isinstance(result, dict):
+            result = (
+                TextAnalysisResult.from_dict(result) if 'path' in result
+                else AnalysisResult.from_dict(result)
+            )
+        analysis = result.result if isinstance(result, TextAnalysisResult) else result
+        if isinstance(analysis, dict):
+            analysis = AnalysisResult.from_dict(analysis)
+
+        document = str(len(self.documents)) if document is None else document
+        if document in self.documents:
+            raise ValueError(f"Document {document!r} is already indexed")
+        self._decode_all()
+
+        base = len(self._line)
+        verses = {}
+        for verse_idx, verse_result in enumerate(analysis.verse):
+            names = verse_result.chanda[0] if verse_result.chanda else []
+            for position, line_idx in enumerate(verse_result.line_indices):
+                verses[line_idx] = (verse_idx, position, names)
+
+        for line_idx, line_result in enumerate(analysis.line):
+            line_id = base + line_idx
+            line = line_result.result
+            verse_idx, position, verse_names = verses.get(line_idx, (None, None, ()))
+            self._verse.append(NO_VERSE if verse_idx is None else verse_idx)
+            self._line.append(line_idx)
+            lg = ''.join(line.lg).translate(self._weights)
+            if lg.strip('LG'):
+                lg = ''
+            self._scansions.extend(lg.encode('ascii') + b'\n')
+
+            terms = [('chanda', name) for name in dict(line.chanda)]
+            if not line.found and line.fuzzy:
+                terms.extend(('fuzzy', name) for name in dict(line.fuzzy[0]['chanda']))
+            if line.gana:
+                terms.append(('gana', line.gana))
+            if line.length:
+                terms.append(('length', line.length))
+                terms.append(('matra', line.matra))
+            terms.extend(('verse_chanda', name) for name in verse_names)
+            if position is not None:
+                terms.append(('position', position))
+            for name, value in dict.fromkeys(terms):
+                self._postings[name].setdefault(value, array('I')).append(line_id)
+
+        self.documents.append(document)
+        self._starts.append(len(self._line))
+        return len(self.documents) - 1
+
+    # ----------------------------------------------------------------------- #
+
+    def values(self, name: str) -> List[Any]:
+        """
+        List the indexed values of a field.
+
+        Parameters
+        ----------
+        name : str
+            Field name (see ``FIELDS``) or ``'document'``.
+
+        Returns
+        -------
+        list
+            Values in sorted order.
+        """
+        if name == 'document':
+            return sorted(self.documents)
+        return sorted(set(self._postings[name]) | set(self._pending[name]))
+
+    def postings(self, name: str, value: Any) -> Postings:
+        """
+        Line ids with a value of a field.
+
+        Parameters
+        ----------
+        name : str
+            Field name (see ``FIELDS``) or ``'document'``.
+        value : object
+            Field value (meter name, gaṇa string, count or document name).
+
+        Returns
+        -------
+        array
+            Sorted line ids (empty if the value is not indexed).
+
+        Raises
+        ------
+        KeyError
+            If ``name`` is not a field.
+        """
+        if name == 'document':
+            if value not in self.documents:
+                return array('I')
+            doc_id = self.documents.index(value)
+            return array('I', range(self._starts[doc_id], self._starts[doc_id + 1]))
+        if name not in self._postings:
+            raise KeyError(f"Unknown field: {name!r}")
+        postings = self._postings[name].get(value)
+        if postings is None and value in self._pending[name]:
+            postings = self._decode(name, value)
+        return postings if postings is not None else array('I')
+
+    def find(
+        self,
+        exclude: Optional[Dict[str, Any]] = None,
+        **terms: Any
+    ) -> Postings:
+        """
+        Find lines matching all terms.
+
+        Parameters
+        ----------
+        exclude : dict, optional
+            Terms whose lines are removed from the result.
+        **terms
+            Field values to match (see ``FIELDS`` and ``document``). A
+            list, tuple or set matches any of its values.
+
+        Returns
+        -------
+        array
+            Sorted line ids. Without terms, all lines.
+
+        Examples
+        --------
+        >>> index.find(chanda='मालिनी', length=[15, 16], document='book3')
+        """
+        def matching(name, value):
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return union(*(self.postings(name, v) for v in value))
+            return self.postings(name, value)
+
+        if terms:
+            result = intersect(*(matching(name, value) for name, value in terms.items()))
+        else:
+            result = array('I', range(len(self)))
+        for name, value in (exclude or {}).items():
+            result = difference(result, matching(name, value))
+        return result
+
+    def locate(self, line_ids: Iterable[int]) -> List[Tuple[str, Optional[int], int]]:
+        """
+        Resolve line ids.
+
+        Parameters
+        ----------
+        line_ids : iterable of int
+            Line ids (e.g. from ``find``).
+
+        Returns
+        -------
+        list[tuple[str, int or None, int]]
+            ``(document, verse, line)`` per id: document name, verse
+            index in the document (``None`` outside verses) and line
+            index in the document.
+        """
+        located = []
+        for line_id in line_ids:
+            doc_id = self._document_id(line_id)
+            verse_idx = self._verse[line_id]
+            located.append((
+                self.documents[doc_id],
+                None if verse_idx == NO_VERSE else verse_idx,
+                self._line[line_id]
+            ))
+        return located
+
+    def verses(self, line_ids: Iterable[int]) -> List[Tuple[str, int]]:
+        """
+        Verses containing any of the given lines.
+
+        Parameters
+        ----------
+        line_ids : iterable of int
+            Line ids (e.g. from ``find``).
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            Unique ``(document, verse)`` pairs in corpus order. Combine
+            the results of several queries with set operations, e.g. for
+            verses whose first two lines are Mālinī.
+        """
+        return list(dict.fromkeys(
+            (document, verse_idx)
+            for document, verse_idx, _ in self.locate(line_ids)
+            if verse_idx is not None
+        ))
+
+    def scansions(self) -> bytes:
+        """
+        Laghu-guru strings of all lines.
+
+        Returns
+        -------
+        bytes
+            ``L``/``G`` string of every line in id order, each preceded and
+            followed by a newline (lines without scansion are empty).
+        """
+        return bytes(self._scansions)
+
+    def _document_id(self, line_id: int) -> int:
+        """
+        Document id of a line id (binary search over the id ranges).
+        """
+        lo, hi = 0, len(self.documents) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._starts[mid] <= line_id:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    # ----------------------------------------------------------------------- #
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a file.
+
+        Parameters
+        ----------
+        path : str
+            Output path.
+        """
+        self._decode_all()
+        arrays = [self._starts, self._verse, self._line]
+        fields = {}
+        offset = sum(len(a) for a in arrays)
+        for name, postings in self._postings.items():
+            fields[name] = []
+            for value in sorted(postings, key=lambda v: (str(type(v)), v)):
+                fields[name].append([value, offset, len(postings[value])])
+                arrays.append(postings[value])
+                offset += len(postings[value])
+
+        header = json.dumps({
+            'symbols': self.symbols,
+            'documents': self.documents,
+            'lines': len(self),
+            'scansions': offset,
+            'byteorder': sys.byteorder,
+            'fields': fields,
+        }, ensure_ascii=False).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            f.write(b'\0' * (-(len(MAGIC) + 8 + len(header)) % 4))
+            for values in arrays:
+                f.write(values.tobytes())
+            f.write(self._scansions)
+
+    @classmethod
+    def load(cls, path: str) -> 'CorpusIndex':
+        """
+        Read an index written by ``save``.
+
+        Parameters
+        ----------
+        path : str
+            Index path.
+
+        Returns
+        -------
+        CorpusIndex
+            Index; posting lists are decoded on first use.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a corpus index.
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Not a corpus index: {path}")
+        (size,) = struct.unpack_from('<Q', data, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(data[start:start + size].decode('utf-8'))
+        start += size + (-(start + size) % 4)
+
+        index = cls(header['symbols'])
+        index.documents = header['documents']
+        index._buffer = data[start:]
+        index._swap = header['byteorder'] != sys.byteorder
+        lines = header['lines']
+        index._starts = index._read(0, len(index.documents) + 1)
+        index._verse = index._read(len(index.documents) + 1, lines)
+        index._line = index._read(len(index.documents) + 1 + lines, lines)
+        index._scansions = bytearray(
+            index._buffer[header['scansions'] * index._verse.itemsize:]
+        )
+        for name, entries in header['fields'].items():
+            index._pending[name] = {
+                value: (offset, count) for value, offset, count in entries
+            }
+        return index
+
+    def _read(self, offset: int, count: int) -> Postings:
+        """
+        Decode ``count`` integers at an offset of the loaded buffer.
+        """
+        values = array('I')
+        values.frombytes(
+            self._buffer[offset * values.itemsize:(offset + count) * values.itemsize]
+        )
+        if self._swap:
+            values.byteswap()
+        return values
+
+    def _decode(self, name: str, value: Any) -> Postings:
+        """
+        Decode a pending posting list of a loaded index.
+        """
+        offset, count = self._pending[name].pop(value)
+        postings = self._postings[name][value] = self._read(offset, count)
+        return postings
+
+    def _decode_all(self) -> None:
+        """
+        Decode all pending posting lists (before the index is modified).
+        """
+        for name, pending in self._pending.items():
+            for value in list(pending):
+                self._decode(name, value)
+        self._buffer = None
+
+
+###############################################################################
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+As-you-type meter matching.
+
+This module provides ``SignatureTrie``, a trie over laghu-guru signatures
+of single pādas, and ``PrefixMatcher``, which scans a pāda while it is
+being typed and reports the meters still consistent with it.
+
+Notes
+-----
+Wildcard positions (``[LG]``) are inserted into the trie as branches on
+both weights, so walking a prefix is a single step per syllable. Every
+node lists the signatures passing through it, so the candidates of a
+prefix are read off its node.
+
+``PrefixMatcher`` only re-scans the last syllables of the text on every
+update: a syllable's weight depends only on itself and on the onset of
+the next syllable, which is fixed once a further syllable follows. Such
+syllables are settled and kept along with their trie node.
+
+Examples
+--------
+>>> matcher = chanda.prefix_matcher()
+>>> matcher.update("धर्मक्षेत्रे कु")
+>>> [c['chanda'] for c in matcher.candidates() if c['remaining'] == 4]
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+###############################################################################
+
+ROOT = 0
+
+###############################################################################
+
+
+class SignatureTrie:
+    """
+    Trie over laghu-guru signatures.
+
+    Parameters
+    ----------
+    signatures : dict
+        Mapping of signature (possibly with ``[LG]`` wildcards) to its
+        meters, e.g. ``Chanda.SINGLE_CHANDA``.
+    L : str, optional
+        Laghu symbol.
+    G : str, optional
+        Guru symbol.
+    """
+
+    def __init__(
+        self,
+        signatures: Dict[str, List[Tuple[str, Tuple]]],
+        L: str = 'L',
+        G: str = 'G'
+    ) -> None:
+        self.L = L
+        self.G = G
+        self.signatures = list(signatures)
+        self.meters = [signatures[signature] for signature in self.signatures]
+        token = re.compile(r'\[[^\]]*\]|.')
+        self.tokens = [tuple(token.findall(s)) for s in self.signatures]
+
+        self.children: List[Dict[str, int]] = [{}]
+        self.depth: List[int] = [0]
+        self.passing: List[List[int]] = [list(range(len(self.signatures)))]
+        for sid, tokens in enumerate(self.tokens):
+            frontier = [ROOT]
+            for token in tokens:
+                frontier = list(dict.fromkeys(
+                    self._child(node, weight)
+                    for node in frontier
+                    for weight in token.strip('[]')
+                ))
+                for node in frontier:
+                    self.passing[node].append(sid)
+
+    def _child(self, node: int, weight: str) -> int:
+        """
+        Get or create the child of a node for a weight.
+        """
+        child = self.children[node].get(weight)
+        if child is None:
+            child = len(self.children)
+            self.children[node][weight] = child
+            self.children.append({})
+            self.depth.append(self.depth[node] + 1)
+            self.passing.append([])
+        return child
+
+    # ----------------------------------------------------------------------- #
+
+    def step(self, node: Optional[int], weight: str) -> Optional[int]:
+        """
+        Follow one syllable weight.
+
+        Parameters
+        ----------
+        node : int or None
+            Current node (``None`` if no signature is consistent).
+        weight : str
+            Laghu or guru symbol.
+
+        Returns
+        -------
+        int or None
+            Next node, or ``None`` if no signature continues with
+            ``weight``.
+        """
+        if node is None:
+            return None
+        return self.children[node].get(weight)
+
+    def walk(self, lg: Sequence[str], node: Optional[int] = ROOT) -> Optional[int]:
+        """
+        Follow a sequence of syllable weights.
+
+        Parameters
+        ----------
+        lg : sequence of str
+            Laghu-guru string or marks.
+        node : int, optional
+            Start node (default: root).
+
+        Returns
+        -------
+        int or None
+            Node reached, or ``None`` if no signature is consistent.
+        """
+        for weight in lg:
+            node = self.step(node, weight)
+        return node
+
+    def candidates(
+        self,
+        lg: Sequence[str],
+        node: Optional[int] = ROOT
+    ) -> List[Dict[str, Any]]:
+        """
+        List the signatures consistent with a prefix.
+
+        Parameters
+        ----------
+        lg : sequence of str
+            Laghu-guru marks of the prefix (after ``node``).
+        node : int, optional
+            Node of the part of the prefix before ``lg`` (default: root).
+
+        Returns
+        -------
+        list[dict]
+            Candidates in definition order, each with ``signature``,
+            ``chanda`` (meters), ``next`` (expected weight of the next
+            syllable: laghu, guru or a wildcard class; ``''`` when
+            complete), ``remaining`` (syllables left) and ``complete``.
+            As in exact matching, a final laghu also completes signatures
+            ending in guru.
+        """
+        parent = None
+        for weight in lg:
+            parent, node = node, self.step(node, weight)
+
+        found = {}
+        if node is not None:
+            depth = self.depth[node]
+            for sid in self.passing[node]:
+                tokens = self.tokens[sid]
+                remaining = len(tokens) - depth
+                found[sid] = {
+                    'signature': self.signatures[sid],
+                    'chanda': self.meters[sid],
+                    'next': tokens[depth] if remaining else '',
+                    'remaining': remaining,
+                    'complete': not remaining,
+                }
+        if lg and lg[-1] == self.L:
+            alternative = self.step(parent, self.G)
+            if alternative is not None:
+                depth = self.depth[alternative]
+                for sid in self.passing[alternative]:
+                    if sid not in found and len(self.tokens[sid]) == depth:
+                        found[sid] = {
+                            'signature': self.signatures[sid],
+                            'chanda': self.meters[sid],
+                            'next': '',
+                            'remaining': 0,
+                            'complete': True,
+                        }
+        return [found[sid] for sid in sorted(found)]
+
+
+###############################################################################
+
+
+class PrefixMatcher:
+    """
+    Incremental matcher for a pāda being typed.
+
+    Parameters
+    ----------
+    chanda : Chanda
+        Analyzer providing scansion and the signature trie.
+
+    Attributes
+    ----------
+    text : str
+        Text typed so far (Devanāgarī).
+
+    Notes
+    -----
+    Updates re-scan only the text from the last unsettled syllable on, so
+    the cost per keystroke does not grow with the length of the pāda.
+    """
+
+    def __init__(self, chanda) -> None:
+        self.chanda = chanda
+        self.trie = chanda.prefix_trie()
+        self.text = ''
+        # Settled syllables: start offsets in ``text``, weights (``''``
+        # for syllables without weight) and trie node after each of them
+        self._starts: List[int] = []
+        self._marks: List[str] = []
+        self._nodes: List[Optional[int]] = [ROOT]
+        # Unsettled tail: start offset and weights
+        self._offset = 0
+        self._tail: List[str] = []
+
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def lg(self) -> str:
+        """
+        Laghu-guru string of the text typed so far.
+        """
+        return ''.join(self._marks) + ''.join(self._tail)
+
+    def update(self, text: str) -> 'PrefixMatcher':
+        """
+        Replace the typed text (e.g. the contents of an input field).
+
+        Parameters
+        ----------
+        text : str
+            New text. Appended text is scanned incrementally; on other
+            edits, syllables after the first changed character are
+            scanned again.
+
+        Returns
+        -------
+        PrefixMatcher
+            The matcher itself.
+        """
+        common = 0
+        limit = min(len(text), len(self.text))
+        while common < limit and text[common] == self.text[common]:
+            common += 1
+        if common < len(self.text):
+            self._truncate(common)
+        self.text = text
+        self._rescan()
+        return self
+
+    def append(self, text: str) -> 'PrefixMatcher':
+        """
+        Append typed text.
+
+        Parameters
+        ----------
+        text : str
+            Text to append.
+
+        Returns
+        -------
+        PrefixMatcher
+            The matcher itself.
+        """
+        self.text += text
+        self._rescan()
+        return self
+
+    def reset(self) -> 'PrefixMatcher':
+        """
+        Start a new pāda.
+
+        Returns
+        -------
+        PrefixMatcher
+            The matcher itself.
+        """
+        self.__init__(self.chanda)
+        return self
+
+    def candidates(self) -> List[Dict[str, Any]]:
+        """
+        List the meters still consistent with the typed text.
+
+        Returns
+        -------
+        list[dict]
+            Candidates as returned by ``SignatureTrie.candidates``.
+        """
+        tail = [mark for mark in self._tail if mark]
+        return self.trie.candidates(tail, node=self._nodes[-1])
+
+    # ----------------------------------------------------------------------- #
+
+    def _truncate(self, length: int) -> None:
+        """
+        Drop the syllables whose weight may depend on text after ``length``.
+        """
+        starts = self._starts + [self._offset]
+        keep = len(self._starts)
+        # Syllable ``i`` is settled by the onset of syllable ``i + 1``,
+        # which ends before syllable ``i + 2`` starts; text inserted right
+        # at that start (e.g. a virāma) still extends the onset
+        while keep and (keep + 1 >= len(starts) or starts[keep + 1] >= length):
+            keep -= 1
+        if keep < len(self._starts):
+            # Text before the first syllable (e.g. spaces) is scanned again
+            # along with it
+            self._offset = self._starts[keep] if keep else 0
+            del self._starts[keep:]
+            del self._marks[keep:]
+            del self._nodes[keep + 1:]
+        self._tail = []
+
+    def _rescan(self) -> None:
+        """
+        Scan the unsettled tail and settle all but its last syllables.
+        """
+        tail = self.text[self._offset:]
+        scan = self.chanda._scan_line(tail)
+        if scan is None:
+            self._tail = []
+            return
+
+        syllables = scan['syllables']
+        marks = scan['lg_marks']
+        weighted = [idx for idx, mark in enumerate(marks) if mark]
+        # The onset of the last weighted syllable may still grow (e.g. a
+        # virāma after an inherent vowel), so keep the last two weighted
+        # syllables and anything after them unsettled
+        settle = weighted[-2] if len(weighted) > 1 else 0
+
+        starts = []
+        position = 0
+        for syllable in syllables[:settle + 1]:
+            found = tail.find(syllable, position)
+            if found < 0:
+                break
+            starts.append(found)
+            position = found + len(syllable)
+        settle = min(settle, len(starts) - 1)
+
+        for idx in range(settle):
+            node = self._nodes[-1]
+            self._starts.append(self._offset + starts[idx])
+            self._marks.append(marks[idx])
+            self._nodes.append(
+                self.trie.step(node, marks[idx]) if marks[idx] else node
+            )
+        if settle > 0:
+            self._offset += starts[settle]
+            marks = marks[settle:]
+        self._tail = marks
+
+
+###############################################################################
@@ -7,6 +7,7 @@ This module provides helpers for normalizing input text, detecting
 transliteration schemes, and returning cleaned Devanagari lines.
 """
 
+import re
 import functools
 from typing import Tuple, List
 
@@ -15,8 +16,14 @@ from indic_transliteration import sanscript
 from indic_transliteration.detect import detect
 from indic_transliteration.sanscript import transliterate
 
+from .caches import sized
 from .constants import MAX_CACHE
 
+# Line separators; daṇḍa markers are captured to record verse boundaries
+LINE_SPLIT_PATTERN = re.compile(r"([।॥\r\n]+)")
+SINGLE_DANDA = "।"
+DOUBLE_DANDA = "॥"
+
 
 class SanskritTextProcessor:
     """
@@ -29,6 +36,7 @@ class SanskritTextProcessor:
 
     @staticmethod
     @functools.lru_cache(maxsize=MAX_CACHE)
+    @sized('SanskritTextProcessor.process_and_detect_scheme')
     def process_and_detect_scheme(text: str) -> Tuple[List[str], str]:
         """
         Process input text and detect transliteration scheme.
@@ -45,11 +53,7 @@ class SanskritTextProcessor:
         str
             Detected transliteration scheme for the original input.
         """
-        scheme = detect(text)
-        if scheme != sanscript.DEVANAGARI:
-            devanagari_text = transliterate(text, scheme, sanscript.DEVANAGARI)
-        else:
-            devanagari_text = text
+        scheme, devanagari_text = SanskritTextProcessor._to_devanagari(text)
 
         lines = []
         for line in skt.split_lines(devanagari_text):
@@ -57,3 +61,74 @@ class SanskritTextProcessor:
             if clean_line:
                 lines.append(clean_line)
         return lines, scheme
+
+    @staticmethod
+    @functools.lru_cache(maxsize=MAX_CACHE)
+    @sized('SanskritTextProcessor.process_and_detect_markers')
+    def process_and_detect_markers(text: str) -> Tuple[List[str], str, List[str]]:
+        """
+        Process input text and record the daṇḍa marker ending each line.
+
+        Parameters
+        ----------
+        text : str
+            Input Sanskrit text in any supported scheme.
+
+        Returns
+        -------
+        list[str]
+            Cleaned Devanagari lines, identical to
+            ``process_and_detect_scheme``.
+        str
+            Detected transliteration scheme for the original input.
+        list[str]
+            Marker following each line: ``'॥'``, ``'।'`` or ``''``.
+            Markers separated from their line by content that is removed
+            during cleaning (e.g. verse numbers) are attached to the
+            preceding line.
+        """
+        scheme, devanagari_text = SanskritTextProcessor._to_devanagari(text)
+
+        lines = []
+        markers = []
+        pieces = LINE_SPLIT_PATTERN.split(devanagari_text)
+        for idx in range(0, len(pieces), 2):
+            separator = pieces[idx + 1] if idx + 1 < len(pieces) else ''
+            if DOUBLE_DANDA in separator:
+                marker = DOUBLE_DANDA
+            elif SINGLE_DANDA in separator:
+                marker = SINGLE_DANDA
+            else:
+                marker = ''
+
+            clean_line = skt.clean(pieces[idx]).strip()
+            if clean_line:
+                lines.append(clean_line)
+                markers.append(marker)
+            elif markers and marker and markers[-1] != DOUBLE_DANDA:
+                markers[-1] = marker
+        return lines, scheme, markers
+
+    @staticmethod
+    def _to_devanagari(text: str) -> Tuple[str, str]:
+        """
+        Detect the input scheme and transliterate text to Devanagari.
+
+        Parameters
+        ----------
+        text : str
+            Input Sanskrit text in any supported scheme.
+
+        Returns
+        -------
+        str
+            Detected transliteration scheme.
+        str
+            Text in Devanagari.
+        """
+        scheme = detect(text)
+        if scheme != sanscript.DEVANAGARI:
+            devanagari_text = transliterate(text, scheme, sanscript.DEVANAGARI)
+        else:
+            devanagari_text = text
+        return scheme, devanagari_text
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stage-level timing instrumentation for Chandojñānam.
+
+This module records wall time and call counts for the stages of meter
+identification (text processing, scansion, lookup, wildcard matching,
+fuzzy search, verse aggregation and output formatting) and forwards
+each measurement to optional hooks.
+
+Notes
+-----
+Instrumentation is attached to a ``Chanda`` instance with
+``Chanda.enable_instrumentation``. While it is disabled, an instrumented
+method costs one attribute check per call.
+
+Stage times are inclusive: ``transform`` is also counted in ``fuzzy``,
+and all stages of a line are contained in the caller's wall time.
+
+Examples
+--------
+>>> instrumentation = chanda.enable_instrumentation()
+>>> chanda.analyze_text(text, verse=True, fuzzy=True)
+>>> print(format_stats(chanda.stats()))
+"""
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+###############################################################################
+
+# Stage names, in pipeline order
+STAGES = (
+    'process_text',
+    'scansion',
+    'lookup',
+    'wildcard',
+    'fuzzy',
+    'transform',
+    'verse',
+    'format',
+)
+
+# Hook signature: hook(stage, elapsed_ms)
+StageHook = Callable[[str, float], None]
+
+###############################################################################
+
+
+class Instrumentation:
+    """
+    Per-stage wall time and call count recorder.
+
+    Parameters
+    ----------
+    hooks : iterable of callable, optional
+        Callables invoked as ``hook(stage, elapsed_ms)`` after each
+        recorded stage call.
+
+    Notes
+    -----
+    Recording is thread-safe. Hooks run in the thread that executed the
+    stage and must be cheap; exceptions raised by hooks propagate to the
+    caller.
+    """
+
+    def __init__(self, hooks: Optional[Iterable[StageHook]] = None) -> None:
+        self.hooks: List[StageHook] = list(hooks or [])
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+        self._total: Dict[str, float] = {}
+        self._max: Dict[str, float] = {}
+
+    # ----------------------------------------------------------------------- #
+
+    def add_hook(self, hook: StageHook) -> None:
+        """
+        Register a hook.
+
+        Parameters
+        ----------
+        hook : callable
+            Callable invoked as ``hook(stage, elapsed_ms)``.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: StageHook) -> None:
+        """
+        Unregister a hook.
+
+        Parameters
+        ----------
+        hook : callable
+            Previously registered hook.
+        """
+        self.hooks.remove(hook)
+
+    # ----------------------------------------------------------------------- #
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """
+        Record one call of a stage.
+
+        Parameters
+        ----------
+        stage : str
+            Stage name.
+        elapsed_ms : float
+            Wall time of the call in milliseconds.
+        """
+        with self._lock:
+            self._calls[stage] = self._calls.get(stage, 0) + 1
+            self._total[stage] = self._total.get(stage, 0.0) + elapsed_ms
+            if elapsed_ms > self._max.get(stage, 0.0):
+                self._max[stage] = elapsed_ms
+        for hook in self.hooks:
+            hook(stage, elapsed_ms)
+
+    def reset(self) -> None:
+        """
+        Clear all recorded measurements (hooks are kept).
+        """
+        with self._lock:
+            self._calls.clear()
+            self._total.clear()
+            self._max.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Snapshot of the recorded measurements.
+
+        Returns
+        -------
+        dict
+            Mapping of stage name to ``calls``, ``total_ms``, ``mean_ms``
+            and ``max_ms``, in pipeline order. Stages that were never
+            called are omitted.
+        """
+        with self._lock:
+            stages = [s for s in STAGES if s in self._calls]
+            stages += sorted(set(self._calls) - set(STAGES))
+            return {
+                stage: {
+                    'calls': self._calls[stage],
+                    'total_ms': round(self._total[stage], 3),
+                    'mean_ms': round(self._total[stage] / self._calls[stage], 3),
+                    'max_ms': round(self._max[stage], 3),
+                }
+                for stage in stages
+            }
+
+
+###############################################################################
+
+
+def instrumented(stage: str) -> Callable:
+    """
+    Decorate a ``Chanda`` method so that its calls are recorded as a stage.
+
+    Parameters
+    ----------
+    stage : str
+        Stage name.
+
+    Returns
+    -------
+    callable
+        Method decorator. The decorated method reads the instance's
+        ``instrumentation`` attribute and calls through directly when it
+        is ``None``.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            instrumentation = self.instrumentation
+            if instrumentation is None:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                instrumentation.record(
+                    stage, (time.perf_counter() - start) * 1000
+                )
+        return wrapper
+    return decorator
+
+
+def format_stats(stats: Dict[str, Dict[str, float]]) -> str:
+    """
+    Render a stage statistics snapshot as a table.
+
+    Parameters
+    ----------
+    stats : dict
+        Output of ``Instrumentation.stats``.
+
+    Returns
+    -------
+    str
+        Plain-text table with one row per stage.
+    """
+    header = f"{'Stage':<14}{'Calls':>10}{'Total (ms)':>14}{'Mean (ms)':>12}{'Max (ms)':>12}"
+    rows = [header, '-' * len(header)]
+    for stage, values in stats.items():
+        rows.append(
+            f"{stage:<14}{values['calls']:>10}{values['total_ms']:>14.3f}"
+            f"{values['mean_ms']:>12.3f}{values['max_ms']:>12.3f}"
+        )
+    return '\n'.join(rows)
+
+
+###############################################################################
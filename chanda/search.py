@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Laghu-guru pattern search over an indexed corpus.
+
+This module provides ``ScansionSearch``, which finds the lines of a
+``CorpusIndex`` whose scansion contains (or equals) a pattern written in
+gaṇa or laghu-guru notation, with ``-`` for either weight (the syntax of
+the lakṣaṇa column of the definition files), optionally within a number
+of syllable edits.
+
+Notes
+-----
+A suffix array over the laghu-guru strings of all lines (joined with
+newlines) is sorted once. A pattern is then matched by narrowing a range
+of the suffix array one syllable at a time with binary searches, so
+exact queries cost ``O(m log n)`` for a pattern of ``m`` syllables plus
+the size of the output, independent of the number of lines. Wildcards
+branch into both weights; edit tolerance backtracks over substitutions,
+insertions and deletions (unit costs, as in fuzzy matching), which grows
+with the tolerance but still only visits suffixes sharing a prefix with
+a pattern variant.
+
+Suffixes are sorted only up to the end of their line, since matches never
+cross lines; this keeps the sort keys short.
+
+Examples
+--------
+>>> search = ScansionSearch(index, analyzer)
+>>> search.search('तभजजगग', whole=True)
+>>> search.lines('LGL-GG', max_edits=1)
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+###############################################################################
+
+SEPARATOR = ord('\n')
+WEIGHTS = (ord('G'), ord('L'))
+
+###############################################################################
+
+
+class ScansionSearch:
+    """
+    Pattern search over the scansions of a corpus index.
+
+    Parameters
+    ----------
+    index : CorpusIndex
+        Indexed corpus. Lines added to it later are not searched; create
+        a new search object instead.
+    analyzer : Chanda
+        Analyzer whose gaṇa symbols and ``gana_to_lg`` parse patterns.
+    """
+
+    def __init__(self, index, analyzer) -> None:
+        self.index = index
+        self.analyzer = analyzer
+        self.text = index.scansions()
+        # Positions of the newlines; line ``k`` lies between the newlines
+        # ``k`` and ``k + 1``
+        self.separators = array('I', (
+            idx for idx, char in enumerate(self.text) if char == SEPARATOR
+        ))
+        self.suffixes = self._sort_suffixes()
+        # The suffix of the final newline alone sorts first and reads a
+        # zero byte past it
+        self._padded = self.text + b'\0'
+
+    def _sort_suffixes(self) -> array:
+        """
+        Sort the suffixes of the scansion text, each cut at its line end.
+        """
+        text = self.text
+        keys = []
+        separators = self.separators
+        for k in range(len(separators) - 1):
+            start, end = separators[k], separators[k + 1] + 1
+            # The newline before a line starts the suffix of the whole line
+            keys.extend(text[idx:end] for idx in range(start, end - 1))
+        keys.append(text[-1:])
+        return array('I', sorted(range(len(text)), key=keys.__getitem__))
+
+    # ----------------------------------------------------------------------- #
+
+    def parse(self, pattern: str) -> List[Tuple[int, ...]]:
+        """
+        Parse a gaṇa or laghu-guru pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Pattern in the gaṇa symbols of the analyzer (e.g. ``'तभजजगग'``)
+            or laghu-guru notation, with ``-`` (or ``[LG]``) for either
+            weight. Whitespace is ignored.
+
+        Returns
+        -------
+        list[tuple[int, ...]]
+            Allowed byte values per syllable.
+
+        Raises
+        ------
+        ValueError
+            If the pattern contains other symbols.
+        """
+        analyzer = self.analyzer
+        lg_str = ''.join(pattern.split()).translate(analyzer.ttable_in)
+        lg_str = analyzer.gana_to_lg(lg_str)
+        lg_str = lg_str.replace(f"[{analyzer.L}{analyzer.G}]", '-')
+        tokens = []
+        for char in lg_str:
+            if char == analyzer.L:
+                tokens.append((ord('L'),))
+            elif char == analyzer.G:
+                tokens.append((ord('G'),))
+            elif char == '-':
+                tokens.append(WEIGHTS)
+            else:
+                raise ValueError(f"Invalid pattern: {pattern!r}")
+        if not tokens:
+            raise ValueError(f"Invalid pattern: {pattern!r}")
+        return tokens
+
+    def search(
+        self,
+        pattern: str,
+        max_edits: int = 0,
+        whole: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find lines matching a pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Gaṇa or laghu-guru pattern (see ``parse``).
+        max_edits : int, optional
+            Maximum number of syllable substitutions, insertions and
+            deletions.
+        whole : bool, optional
+            Match whole lines instead of substrings.
+        limit : int, optional
+            Maximum number of lines to return.
+
+        Returns
+        -------
+        list[dict]
+            One match per line, with the fewest edits first: ``line``
+            (line id in the index), ``document``, ``verse`` and
+            ``line_index`` (see ``CorpusIndex.locate``), ``offset`` and
+            ``length`` of the matched syllables, and ``edits``.
+        """
+        tokens = self.parse(pattern)
+        if whole:
+            tokens = [(SEPARATOR,)] + tokens + [(SEPARATOR,)]
+
+        best: Dict[int, Tuple[int, int, int]] = {}
+        for position, length, edits in self._match(tokens, max_edits):
+            k = bisect_right(self.separators, position) - 1
+            line_id = k
+            offset = position - self.separators[k] - 1
+            if whole:
+                offset, length = 0, length - 2
+            key = (edits, offset, length)
+            if line_id not in best or key < best[line_id]:
+                best[line_id] = key
+
+        ranked = sorted(best.items(), key=lambda item: (item[1][0], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        located = self.index.locate(line_id for line_id, _ in ranked)
+        return [
+            {
+                'line': line_id,
+                'document': document,
+                'verse': verse,
+                'line_index': line_index,
+                'offset': offset,
+                'length': length,
+                'edits': edits,
+            }
+            for (line_id, (edits, offset, length)), (document, verse, line_index)
+            in zip(ranked, located)
+        ]
+
+    def lines(self, pattern: str, max_edits: int = 0, whole: bool = False) -> array:
+        """
+        Ids of the lines matching a pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Gaṇa or laghu-guru pattern (see ``parse``).
+        max_edits : int, optional
+            Maximum number of syllable edits.
+        whole : bool, optional
+            Match whole lines instead of substrings.
+
+        Returns
+        -------
+        array
+            Sorted line ids, to combine with ``CorpusIndex.find`` results.
+        """
+        return array('I', sorted(
+            match['line'] for match in self.search(pattern, max_edits, whole)
+        ))
+
+    # ----------------------------------------------------------------------- #
+
+    def _narrow(self, lo: int, hi: int, depth: int, char: int) -> Tuple[int, int]:
+        """
+        Sub-range of suffixes ``lo:hi`` with ``char`` at ``depth``.
+
+        All suffixes in the range share their first ``depth`` bytes, none
+        of which ends a line, so they are sorted by the byte at ``depth``.
+        """
+        text = self._padded
+        suffixes = self.suffixes
+        a, b = lo, hi
+        while a < b:
+            mid = (a + b) // 2
+            if text[suffixes[mid] + depth] < char:
+                a = mid + 1
+            else:
+                b = mid
+        start = a
+        b = hi
+        while a < b:
+            mid = (a + b) // 2
+            if text[suffixes[mid] + depth] <= char:
+                a = mid + 1
+            else:
+                b = mid
+        return start, a
+
+    def _match(
+        self,
+        tokens: List[Tuple[int, ...]],
+        max_edits: int
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Backtracking search of a parsed pattern.
+
+        Returns
+        -------
+        list[tuple[int, int, int]]
+            ``(position, length, edits)`` of every match found.
+        """
+        matches = []
+        stack = [(0, 0, 0, len(self.suffixes), 0)]
+        seen = set()
+        while stack:
+            state = stack.pop()
+            if state in seen:
+                continue
+            seen.add(state)
+            j, depth, lo, hi, edits = state
+            if j == len(tokens):
+                if depth:
+                    matches.extend(
+                        (self.suffixes[idx], depth, edits) for idx in range(lo, hi)
+                    )
+                continue
+
+            allowed = tokens[j]
+            if allowed == (SEPARATOR,):
+                a, b = self._narrow(lo, hi, depth, SEPARATOR)
+                if a < b:
+                    stack.append((j + 1, depth + 1, a, b, edits))
+            else:
+                for char in WEIGHTS:
+                    cost = 0 if char in allowed else 1
+                    if edits + cost > max_edits:
+                        continue
+                    a, b = self._narrow(lo, hi, depth, char)
+                    if a < b:
+                        stack.append((j + 1, depth + 1, a, b, edits + cost))
+                if edits < max_edits:
+                    # Pattern syllable missing from the line
+                    stack.append((j + 1, depth, lo, hi, edits + 1))
+            if edits < max_edits and depth:
+                # Extra syllable in the line (not before the match starts)
+                for char in WEIGHTS:
+                    a, b = self._narrow(lo, hi, depth, char)
+                    if a < b:
+                        stack.append((j, depth + 1, a, b, edits + 1))
+        return matches
+
+
+###############################################################################
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP JSON service for Chandojñānam.
+
+This module provides a small threaded HTTP server (standard library only)
+backed by one preloaded ``ChandaService``. Line requests that arrive
+within a short window are micro-batched into a single
+``ChandaService.analyze_lines`` call, connections are kept alive
+(HTTP/1.1), and per-endpoint latency histograms are reported.
+
+Notes
+-----
+Endpoints:
+
+- ``POST /analyze_line``: ``{"text": ..., "fuzzy": ..., "k": ..., "scheme": ...}``
+- ``POST /analyze_text``: ``{"text": ..., "verse": ..., "fuzzy": ..., "scheme": ..., "segment": ...}``
+- ``GET /meters``: supported meter counts
+- ``GET /stats``: per-endpoint latency histograms, batching counters and
+  cache statistics
+
+Both ``POST`` endpoints accept ``deadline_ms`` and ``max_candidates`` to
+bound fuzzy search, and ``expected`` (a list of meter names) to match
+against those meters only. Unknown or mistyped options, including
+``data_path`` (the server only answers from its own data), are rejected
+with a 400.
+
+Successful responses are the JSON result; errors are
+``{"error": ..., "type": ...}`` with a 4xx/5xx status.
+"""
+
+import sys
+import json
+import time
+import bisect
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+###############################################################################
+
+# Upper bounds (milliseconds) of latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+DEFAULT_BATCH_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH = 64
+MAX_BODY_BYTES = 1 << 20
+
+# ``/analyze_line`` and ``/analyze_text`` options and their accepted JSON
+# types (``None`` is accepted for every option). ``data_path`` is not
+# accepted: the server answers from its own preloaded data only.
+LINE_OPTIONS = {
+    'fuzzy': (bool,),
+    'k': (int,),
+    'scheme': (str,),
+    'deadline_ms': (int, float),
+    'max_candidates': (int,),
+    'expected': (list,),
+}
+TEXT_OPTIONS = {
+    'verse': (bool,),
+    'fuzzy': (bool,),
+    'scheme': (str,),
+    'segment': (bool,),
+    'deadline_ms': (int, float),
+    'max_candidates': (int,),
+    'expected': (list,),
+}
+
+###############################################################################
+
+
+class LatencyHistogram:
+    """
+    Thread-safe fixed-bucket latency histogram.
+
+    Parameters
+    ----------
+    buckets : tuple of float, optional
+        Bucket upper bounds in milliseconds. An overflow bucket is added.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, elapsed_ms: float) -> None:
+        """
+        Record one observation.
+
+        Parameters
+        ----------
+        elapsed_ms : float
+            Latency in milliseconds.
+        """
+        index = bisect.bisect_left(self.buckets, elapsed_ms)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot the histogram.
+
+        Returns
+        -------
+        dict
+            Count, mean and max latency, and cumulative bucket counts keyed
+            by upper bound (``"+Inf"`` for the overflow bucket).
+        """
+        with self._lock:
+            counts = list(self.counts)
+            total, total_ms, max_ms = self.total, self.total_ms, self.max_ms
+
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(list(self.buckets) + ['+Inf'], counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            'count': total,
+            'mean_ms': total_ms / total if total else 0.0,
+            'max_ms': max_ms,
+            'buckets': buckets,
+        }
+
+
+# --------------------------------------------------------------------------- #
+
+
+class MicroBatcher:
+    """
+    Collect concurrent line requests into batches.
+
+    Requests with the same options that arrive within ``window_ms`` of the
+    first pending request (or until ``max_batch`` requests are pending) are
+    answered by a single ``ChandaService.analyze_lines`` call on a worker
+    thread.
+
+    Parameters
+    ----------
+    service : ChandaService
+        Service used for analysis.
+    window_ms : float, optional
+        Batching window in milliseconds. ``0`` disables waiting.
+    max_batch : int, optional
+        Maximum number of requests per batch.
+    """
+
+    def __init__(
+        self,
+        service,
+        window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch: int = DEFAULT_MAX_BATCH
+    ) -> None:
+        self.service = service
+        self.window = max(window_ms, 0.0) / 1000.0
+        self.max_batch = max(max_batch, 1)
+        self.batches = 0
+        self.requests = 0
+        self._pending = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str, **options: Any) -> Future:
+        """
+        Queue a line for analysis.
+
+        Parameters
+        ----------
+        text : str
+            Sanskrit line.
+        **options
+            Options for ``ChandaService.analyze_lines`` (``fuzzy``, ``k``,
+            ``scheme``, ``deadline_ms``, ``max_candidates``, ``expected``).
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future resolving to the result dictionary.
+        """
+        future = Future()
+        key = tuple(sorted(options.items()))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Batcher is closed")
+            self._pending.append((key, text, future))
+            self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        """
+        Stop the worker after draining pending requests.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._worker.join()
+
+    # ----------------------------------------------------------------------- #
+
+    def _take_batch(self) -> List[Tuple[Tuple, str, Future]]:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            if not self._pending:
+                return []
+            deadline = time.monotonic() + self.window
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            groups = {}
+            for key, text, future in batch:
+                try:
+                    groups.setdefault(key, []).append((text, future))
+                except Exception as e:
+                    # e.g. unhashable option values
+                    future.set_exception(e)
+
+            self.batches += 1
+            self.requests += len(batch)
+            for key, items in groups.items():
+                futures = [future for _, future in items]
+                try:
+                    results = self.service.analyze_lines(
+                        [text for text, _ in items], **dict(key)
+                    )
+                    payloads = {}
+                    for future, result in zip(futures, results):
+                        if id(result) not in payloads:
+                            payloads[id(result)] = result.to_dict()
+                        future.set_result(payloads[id(result)])
+                except Exception as e:
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+
+
+###############################################################################
+
+
+class ChandaRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON request handler with HTTP/1.1 keep-alive.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'chanda'
+
+    # ----------------------------------------------------------------------- #
+
+    def do_GET(self) -> None:
+        path = self.path.split('?', 1)[0]
+        if path == '/meters':
+            self._timed(path, lambda: self.server.service.meters())
+        elif path == '/stats':
+            self._send(200, self.server.stats())
+        else:
+            self._send(404, {'error': f"Unknown endpoint: {path}", 'type': 'NotFound'})
+
+    def do_POST(self) -> None:
+        path = self.path.split('?', 1)[0]
+        if path not in ('/analyze_line', '/analyze_text'):
+            self._send(404, {'error': f"Unknown endpoint: {path}", 'type': 'NotFound'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length > MAX_BODY_BYTES:
+                raise ValueError("Request body too large")
+            params = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(params, dict) or not isinstance(params.get('text'), str):
+                raise ValueError("Expected a JSON object with 'text'")
+        except ValueError as e:
+            self._send(400, {'error': str(e), 'type': type(e).__name__})
+            return
+
+        text = params.pop('text')
+        if path == '/analyze_line':
+            self._timed(path, lambda: self.server.batcher.submit(
+                text, **_line_options(params)
+            ).result())
+        else:
+            self._timed(path, lambda: self.server.service.analyze_text(
+                text, **_check_options(params, TEXT_OPTIONS)
+            ).to_dict())
+
+    # ----------------------------------------------------------------------- #
+
+    def _timed(self, endpoint: str, handler) -> None:
+        start = time.perf_counter()
+        try:
+            status, payload = 200, handler()
+        except (TypeError, ValueError) as e:
+            status, payload = 400, {'error': str(e), 'type': type(e).__name__}
+        except Exception as e:
+            status, payload = 500, {'error': str(e), 'type': type(e).__name__}
+        self._send(status, payload)
+        self.server.histograms[endpoint].observe((time.perf_counter() - start) * 1000)
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def _check_options(
+    params: Dict[str, Any],
+    options: Dict[str, Tuple[type, ...]]
+) -> Dict[str, Any]:
+    """
+    Validate request options against a whitelist.
+
+    Parameters
+    ----------
+    params : dict
+        Request parameters other than ``text``.
+    options : dict
+        Accepted option names and their JSON types (``LINE_OPTIONS`` or
+        ``TEXT_OPTIONS``).
+
+    Returns
+    -------
+    dict
+        ``params``, unchanged.
+
+    Raises
+    ------
+    TypeError
+        If an unknown option is given, or an option has the wrong type.
+    """
+    unknown = set(params) - set(options)
+    if unknown:
+        raise TypeError(f"Unknown option(s): {', '.join(sorted(unknown))}")
+    for name, value in params.items():
+        types = options[name]
+        if value is None:
+            continue
+        if (
+            not isinstance(value, types)
+            or (isinstance(value, bool) and bool not in types)
+            or (name == 'expected' and not all(isinstance(v, str) for v in value))
+        ):
+            expected = 'list of str' if name == 'expected' else ' or '.join(
+                t.__name__ for t in types
+            )
+            raise TypeError(f"Option {name!r} must be {expected}")
+    return params
+
+
+def _line_options(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate ``/analyze_line`` options.
+
+    Parameters
+    ----------
+    params : dict
+        Request parameters other than ``text``.
+
+    Returns
+    -------
+    dict
+        Options for ``ChandaService.analyze_lines``.
+
+    Raises
+    ------
+    TypeError
+        If an unknown option is given, or an option has the wrong type.
+    """
+    params = _check_options(params, LINE_OPTIONS)
+    if params.get('expected') is not None:
+        # Options key the batches, so they must be hashable
+        params['expected'] = tuple(params['expected'])
+    return params
+
+
+class ChandaHTTPServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server backed by a ``ChandaService``.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        Host and port to bind.
+    service : ChandaService, optional
+        Service to dispatch requests to. If ``None``, one is created for
+        ``data_path`` and ``language`` and its default analyzer is loaded
+        before serving.
+    data_path : str, optional
+        Meter definition data directory.
+    language : str, optional
+        Language for prosody analysis.
+    batch_window_ms : float, optional
+        Micro-batching window for ``/analyze_line``.
+    max_batch : int, optional
+        Maximum number of line requests per batch.
+    quiet : bool, optional
+        Suppress per-request access logs.
+    """
+
+    daemon_threads = True
+    ENDPOINTS = ('/analyze_line', '/analyze_text', '/meters')
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        service=None,
+        data_path: Optional[str] = None,
+        language: str = 'sanskrit',
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        quiet: bool = False
+    ) -> None:
+        if service is None:
+            from .service import ChandaService
+            service = ChandaService(data_path=data_path, language=language)
+            service.get_analyzer()
+        self.service = service
+        self.batcher = MicroBatcher(service, batch_window_ms, max_batch)
+        self.histograms = {endpoint: LatencyHistogram() for endpoint in self.ENDPOINTS}
+        self.quiet = quiet
+        super().__init__(address, ChandaRequestHandler)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot latency histograms and batching counters.
+
+        Returns
+        -------
+        dict
+            ``latency`` histograms per endpoint, ``batching`` counters and
+            ``caches`` (see ``chanda.caches.cache_stats``).
+        """
+        from .caches import cache_stats
+
+        batcher = self.batcher
+        return {
+            'latency': {
+                endpoint: histogram.to_dict()
+                for endpoint, histogram in self.histograms.items()
+            },
+            'batching': {
+                'batches': batcher.batches,
+                'requests': batcher.requests,
+                'mean_batch_size': (
+                    batcher.requests / batcher.batches if batcher.batches else 0.0
+                ),
+            },
+            'caches': cache_stats(),
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.batcher.close()
+
+
+def run_server(
+    host: str = '127.0.0.1',
+    port: int = 8000,
+    data_path: Optional[str] = None,
+    language: str = 'sanskrit',
+    batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    quiet: bool = False
+) -> int:
+    """
+    Run the HTTP service until interrupted.
+
+    Parameters
+    ----------
+    host : str, optional
+        Host to bind.
+    port : int, optional
+        Port to bind.
+    data_path : str, optional
+        Meter definition data directory.
+    language : str, optional
+        Language for prosody analysis.
+    batch_window_ms : float, optional
+        Micro-batching window for ``/analyze_line``.
+    max_batch : int, optional
+        Maximum number of line requests per batch.
+    quiet : bool, optional
+        Suppress per-request access logs.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    server = ChandaHTTPServer(
+        (host, port),
+        data_path=data_path,
+        language=language,
+        batch_window_ms=batch_window_ms,
+        max_batch=max_batch,
+        quiet=quiet
+    )
+    print(f"chanda serving on http://{host}:{server.server_address[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+###############################################################################
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request dispatch for long-running Chandojñānam services.
+
+This module provides ``ChandaService``, which keeps preloaded ``Chanda``
+instances (one per data directory) and answers JSON-style requests. It is
+the shared backend of the analysis daemon and other long-running servers,
+so definitions are loaded and caches warmed once per process.
+
+Notes
+-----
+A request is a dictionary with an ``op`` key and operation parameters::
+
+    {"op": "analyze_line", "text": "...", "fuzzy": true, "scheme": "iast"}
+
+Supported operations are ``ping``, ``analyze_line``, ``analyze_lines``
+(with ``texts`` instead of ``text``), ``analyze_text``, ``summary`` and
+``meters``. Responses are ``{"ok": true, "result": ...}``
+on success and ``{"ok": false, "error": "...", "type": "..."}`` on failure.
+"""
+
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from .types import ChandaResult, TextAnalysisResult
+
+###############################################################################
+
+OPERATIONS = (
+    'ping', 'analyze_line', 'analyze_lines', 'analyze_text', 'summary', 'meters',
+    'cache_stats'
+)
+
+###############################################################################
+
+
+class ChandaService:
+    """
+    Dispatcher that serves analysis requests from warm ``Chanda`` instances.
+
+    Parameters
+    ----------
+    data_path : str, optional
+        Default meter definition data directory. If ``None``, uses the
+        package default.
+    language : str, optional
+        Language for prosody analysis.
+
+    Examples
+    --------
+    >>> service = ChandaService()
+    >>> service.handle({'op': 'analyze_line', 'text': 'रामो राजमणिः सदा विजयते'})
+    {'ok': True, 'result': {...}}
+    """
+
+    def __init__(
+        self,
+        data_path: Optional[str] = None,
+        language: str = 'sanskrit'
+    ) -> None:
+        if data_path is None:
+            from .utils import get_default_data_path
+            data_path = get_default_data_path()
+        self.data_path = os.path.abspath(data_path)
+        self.language = language
+        self._analyzers = {}
+        self._lock = threading.RLock()
+
+    # ----------------------------------------------------------------------- #
+
+    def get_analyzer(self, data_path: Optional[str] = None):
+        """
+        Get (or load) the ``Chanda`` instance for a data directory.
+
+        Parameters
+        ----------
+        data_path : str, optional
+            Meter definition data directory. Defaults to the service's
+            data directory.
+
+        Returns
+        -------
+        Chanda
+            Preloaded analyzer.
+        """
+        data_path = os.path.abspath(data_path) if data_path else self.data_path
+        with self._lock:
+            analyzer = self._analyzers.get(data_path)
+            if analyzer is None:
+                from .core import Chanda
+                analyzer = Chanda(data_path, language=self.language)
+                self._analyzers[data_path] = analyzer
+            return analyzer
+
+    # ----------------------------------------------------------------------- #
+
+    def analyze_line(
+        self,
+        text: str,
+        fuzzy: bool = True,
+        k: int = 10,
+        scheme: Optional[str] = None,
+        data_path: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> ChandaResult:
+        """
+        Identify meter from a single line.
+
+        Parameters
+        ----------
+        text : str
+            Sanskrit text (single line).
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        k : int, optional
+            Maximum number of fuzzy matches to return.
+        scheme : str, optional
+            Transliteration scheme for output.
+        data_path : str, optional
+            Meter definition data directory.
+        deadline_ms : float, optional
+            Time budget for fuzzy search in milliseconds; results cut short
+            are marked ``partial``.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``Chanda.analyze_line``).
+
+        Returns
+        -------
+        ChandaResult
+            Identification result for the line.
+        """
+        from .core import apply_output_scheme
+
+        analyzer = self.get_analyzer(data_path)
+        with self._lock:
+            result = analyzer.analyze_line(
+                text,
+                fuzzy=fuzzy,
+                k=k,
+                deadline_ms=deadline_ms,
+                max_candidates=max_candidates,
+                expected=expected
+            )
+        return apply_output_scheme(result, scheme)
+
+    def analyze_lines(
+        self,
+        texts: List[str],
+        fuzzy: bool = True,
+        k: int = 10,
+        scheme: Optional[str] = None,
+        data_path: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> List[ChandaResult]:
+        """
+        Identify meters for a batch of single lines.
+
+        Parameters
+        ----------
+        texts : list[str]
+            Sanskrit lines.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        k : int, optional
+            Maximum number of fuzzy matches to return.
+        scheme : str, optional
+            Transliteration scheme for output.
+        data_path : str, optional
+            Meter definition data directory.
+        deadline_ms : float, optional
+            Time budget for fuzzy search per line in milliseconds; results
+            cut short are marked ``partial``.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``Chanda.analyze_line``).
+
+        Returns
+        -------
+        list[ChandaResult]
+            Identification results, in input order.
+
+        Notes
+        -----
+        The batch is analyzed under a single lock acquisition and repeated
+        lines are analyzed once; their positions share one result object.
+        """
+        from .core import apply_output_scheme
+
+        analyzer = self.get_analyzer(data_path)
+        unique = {}
+        with self._lock:
+            for text in texts:
+                if text not in unique:
+                    unique[text] = apply_output_scheme(
+                        analyzer.analyze_line(
+                            text,
+                            fuzzy=fuzzy,
+                            k=k,
+                            deadline_ms=deadline_ms,
+                            max_candidates=max_candidates,
+                            expected=expected
+                        ),
+                        scheme
+                    )
+        return [unique[text] for text in texts]
+
+    def analyze_text(
+        self,
+        text: str,
+        verse: bool = False,
+        fuzzy: bool = True,
+        scheme: Optional[str] = None,
+        segment: bool = False,
+        data_path: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+        max_candidates: Optional[int] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> TextAnalysisResult:
+        """
+        Identify meters for multi-line text.
+
+        Parameters
+        ----------
+        text : str
+            Sanskrit text (can be multiple lines).
+        verse : bool, optional
+            Group lines into verses.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        scheme : str, optional
+            Transliteration scheme for output.
+        segment : bool, optional
+            Detect verse boundaries automatically (verse mode).
+        data_path : str, optional
+            Meter definition data directory.
+        deadline_ms : float, optional
+            Time budget for fuzzy search over the whole text in
+            milliseconds; line results cut short are marked ``partial``.
+        max_candidates : int, optional
+            Maximum number of signatures aligned by each fuzzy search.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``Chanda.analyze_line``).
+
+        Returns
+        -------
+        TextAnalysisResult
+            Analysis results with line and verse results.
+        """
+        analyzer = self.get_analyzer(data_path)
+        with self._lock:
+            return analyzer.analyze_text(
+                text,
+                verse=verse,
+                fuzzy=fuzzy,
+                scheme=scheme,
+                segment=segment,
+                deadline_ms=deadline_ms,
+                max_candidates=max_candidates,
+                expected=expected
+            )
+
+    def summary(
+        self,
+        text: str,
+        verse: bool = False,
+        fuzzy: bool = True,
+        scheme: Optional[str] = None,
+        segment: bool = False,
+        data_path: Optional[str] = None,
+        expected: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute summary statistics without keeping per-line results.
+
+        Parameters
+        ----------
+        text : str
+            Sanskrit text (can be multiple lines).
+        verse : bool, optional
+            Group lines into verses.
+        fuzzy : bool, optional
+            Enable fuzzy matching.
+        scheme : str, optional
+            Transliteration scheme for output.
+        segment : bool, optional
+            Detect verse boundaries automatically (verse mode).
+        data_path : str, optional
+            Meter definition data directory.
+        expected : sequence of str, optional
+            Names of the expected meters (see ``Chanda.analyze_line``).
+
+        Returns
+        -------
+        dict
+            Summary payload in the format of ``Chanda.summarize_results``.
+        """
+        from .summary import SummaryAccumulator
+
+        analyzer = self.get_analyzer(data_path)
+        accumulator = SummaryAccumulator()
+        with self._lock:
+            accumulator.update(analyzer.iter_analyze_text(
+                text,
+                verse=verse,
+                fuzzy=fuzzy,
+                scheme=scheme,
+                segment=segment,
+                expected=expected
+            ))
+        return accumulator.summary()
+
+    def meters(self, data_path: Optional[str] = None) -> Dict[str, int]:
+        """
+        Get statistics about supported meters.
+
+        Parameters
+        ----------
+        data_path : str, optional
+            Meter definition data directory.
+
+        Returns
+        -------
+        dict
+            Meter counts (see ``MeterStats``).
+        """
+        from .utils import get_supported_meters
+        return get_supported_meters(data_path or self.data_path).to_dict()
+
+    # ----------------------------------------------------------------------- #
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a protocol request.
+
+        Parameters
+        ----------
+        request : dict
+            Request with an ``op`` key and operation parameters.
+
+        Returns
+        -------
+        dict
+            Response payload with ``ok`` and either ``result`` or ``error``.
+        """
+        try:
+            return {'ok': True, 'result': self.dispatch(request)}
+        except Exception as e:
+            return {'ok': False, 'error': str(e), 'type': type(e).__name__}
+
+    def dispatch(self, request: Dict[str, Any]) -> Any:
+        """
+        Run a protocol request and return its JSON-serializable result.
+
+        Parameters
+        ----------
+        request : dict
+            Request with an ``op`` key and operation parameters.
+
+        Returns
+        -------
+        object
+            Operation result.
+
+        Raises
+        ------
+        ValueError
+            If the operation is unknown or required parameters are missing.
+        """
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        params = dict(request)
+        op = params.pop('op', None)
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {op!r}")
+
+        if op == 'ping':
+            return {'pid': os.getpid(), 'data_path': self.data_path}
+        if op == 'meters':
+            return self.meters(params.get('data_path'))
+        if op == 'cache_stats':
+            from .caches import cache_stats
+            return cache_stats()
+
+        if op == 'analyze_lines':
+            texts = params.pop('texts', None)
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise ValueError("Missing 'texts'")
+            return [r.to_dict() for r in self.analyze_lines(texts, **params)]
+
+        text = params.pop('text', None)
+        if not isinstance(text, str):
+            raise ValueError("Missing 'text'")
+        if op == 'analyze_line':
+            return self.analyze_line(text, **params).to_dict()
+        if op == 'analyze_text':
+            return self.analyze_text(text, **params).to_dict()
+        return self.summary(text, **params)
+
+
+###############################################################################
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metrically similar verses in an indexed corpus.
+
+This module provides ``SimilarVerses``, which finds the verses of a
+``CorpusIndex`` closest in metrical shape to a given verse, e.g. to
+detect borrowed or reworked verses across texts.
+
+Notes
+-----
+The distance between two verses is the sum, over their pādas in order,
+of the laghu-guru edit costs of ``Chanda._editops`` (the cost model of
+fuzzy matching); a pāda missing from either verse costs its length. The
+final syllable of every pāda counts as guru, as in matching.
+
+Retrieval uses locality-sensitive hashing: every verse is reduced to its
+set of shingles (laghu-guru n-grams of each pāda, tagged with the pāda
+position) and summarised by a MinHash signature, whose bands are hashed
+into buckets. Verses sharing a bucket with the query are likely to share
+many shingles, hence to be close in edit distance; only they are
+compared exactly. Verses with no shared bucket are missed, so results are
+approximate; ``exhaustive=True`` compares against every verse instead.
+
+Examples
+--------
+>>> similar = SimilarVerses(index, analyzer)
+>>> similar.nearest(verse_text, k=5)
+>>> similar.similar('book3', 12, k=5)
+"""
+
+import hashlib
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+###############################################################################
+
+MERSENNE_PRIME = (1 << 61) - 1
+
+###############################################################################
+
+
+class SimilarVerses:
+    """
+    Nearest-neighbour search over the verses of a corpus index.
+
+    Parameters
+    ----------
+    index : CorpusIndex
+        Indexed corpus, analyzed with verse detection. Verses added to it
+        later are not searched; create a new object instead.
+    analyzer : Chanda
+        Analyzer providing the edit costs and, for text queries, scansion.
+    shingle : int, optional
+        Length of the laghu-guru n-grams compared.
+    bands : int, optional
+        Number of hash buckets per verse. More bands find more distant
+        neighbours at the cost of more exact comparisons.
+    rows : int, optional
+        MinHash values per band. More rows make buckets more selective.
+    seed : int, optional
+        Seed of the hash functions.
+    """
+
+    def __init__(
+        self,
+        index,
+        analyzer,
+        shingle: int = 6,
+        bands: int = 24,
+        rows: int = 3,
+        seed: int = 0
+    ) -> None:
+        self.index = index
+        self.analyzer = analyzer
+        self.shingle = shingle
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(MERSENNE_PRIME))
+            for _ in range(bands * rows)
+        ]
+        # MinHash values of every distinct shingle (few, as the alphabet
+        # has two letters)
+        self._hashes: Dict[str, List[int]] = {}
+
+        # Verses as (document, verse index, line ids, pādas)
+        self.verses: List[Tuple[str, int, List[int], Tuple[str, ...]]] = []
+        self._keys: Dict[Tuple[str, int], int] = {}
+        lines = index.scansions().split(b'\n')[1:-1]
+        grouped: Dict[Tuple[str, int], List[int]] = {}
+        for line_id, (document, verse_idx, _) in enumerate(
+            index.locate(range(len(index)))
+        ):
+            if verse_idx is not None:
+                grouped.setdefault((document, verse_idx), []).append(line_id)
+        for (document, verse_idx), line_ids in grouped.items():
+            padas = tuple(
+                self._normalize(lines[line_id].decode('ascii'))
+                for line_id in line_ids
+            )
+            self._keys[(document, verse_idx)] = len(self.verses)
+            self.verses.append((document, verse_idx, line_ids, padas))
+
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            {} for _ in range(bands)
+        ]
+        for verse_id, (_, _, _, padas) in enumerate(self.verses):
+            for band, key in enumerate(self._band_keys(padas)):
+                self._buckets[band].setdefault(key, []).append(verse_id)
+
+    # ----------------------------------------------------------------------- #
+
+    def nearest(
+        self,
+        verse: Union[str, Sequence[str]],
+        k: int = 10,
+        exhaustive: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the verses closest in metrical shape.
+
+        Parameters
+        ----------
+        verse : str or sequence of str
+            Verse text (one pāda per line, scanned with the analyzer) or
+            laghu-guru strings of its pādas (in the analyzer's symbols or
+            ``L``/``G``).
+        k : int, optional
+            Number of verses to return.
+        exhaustive : bool, optional
+            Compare against every verse instead of the hash candidates.
+
+        Returns
+        -------
+        list[dict]
+            Up to ``k`` verses, closest first (ties in corpus order), each
+            with ``document``, ``verse`` (index in the document), ``lines``
+            (line ids in the index) and ``distance``.
+        """
+        if isinstance(verse, str):
+            verse = [
+                ''.join(self.analyzer.analyze_line(line).lg)
+                for line in verse.split('\n') if line.strip()
+            ]
+        padas = tuple(self._normalize(pada) for pada in verse)
+        return self._rank(padas, k, exhaustive)
+
+    def similar(
+        self,
+        document: str,
+        verse: int,
+        k: int = 10,
+        exhaustive: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the verses closest to an indexed verse, other than itself.
+
+        Parameters
+        ----------
+        document : str
+            Document name.
+        verse : int
+            Verse index in the document.
+        k : int, optional
+            Number of verses to return.
+        exhaustive : bool, optional
+            Compare against every verse instead of the hash candidates.
+
+        Returns
+        -------
+        list[dict]
+            As in ``nearest``.
+
+        Raises
+        ------
+        KeyError
+            If the verse is not indexed.
+        """
+        verse_id = self._keys[(document, verse)]
+        padas = self.verses[verse_id][3]
+        return self._rank(padas, k, exhaustive, skip=verse_id)
+
+    def distance(self, padas: Sequence[str], other: Sequence[str]) -> int:
+        """
+        Metrical distance between two verses.
+
+        Parameters
+        ----------
+        padas, other : sequence of str
+            Laghu-guru strings of the pādas (``L``/``G``), with the final
+            syllables already counted as guru.
+
+        Returns
+        -------
+        int
+            Sum of the pāda edit costs.
+        """
+        total = 0
+        for idx in range(max(len(padas), len(other))):
+            a = padas[idx] if idx < len(padas) else ''
+            b = other[idx] if idx < len(other) else ''
+            cost, _ = self.analyzer._editops(a, b, max_diff=len(a) + len(b))
+            total += cost
+        return total
+
+    # ----------------------------------------------------------------------- #
+
+    def _normalize(self, pada: str) -> str:
+        """
+        Laghu-guru string in ``L``/``G`` with a guru final syllable.
+        """
+        analyzer = self.analyzer
+        pada = pada.translate(analyzer.ttable_in)
+        pada = pada.replace(analyzer.L, 'L').replace(analyzer.G, 'G')
+        return pada[:-1] + 'G' if pada else pada
+
+    def _shingles(self, padas: Sequence[str]) -> List[str]:
+        """
+        Position-tagged laghu-guru n-grams of the pādas.
+        """
+        size = self.shingle
+        shingles = set()
+        for position, pada in enumerate(padas):
+            # Boundaries keep the start and end of the pāda apart from
+            # its middle, and give short pādas a shingle of their own
+            padded = f'^{pada}$'
+            for start in range(max(len(padded) - size, 0) + 1):
+                shingles.add(f'{position}:{padded[start:start + size]}')
+        return sorted(shingles)
+
+    def _band_keys(self, padas: Sequence[str]) -> List[Tuple[int, ...]]:
+        """
+        Bucket keys of the MinHash signature of a verse.
+        """
+        vectors = []
+        for shingle in self._shingles(padas):
+            vector = self._hashes.get(shingle)
+            if vector is None:
+                digest = hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+                value = int.from_bytes(digest, 'big')
+                vector = [
+                    (a * value + b) % MERSENNE_PRIME for a, b in self._coefficients
+                ]
+                self._hashes[shingle] = vector
+            vectors.append(vector)
+        signature = list(map(min, zip(*vectors)))
+        rows = self.rows
+        return [
+            tuple(signature[band * rows:(band + 1) * rows])
+            for band in range(self.bands)
+        ]
+
+    def _rank(
+        self,
+        padas: Tuple[str, ...],
+        k: int,
+        exhaustive: bool,
+        skip: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidate verses by exact distance.
+        """
+        if exhaustive:
+            candidates = set(range(len(self.verses)))
+        else:
+            candidates = set()
+            for band, key in enumerate(self._band_keys(padas)):
+                candidates.update(self._buckets[band].get(key, ()))
+        candidates.discard(skip)
+
+        scored = sorted(
+            (self.distance(padas, self.verses[verse_id][3]), verse_id)
+            for verse_id in candidates
+        )
+        results = []
+        for distance, verse_id in scored[:k]:
+            document, verse_idx, line_ids, _ = self.verses[verse_id]
+            results.append({
+                'document': document,
+                'verse': verse_idx,
+                'lines': line_ids,
+                'distance': distance,
+            })
+        return results
+
+
+###############################################################################
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed store for text analysis results.
+
+This module backs ``Chanda.analyze_text(save_path=...)``. Results are
+saved as ``result_<id>.json`` (the ``AnalysisResult`` payload) and
+``result_<id>.txt`` (the plain-text rendering), where the id is derived
+from the text, the analysis options and the fingerprint of the meter
+definitions. A later call with the same inputs reads the saved result
+instead of recomputing it.
+
+Notes
+-----
+An ``index.json`` file records the size, creation and last access time,
+and hit count of every entry. When the total size exceeds the limit,
+the least recently used entries are removed. Reads are kept cheap: a hit
+only rewrites the index when the recorded access time of its entry is
+older than ``access_interval``; other hits are counted in memory and
+written with the next index update (or ``flush``).
+
+All files are written to a temporary file and moved into place, so
+readers never see partial files. The index is re-read whenever it was
+modified on disk, so several processes can share a store; entries whose
+index update was lost to a concurrent writer are picked up from the
+directory listing.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import RESULT_STORE_ACCESS_INTERVAL, RESULT_STORE_MAX_BYTES
+
+###############################################################################
+
+INDEX_FILE = 'index.json'
+RESULT_PREFIX = 'result_'
+
+###############################################################################
+
+
+def _atomic_write(path: str, data: str) -> None:
+    """
+    Write a text file atomically.
+
+    Parameters
+    ----------
+    path : str
+        Destination path.
+    data : str
+        File contents.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class ResultStore:
+    """
+    Directory of analysis results keyed by content and options.
+
+    Parameters
+    ----------
+    path : str
+        Store directory (created if missing).
+    max_bytes : int, optional
+        Size limit of the stored result files. Least recently used
+        entries are evicted beyond it.
+    access_interval : float, optional
+        Minimum age in seconds of the recorded access time of an entry
+        before a hit rewrites the index.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = RESULT_STORE_MAX_BYTES,
+        access_interval: float = RESULT_STORE_ACCESS_INTERVAL
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.access_interval = access_interval
+        self._lock = threading.RLock()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_mtime: Optional[int] = None
+        # Hits not yet written to the index: result id -> (accessed, hits)
+        self._pending: Dict[str, Tuple[float, int]] = {}
+        os.makedirs(path, exist_ok=True)
+
+    # ----------------------------------------------------------------------- #
+
+    @staticmethod
+    def result_id(text: str, verse: bool, fuzzy: bool, **options: Any) -> str:
+        """
+        Derive the id of a result.
+
+        Parameters
+        ----------
+        text : str
+            Analyzed text.
+        verse : bool
+            Verse mode flag.
+        fuzzy : bool
+            Fuzzy matching flag.
+        **options
+            Remaining options that affect the result (e.g. scheme,
+            ``verse_lines``, definitions fingerprint). Values must be
+            JSON-serializable.
+
+        Returns
+        -------
+        str
+            ``<md5(text)>_<verse>_<fuzzy>_<options digest>``.
+        """
+        md5sum = hashlib.md5(text.encode('utf-8')).hexdigest()
+        digest = hashlib.md5(
+            json.dumps(options, sort_keys=True).encode('utf-8')
+        ).hexdigest()[:12]
+        return f"{md5sum}_{int(verse)}_{int(fuzzy)}_{digest}"
+
+    def filenames(self, result_id: str) -> Dict[str, str]:
+        """
+        File names of a result.
+
+        Parameters
+        ----------
+        result_id : str
+            Result id.
+
+        Returns
+        -------
+        dict
+            ``json`` and ``txt`` file names (relative to the store).
+        """
+        return {
+            'json': f"{RESULT_PREFIX}{result_id}.json",
+            'txt': f"{RESULT_PREFIX}{result_id}.txt",
+        }
+
+    # ----------------------------------------------------------------------- #
+
+    def get(self, result_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a saved result.
+
+        Parameters
+        ----------
+        result_id : str
+            Result id.
+
+        Returns
+        -------
+        dict or None
+            ``AnalysisResult`` payload, or ``None`` if not stored.
+        """
+        json_path = os.path.join(self.path, self.filenames(result_id)['json'])
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            self._load_index()
+            entry = self._index.setdefault(result_id, self._entry(result_id))
+            now = time.time()
+            hits = self._pending.get(result_id, (now, 0))[1]
+            self._pending[result_id] = (now, hits + 1)
+            if now - entry['accessed'] >= self.access_interval:
+                self._save_index()
+        return data
+
+    def put(self, result_id: str, analysis: Dict[str, Any], text: str) -> Dict[str, str]:
+        """
+        Save a result and evict old entries if the store is over its limit.
+
+        Parameters
+        ----------
+        result_id : str
+            Result id.
+        analysis : dict
+            ``AnalysisResult`` payload.
+        text : str
+            Plain-text rendering of the result.
+
+        Returns
+        -------
+        dict
+            ``json`` and ``txt`` file names.
+        """
+        filenames = self.filenames(result_id)
+        _atomic_write(
+            os.path.join(self.path, filenames['json']),
+            json.dumps(analysis, ensure_ascii=False)
+        )
+        _atomic_write(os.path.join(self.path, filenames['txt']), text)
+
+        with self._lock:
+            self._load_index()
+            self._index[result_id] = self._entry(result_id)
+            self._evict(keep=result_id)
+            self._save_index()
+        return filenames
+
+    def flush(self) -> None:
+        """
+        Write the hits counted since the last index update.
+        """
+        with self._lock:
+            if self._pending:
+                self._load_index()
+                self._save_index()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the store contents.
+
+        Returns
+        -------
+        dict
+            ``entries``, ``bytes``, ``max_bytes`` and total ``hits``.
+        """
+        with self._lock:
+            self._load_index()
+            return {
+                'entries': len(self._index),
+                'bytes': sum(e['bytes'] for e in self._index.values()),
+                'max_bytes': self.max_bytes,
+                'hits': (
+                    sum(e.get('hits', 0) for e in self._index.values())
+                    + sum(hits for _, hits in self._pending.values())
+                ),
+            }
+
+    # ----------------------------------------------------------------------- #
+
+    def _entry(self, result_id: str) -> Dict[str, Any]:
+        """
+        Build an index entry from the files of a result.
+        """
+        size = 0
+        mtime = time.time()
+        for filename in self.filenames(result_id).values():
+            try:
+                stat = os.stat(os.path.join(self.path, filename))
+            except OSError:
+                continue
+            size += stat.st_size
+            mtime = min(mtime, stat.st_mtime)
+        return {'bytes': size, 'created': mtime, 'accessed': mtime, 'hits': 0}
+
+    def _evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Remove least recently used entries until the store fits its limit.
+
+        Parameters
+        ----------
+        keep : str, optional
+            Entry that must not be evicted (the one just written).
+
+        Returns
+        -------
+        list[str]
+            Evicted result ids.
+        """
+        self._apply_pending()
+        # Adopt results missing from the index (e.g. lost concurrent updates)
+        for filename in os.listdir(self.path):
+            if filename.startswith(RESULT_PREFIX) and filename.endswith('.json'):
+                result_id = filename[len(RESULT_PREFIX):-len('.json')]
+                if result_id not in self._index:
+                    self._index[result_id] = self._entry(result_id)
+
+        total = sum(e['bytes'] for e in self._index.values())
+        evicted = []
+        for result_id, entry in sorted(
+            self._index.items(), key=lambda item: item[1]['accessed']
+        ):
+            if total <= self.max_bytes:
+                break
+            if result_id == keep:
+                continue
+            for filename in self.filenames(result_id).values():
+                try:
+                    os.unlink(os.path.join(self.path, filename))
+                except OSError:
+                    pass
+            total -= entry['bytes']
+            evicted.append(result_id)
+        for result_id in evicted:
+            del self._index[result_id]
+        return evicted
+
+    def _apply_pending(self) -> None:
+        """
+        Move the hits counted in memory into the index entries.
+        """
+        for result_id, (accessed, hits) in self._pending.items():
+            entry = self._index.get(result_id)
+            if entry is not None:
+                entry['accessed'] = max(entry['accessed'], accessed)
+                entry['hits'] = entry.get('hits', 0) + hits
+        self._pending = {}
+
+    def _load_index(self) -> None:
+        """
+        Re-read the index if it changed on disk.
+        """
+        index_path = os.path.join(self.path, INDEX_FILE)
+        try:
+            mtime = os.stat(index_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._index_mtime:
+            return
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                self._index = json.load(f).get('entries', {})
+        except (OSError, ValueError):
+            self._index = {}
+        self._index_mtime = mtime
+
+    def _save_index(self) -> None:
+        """
+        Write the index atomically.
+        """
+        self._apply_pending()
+        index_path = os.path.join(self.path, INDEX_FILE)
+        _atomic_write(index_path, json.dumps({'entries': self._index}, indent=1))
+        self._index_mtime = os.stat(index_path).st_mtime_ns
+
+
+###############################################################################
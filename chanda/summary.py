@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming summary statistics for Chandojñānam results.
+
+This module provides an accumulator that consumes line and verse results
+one at a time and keeps only the counters needed for summary reports.
+Accumulators can be merged, so per-worker or per-shard summaries can be
+combined into a corpus-wide summary.
+"""
+
+from collections import defaultdict, Counter
+from typing import Any, Dict, Iterable, Union
+
+from .display import format_chanda_pada, format_chanda_list
+from .types import (
+    ChandaResult,
+    LineResult,
+    VerseResult,
+    AnalysisResult,
+    TextAnalysisResult
+)
+
+###############################################################################
+
+
+def _get(item: Any, key: str, default: Any = None) -> Any:
+    """
+    Read a field from a result object or its dictionary form.
+
+    Parameters
+    ----------
+    item : object
+        Result dataclass or dictionary.
+    key : str
+        Field name.
+    default : object, optional
+        Value to return if the field is absent.
+
+    Returns
+    -------
+    object
+        Field value or ``default``.
+    """
+    if isinstance(item, dict):
+        return item.get(key, default)
+    return getattr(item, key, default)
+
+
+class SummaryAccumulator:
+    """
+    Incremental accumulator for line and verse match statistics.
+
+    Notes
+    -----
+    The accumulator produces the same payload as
+    ``Chanda.summarize_results`` without requiring a materialized
+    ``AnalysisResult``. Feed it with ``add_line``/``add_verse`` (or
+    ``add``) as results stream by and call ``summary`` at the end.
+
+    Examples
+    --------
+    >>> accumulator = SummaryAccumulator()
+    >>> for item in chanda.iter_analyze_text(text, verse=True):
+    ...     accumulator.add(item)
+    >>> print(Chanda.format_summary(accumulator.summary()))
+    """
+
+    def __init__(self) -> None:
+        self.match_line_statistics = defaultdict(Counter)
+        self.fuzzy_line_statistics = defaultdict(Counter)
+        self.verse_statistics = defaultdict(Counter)
+        self.counts = defaultdict(int)
+
+    @classmethod
+    def from_summary(cls, summary: Dict[str, Any]) -> 'SummaryAccumulator':
+        """
+        Rebuild an accumulator from a summary payload.
+
+        Parameters
+        ----------
+        summary : dict
+            Summary payload (e.g. decoded from JSON) in the format of
+            ``SummaryAccumulator.summary``.
+
+        Returns
+        -------
+        SummaryAccumulator
+            Accumulator holding the same statistics.
+        """
+        accumulator = cls()
+        for mine, theirs in (
+            (accumulator.verse_statistics, summary.get('verse', {})),
+            (accumulator.match_line_statistics, summary.get('line', {}).get('match', {})),
+            (accumulator.fuzzy_line_statistics, summary.get('line', {}).get('fuzzy', {})),
+        ):
+            for key, counter in theirs.items():
+                mine[key].update(counter)
+        accumulator.counts.update(summary.get('count', {}))
+        return accumulator
+
+    # ----------------------------------------------------------------------- #
+
+    def add_line(
+        self,
+        line_result: Union[LineResult, ChandaResult, Dict[str, Any]]
+    ) -> None:
+        """
+        Consume a single line result.
+
+        Parameters
+        ----------
+        line_result : LineResult or ChandaResult or dict
+            Line result object or its dictionary form.
+        """
+        if isinstance(line_result, LineResult):
+            line_result = line_result.result
+        elif isinstance(line_result, dict) and 'found' not in line_result:
+            line_result = line_result.get('result', line_result)
+
+        self.counts['line'] += 1
+        if _get(line_result, 'found'):
+            self.counts['match_line'] += 1
+            chanda_list = [
+                format_chanda_pada(c, p)
+                for c, p in _get(line_result, 'chanda', None) or []
+            ]
+            gana_list = [_get(line_result, 'gana', "")]
+
+            self.match_line_statistics['chanda'].update(chanda_list)
+            self.match_line_statistics['gana'].update(gana_list)
+        else:
+            self.counts['fuzzy_line'] += 1
+            for fuzzy_match in _get(line_result, 'fuzzy', None) or []:
+                self.counts['mismatch_syllable'] += fuzzy_match['cost']
+                chanda_list = format_chanda_list(
+                    fuzzy_match.get('chanda', [])
+                ).split('/') if fuzzy_match.get('chanda') else []
+                self.fuzzy_line_statistics['chanda'].update(chanda_list)
+                break
+
+    def add_verse(
+        self,
+        verse_result: Union[VerseResult, Dict[str, Any]]
+    ) -> None:
+        """
+        Consume a single verse result.
+
+        Parameters
+        ----------
+        verse_result : VerseResult or dict
+            Verse result object or its dictionary form.
+        """
+        self.counts['verse'] += 1
+        chanda = _get(verse_result, 'chanda')
+        if not chanda:
+            self.counts['fuzzy_verse'] += 1
+            return
+        chanda_list, chanda_score = chanda
+        verse_len = len(_get(verse_result, 'line_indices', None) or [])
+        if not verse_len:
+            verse_len = len(_get(verse_result, 'line_results', None) or [])
+        if chanda_score == verse_len:
+            self.counts['match_verse'] += 1
+        else:
+            self.counts['fuzzy_verse'] += 1
+        self.verse_statistics['chanda'].update(chanda_list)
+
+    def add(self, item: Union[LineResult, VerseResult]) -> None:
+        """
+        Consume a line or verse result.
+
+        Parameters
+        ----------
+        item : LineResult or VerseResult
+            Item as yielded by ``Chanda.iter_analyze_text``.
+        """
+        if isinstance(item, VerseResult):
+            self.add_verse(item)
+        else:
+            self.add_line(item)
+
+    def update(
+        self,
+        results: Union[
+            TextAnalysisResult,
+            AnalysisResult,
+            Dict[str, Any],
+            Iterable[Union[LineResult, VerseResult]]
+        ]
+    ) -> 'SummaryAccumulator':
+        """
+        Consume a complete analysis result or an iterable of items.
+
+        Parameters
+        ----------
+        results : TextAnalysisResult or AnalysisResult or dict or iterable
+            Analysis results (object or dictionary form), or an iterable
+            of line and verse results.
+
+        Returns
+        -------
+        SummaryAccumulator
+            The accumulator itself.
+        """
+        if isinstance(results, TextAnalysisResult):
+            results = results.result
+        if isinstance(results, AnalysisResult):
+            for line_result in results.line:
+                self.add_line(line_result)
+            for verse_result in results.verse:
+                self.add_verse(verse_result)
+        elif isinstance(results, dict):
+            for line_result in results.get('line', []):
+                self.add_line(line_result)
+            for verse_result in results.get('verse', []):
+                self.add_verse(verse_result)
+        else:
+            for item in results:
+                self.add(item)
+        return self
+
+    def merge(self, other: 'SummaryAccumulator') -> 'SummaryAccumulator':
+        """
+        Merge statistics from another accumulator into this one.
+
+        Parameters
+        ----------
+        other : SummaryAccumulator
+            Accumulator to merge (e.g. from another worker or shard).
+
+        Returns
+        -------
+        SummaryAccumulator
+            The accumulator itself.
+        """
+        for key, value in other.counts.items():
+            self.counts[key] += value
+        for mine, theirs in (
+            (self.match_line_statistics, other.match_line_statistics),
+            (self.fuzzy_line_statistics, other.fuzzy_line_statistics),
+            (self.verse_statistics, other.verse_statistics),
+        ):
+            for key, counter in theirs.items():
+                mine[key].update(counter)
+        return self
+
+    # ----------------------------------------------------------------------- #
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Build the summary payload.
+
+        Returns
+        -------
+        dict
+            Summary statistics in the format of
+            ``Chanda.summarize_results``.
+        """
+        def _copy(statistics):
+            return defaultdict(Counter, {
+                k: Counter(v) for k, v in statistics.items()
+            })
+
+        return {
+            'verse': _copy(self.verse_statistics),
+            'line': {
+                'fuzzy': _copy(self.fuzzy_line_statistics),
+                'match': _copy(self.match_line_statistics),
+            },
+            'count': defaultdict(int, self.counts)
+        }
+
+
+###############################################################################
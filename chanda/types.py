@@ -45,6 +45,12 @@ class ChandaResult:
         Jāti classification labels.
     fuzzy : list[dict]
         Fuzzy match results (if no exact match found).
+    partial : bool
+        Whether the fuzzy search stopped early because of a deadline or
+        candidate budget (``fuzzy`` may then miss better matches).
+    unexpected : bool
+        Whether the line was analyzed against expected meters and fits
+        none of them.
     """
     line: str = ""
     scheme: Optional[str] = None
@@ -57,6 +63,8 @@ class ChandaResult:
     chanda: List[Tuple[str, Tuple]] = field(default_factory=list)
     jaati: List[str] = field(default_factory=list)
     fuzzy: List[Dict[str, Any]] = field(default_factory=list)
+    partial: bool = False
+    unexpected: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -418,6 +426,60 @@ class MeterStats:
 # --------------------------------------------------------------------------- #
 
 
+@dataclass(frozen=True)
+class SignatureInfo:
+    """
+    Precomputed metadata for a laghu-guru signature.
+
+    Attributes
+    ----------
+    signature : str
+        Laghu-guru signature (key of ``Chanda.CHANDA``).
+    gana : str
+        Gaṇa notation in internal symbols.
+    display_gana : str
+        Gaṇa notation in output symbols.
+    length : int
+        Length of the signature.
+    matra : int
+        Mātrā count.
+    jaati : tuple[str, ...]
+        Jāti names for the signature length.
+    split_jaati : tuple[str, ...]
+        Per split group jāti summary (multi-pada signatures).
+    split_gana : tuple[str, ...]
+        Per split group gaṇa summary (multi-pada signatures).
+    split_length : tuple[str, ...]
+        Per split group length summary (multi-pada signatures).
+    split_matra : tuple[str, ...]
+        Per split group mātrā summary (multi-pada signatures).
+    """
+    signature: str
+    gana: str
+    display_gana: str
+    length: int
+    matra: int
+    jaati: Tuple[str, ...] = ()
+    split_jaati: Tuple[str, ...] = ()
+    split_gana: Tuple[str, ...] = ()
+    split_length: Tuple[str, ...] = ()
+    split_matra: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert metadata to a dictionary.
+
+        Returns
+        -------
+        dict
+            Dictionary representation of the signature metadata.
+        """
+        return asdict(self)
+
+
+# --------------------------------------------------------------------------- #
+
+
 @dataclass
 class TextAnalysisResult:
     """
@@ -7,8 +7,10 @@ reporting supported meter counts.
 
 import os
 import csv
-from typing import Optional, Set
+import functools
+from typing import Optional, Set, Tuple
 
+from .caches import sized
 from .types import MeterStats
 
 
@@ -51,36 +53,65 @@ def get_supported_meters(data_path: Optional[str] = None) -> MeterStats:
     if data_path is None:
         data_path = get_default_data_path()
 
-    def _read_meter_names(filename: str) -> Set[str]:
-        """
-        Read meter names from a CSV definition file.
-
-        Parameters
-        ----------
-        filename : str
-            CSV path containing meter definitions.
-
-        Returns
-        -------
-        set[str]
-            Unique meter names found in the file.
-        """
-        names = set()
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = True
-            for row in reader:
-                if header:
-                    header = False
-                    continue
-                if not row:
-                    continue
-                for name in row[0].split(','):
-                    name = name.strip()
-                    if name:
-                        names.add(name)
-        return names
+    total, sama, ardhasama, vishama, matra = _count_meters(
+        os.path.abspath(data_path)
+    )
+    return MeterStats(
+        total=total,
+        sama=sama,
+        ardhasama=ardhasama,
+        vishama=vishama,
+        matra=matra
+    )
+
+
+def _read_meter_names(filename: str) -> Set[str]:
+    """
+    Read meter names from a CSV definition file.
 
+    Parameters
+    ----------
+    filename : str
+        CSV path containing meter definitions.
+
+    Returns
+    -------
+    set[str]
+        Unique meter names found in the file.
+    """
+    names = set()
+    with open(filename, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = True
+        for row in reader:
+            if header:
+                header = False
+                continue
+            if not row:
+                continue
+            for name in row[0].split(','):
+                name = name.strip()
+                if name:
+                    names.add(name)
+    return names
+
+
+@functools.lru_cache(maxsize=None)
+@sized('get_supported_meters')
+def _count_meters(data_path: str) -> Tuple[int, int, int, int, int]:
+    """
+    Count meters per definition file (cached per data directory).
+
+    Parameters
+    ----------
+    data_path : str
+        Absolute path to meter definition data directory.
+
+    Returns
+    -------
+    tuple[int, int, int, int, int]
+        Total unique, sama, ardhasama, viṣama and mātrā meter counts.
+    """
     sama_meters = _read_meter_names(os.path.join(data_path, 'chanda_sama.csv'))
     ardhasama_meters = _read_meter_names(os.path.join(data_path, 'chanda_ardhasama.csv'))
     vishama_meters = _read_meter_names(os.path.join(data_path, 'chanda_vishama.csv'))
@@ -93,10 +124,10 @@ def get_supported_meters(data_path: Optional[str] = None) -> MeterStats:
         matra_meters
     )
 
-    return MeterStats(
-        total=len(all_meters),
-        sama=len(sama_meters),
-        ardhasama=len(ardhasama_meters),
-        vishama=len(vishama_meters),
-        matra=len(matra_meters)
+    return (
+        len(all_meters),
+        len(sama_meters),
+        len(ardhasama_meters),
+        len(vishama_meters),
+        len(matra_meters)
     )
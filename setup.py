@@ -52,6 +52,9 @@ setup(
             'sphinx-rtd-theme>=1.0',
             'sphinx-autodoc-typehints>=1.18',
         ],
+        'numpy': [
+            'numpy>=1.20',
+        ],
         'webapp': [
             'Flask>=2.2.2',
             'Flask-Uploads>=0.2.1',
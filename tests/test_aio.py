@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the asyncio interface.
+
+Extended Summary
+----------------
+Checks that the async methods and the async iterator reproduce the
+synchronous results with thread and process executors, that the producer
+is throttled by the bounded queue, and that closing the iterator stops
+the analysis.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from chanda import Chanda
+from chanda.utils import get_default_data_path
+
+VERSE = [
+    "माता रामो मत्पिता रामचन्द्रः",
+    "स्वामी रामो मत्सखा रामचन्द्रः।",
+    "सर्वस्वं मे रामचन्द्रो दयालुर्",
+    "नान्यं‌ जाने नैव जाने न जाने॥",
+    "लोकाभिरामं रणरङ्गधीरं",
+    "राजीवनेत्रं रघुवंशनाथम्।",
+    "कारुण्यरूपं करुणाकरं तं",
+    "श्रीरामचन्द्रं शरणं प्रपद्ये॥",
+]
+TEXT = "\n".join(VERSE)
+
+
+@pytest.fixture(scope="module")
+def chanda():
+    return Chanda(get_default_data_path())
+
+
+def _dump(items):
+    return [item.to_dict() for item in items]
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_async_methods(chanda):
+    async def run():
+        line = await chanda.analyze_line_async(VERSE[0], fuzzy=True)
+        text = await chanda.analyze_text_async(TEXT, verse=True, fuzzy=True)
+        return line, text
+
+    line, text = asyncio.run(run())
+    assert line.to_json() == chanda.analyze_line(VERSE[0], fuzzy=True).to_json()
+    assert text.to_json() == chanda.analyze_text(TEXT, verse=True, fuzzy=True).to_json()
+
+
+@pytest.mark.parametrize('segment', [False, True])
+def test_async_iterator_matches_sync(chanda, segment):
+    expected = _dump(chanda.iter_analyze_text(TEXT, verse=True, fuzzy=True, segment=segment))
+
+    with ThreadPoolExecutor(1) as executor:
+        items = asyncio.run(_collect(chanda.aiter_analyze_text(
+            TEXT, verse=True, fuzzy=True, segment=segment, executor=executor, max_queue=2
+        )))
+    assert _dump(items) == expected
+
+    with ProcessPoolExecutor(2) as executor:
+        items = asyncio.run(_collect(chanda.aiter_analyze_text(
+            TEXT, verse=True, fuzzy=True, segment=segment, executor=executor, max_queue=2
+        )))
+    assert _dump(items) == expected
+
+
+def test_backpressure_and_cancellation():
+    chanda = Chanda(get_default_data_path())
+    analyze = chanda._analyze_text_line
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(time.monotonic())
+        return analyze(*args, **kwargs)
+
+    chanda._analyze_text_line = counting
+    text = "\n".join(VERSE * 10)
+
+    async def run():
+        iterator = chanda.aiter_analyze_text(text, max_queue=2)
+        first = await iterator.__anext__()
+        await asyncio.sleep(0.2)
+        # One item consumed, at most ``max_queue`` buffered, one in progress
+        throttled = len(calls)
+        await iterator.aclose()
+        closed = len(calls)
+        await asyncio.sleep(0.1)
+        return first, throttled, closed, len(calls)
+
+    first, throttled, closed, final = asyncio.run(run())
+    assert first.index == 0
+    assert throttled <= 4
+    assert final == closed < len(VERSE) * 10
+
+
+def test_async_budget(chanda):
+    line = "रामं राजमणिः सदा विजयते"
+
+    async def run(executor):
+        bounded = await chanda.analyze_line_async(
+            line, fuzzy=True, executor=executor, max_candidates=0
+        )
+        text = await chanda.analyze_text_async(
+            line, fuzzy=True, executor=executor, deadline_ms=0
+        )
+        items = await _collect(chanda.aiter_analyze_text(
+            line, fuzzy=True, executor=executor, deadline_ms=0
+        ))
+        return bounded, text, items
+
+    with ThreadPoolExecutor(1) as threads, ProcessPoolExecutor(1) as processes:
+        for executor in (threads, processes):
+            bounded, text, items = asyncio.run(run(executor))
+            assert bounded.partial and not bounded.fuzzy
+            assert text.result.line[0].result.partial
+            assert items[0].result.partial
+
+
+def test_async_expected(chanda):
+    expected = ['अनुष्टुभ्']
+
+    async def run(executor):
+        line = await chanda.analyze_line_async(
+            VERSE[0], executor=executor, expected=expected
+        )
+        text = await chanda.analyze_text_async(
+            TEXT, verse=True, executor=executor, expected=expected
+        )
+        items = await _collect(chanda.aiter_analyze_text(
+            TEXT, verse=True, executor=executor, expected=expected
+        ))
+        return line, text, items
+
+    with ThreadPoolExecutor(1) as threads, ProcessPoolExecutor(1) as processes:
+        for executor in (threads, processes):
+            line, text, items = asyncio.run(run(executor))
+            assert line.unexpected
+            assert line.to_json() == chanda.analyze_line(
+                VERSE[0], expected=expected
+            ).to_json()
+            assert text.to_json() == chanda.analyze_text(
+                TEXT, verse=True, expected=expected
+            ).to_json()
+            assert _dump(items) == _dump(chanda.iter_analyze_text(
+                TEXT, verse=True, expected=expected
+            ))
+
+
+def test_process_workers_use_constructor_arguments():
+    chanda = Chanda(get_default_data_path(), symbols='YRTNBJSMLG', wildcard_limit=1)
+    line = "को न्वस्मिन् साम्प्रतं लोके गुणवान् कश्च वीर्यवान्"
+    expected = chanda.analyze_line(line).to_json()
+    assert expected != Chanda(get_default_data_path()).analyze_line(line).to_json()
+
+    async def run(executor):
+        return await chanda.analyze_line_async(line, executor=executor)
+
+    with ProcessPoolExecutor(1) as executor:
+        assert asyncio.run(run(executor)).to_json() == expected
@@ -220,6 +220,24 @@ class TestVerseAnalysis:
 
         assert len(results.result.verse) > 0, "Should identify at least one verse"
 
+    def test_segmented_verses_missing_line(self):
+        """
+        Test automatic verse segmentation when a line is missing.
+        """
+        lines = (
+            METER_EXAMPLES["शालिनी"][:1] + METER_EXAMPLES["शालिनी"][2:] +
+            METER_EXAMPLES["इन्द्रवज्रा"] + METER_EXAMPLES["भुजङ्गप्रयात"]
+        )
+        for text in ["\n".join(lines), "\n".join(x.rstrip("।॥") for x in lines)]:
+            results = analyze_text(text, verse_mode=True, segment=True)
+            verses = results.result.verse
+
+            assert [v.line_indices for v in verses] == [
+                [0, 1, 2], [3, 4, 5, 6], [7, 8, 9, 10]
+            ]
+            assert 'शालिनी' in verses[0].chanda[0]
+            assert verses[1].chanda == (['इन्द्रवज्रा'], 4)
+
 
 class TestCoreFeatures:
     """
@@ -299,6 +317,198 @@ class TestCoreFeatures:
         assert matra_count == 16, f"Expected 16 mātrās, got {matra_count}"
 
 
+class TestPadaSegmentation:
+    """
+    Test pāda segmentation of lines without pāda breaks.
+    """
+
+    @pytest.fixture
+    def chanda(self):
+        """
+        Create a Chanda instance.
+
+        Returns
+        -------
+        Chanda
+            Analyzer instance using the default data path.
+        """
+        return Chanda(get_default_data_path())
+
+    def test_full_verse_on_one_line(self, chanda):
+        """
+        Test splitting a full Indravajrā verse written on one line.
+
+        Parameters
+        ----------
+        chanda : Chanda
+            Analyzer fixture.
+        """
+        line = " ".join(x.rstrip("।॥") for x in METER_EXAMPLES["इन्द्रवज्रा"])
+        padas = chanda.segment_padas(line)
+
+        assert [p.line for p in padas] == [
+            x.rstrip("।॥") for x in METER_EXAMPLES["इन्द्रवज्रा"]
+        ]
+        assert all(any(n == 'इन्द्रवज्रा' for n, _ in p.chanda) for p in padas)
+
+    def test_wildcard_half_verse(self, chanda):
+        """
+        Test splitting an Anuṣṭubh half-verse (wildcard signatures).
+
+        Parameters
+        ----------
+        chanda : Chanda
+            Analyzer fixture.
+        """
+        line = "को न्वस्मिन् साम्प्रतं लोके गुणवान् कश्च वीर्यवान्"
+        padas = chanda.segment_padas(line)
+
+        assert [p.length for p in padas] == [8, 8]
+        assert padas[1].found
+
+    def test_fuzzy_pada(self, chanda):
+        """
+        Test splitting with one mis-scanned syllable.
+
+        Parameters
+        ----------
+        chanda : Chanda
+            Analyzer fixture.
+        """
+        lines = [x.rstrip("।॥") for x in METER_EXAMPLES["इन्द्रवज्रा"]]
+        lines[2] = "कारुण्यरूपं करुणकरं तं"
+        padas = chanda.segment_padas(" ".join(lines), fuzzy=True)
+
+        assert [p.line for p in padas] == lines
+        assert not padas[2].found
+        assert any(n == 'इन्द्रवज्रा' for n, _ in padas[2].fuzzy[0]['chanda'])
+
+    def test_boundary_split_group(self, chanda):
+        """
+        Test that a boundary match splits with its own split group.
+
+        Parameters
+        ----------
+        chanda : Chanda
+            Analyzer fixture.
+        """
+        # Signature splits as 2 x 8 (गजगति) and 4 x 4 (सती); the laghu
+        # at position 3 is only a pāda end of the 4 x 4 group
+        L, G = chanda.L, chanda.G
+        pada = L * 3 + G
+        assert chanda.find_pada_boundaries(pada * 4) == [0, 8, 16]
+        assert chanda.find_pada_boundaries(L * 4 + pada * 3) == [0, 4, 8, 12, 16]
+
+
+class TestWildcardSignatures:
+    """
+    Test matching of signatures with ``[LG]`` wildcards.
+    """
+
+    LINES = [
+        "धर्मक्षेत्रे कुरुक्षेत्रे",
+        "धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः",
+        "को न्वस्मिन् साम्प्रतं लोके गुणवान् कश्च वीर्यवान् "
+        "धर्मज्ञश्च कृतज्ञश्च सत्यवाक्यो दृढव्रतः",
+        METER_EXAMPLES["इन्द्रवज्रा"][0],
+    ]
+
+    def test_expansion(self):
+        """
+        Test that small wildcard signatures are expanded and large ones compiled.
+        """
+        chanda = Chanda(get_default_data_path())
+        stats = chanda.wildcard_stats()
+
+        assert stats['expanded'] > 0
+        assert stats['compiled'] > 0
+        assert stats['keys'] <= stats['expanded'] * stats['limit']
+        assert stats['bytes'] > 0
+        assert all('[' not in key for key in chanda.WILDCARD_KEYS)
+
+    def test_limit(self):
+        """
+        Test that the expansion limit does not change the matches.
+        """
+        expanded = Chanda(get_default_data_path())
+        compiled = Chanda(get_default_data_path(), wildcard_limit=0)
+
+        assert compiled.wildcard_stats()['keys'] == 0
+        for line in self.LINES:
+            result = expanded.analyze_line(line)
+            assert result.found
+            assert result.chanda == compiled.analyze_line(line).chanda
+
+
+class TestPadaBoundaries:
+    """
+    Test laghu pāda-final syllables inside multi-pāda lines.
+    """
+
+    @pytest.fixture
+    def chanda(self):
+        """
+        Create a Chanda instance.
+
+        Returns
+        -------
+        Chanda
+            Analyzer instance using the default data path.
+        """
+        return Chanda(get_default_data_path())
+
+    def test_half_verse(self, chanda):
+        """
+        Test an Indravajrā half-verse whose first pāda ends in laghu.
+
+        Parameters
+        ----------
+        chanda : Chanda
+            Analyzer fixture.
+        """
+        line = "लोकाभिरामं रणरङ्गधीर राजीवनेत्रं रघुवंशनाथम्"
+        result = chanda.analyze_line(line)
+
+        assert result.found
+        assert ('इन्द्रवज्रा', ('1', '2')) in result.chanda
+        assert [p.line for p in chanda.segment_padas(line)] == [
+            "लोकाभिरामं रणरङ्गधीर", "राजीवनेत्रं रघुवंशनाथम्"
+        ]
+
+    def test_boundaries_only(self, chanda):
+        """
+        Test that laghu is accepted at pāda boundaries and nowhere else.
+
+        Parameters
+        ----------
+        chanda : Chanda
+            Analyzer fixture.
+        """
+        signature = next(
+            s for s, boundaries in chanda.PADA_BOUNDARIES.items()
+            if s[boundaries[0][0]] == chanda.G
+        )
+        positions = chanda.PADA_BOUNDARIES[signature][0]
+        lg_str = ''.join(
+            chanda.L if idx in positions else c
+            for idx, c in enumerate(signature)
+        )
+        match_lg, _, found = chanda._lookup_lg(
+            lg_str, chanda.MULTI_CHANDA, boundaries=True
+        )
+        assert found and match_lg == signature
+        assert not chanda._lookup_lg(lg_str, chanda.MULTI_CHANDA)[2]
+
+        inner = next(
+            idx for idx, c in enumerate(signature)
+            if c == chanda.G and idx not in positions
+        )
+        lg_str = signature[:inner] + chanda.L + signature[inner + 1:]
+        assert chanda._lookup_lg(
+            lg_str, chanda.MULTI_CHANDA, boundaries=True
+        )[0] != signature
+
+
 class TestFuzzyMatching:
     """
     Test fuzzy matching functionality.
@@ -329,6 +539,24 @@ class TestFuzzyMatching:
         if result.fuzzy:
             assert len(result.fuzzy) <= 3, "Should return at most k matches"
 
+    def test_fuzzy_match_budget(self):
+        """
+        Test that ``deadline_ms`` and ``max_candidates`` mark partial results.
+        """
+        line = "रामं राजमणिः सदा विजयते"
+        full = analyze_line(line, fuzzy=True, k=5)
+        assert not full.partial and full.fuzzy
+
+        unbounded = analyze_line(line, fuzzy=True, k=5, max_candidates=10 ** 6)
+        assert not unbounded.partial
+        assert unbounded.fuzzy == full.fuzzy
+
+        result = analyze_line(line, fuzzy=True, k=5, max_candidates=0)
+        assert result.partial and not result.fuzzy
+
+        result = analyze_line(line, fuzzy=True, k=5, deadline_ms=0)
+        assert result.partial
+
 
 class TestEdgeCases:
     """
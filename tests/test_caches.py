@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for cache statistics.
+
+Extended Summary
+----------------
+Checks that ``cache_stats`` reports every library cache with counters
+and approximate sizes that follow analysis and ``clear_caches``.
+"""
+
+import chanda
+from chanda import Chanda
+from chanda.caches import CACHES, clear_caches, format_cache_stats
+from chanda.utils import get_default_data_path
+
+LINE = "रामं राजमणिः सदा विजयते"
+
+
+def test_cache_stats():
+    analyzer = Chanda(get_default_data_path())
+    clear_caches()
+    empty = chanda.cache_stats()
+    assert list(empty) == list(CACHES)
+    assert all(s['hits'] == s['misses'] == s['size'] == 0 for s in empty.values())
+
+    analyzer.analyze_line(LINE, fuzzy=True)
+    analyzer.analyze_line(LINE, fuzzy=True)
+    stats = chanda.cache_stats()
+
+    scansion = stats['Chanda.mark_syllable_weights']
+    assert (scansion['hits'], scansion['misses'], scansion['size']) == (1, 1, 1)
+    assert scansion['hit_rate'] == 0.5
+    assert scansion['bytes'] > empty['Chanda.mark_syllable_weights']['bytes']
+    assert stats['Chanda._editops']['size'] > 0
+    assert stats['SanskritTextProcessor.process_and_detect_scheme']['hits'] == 1
+    assert 'Chanda._editops' in format_cache_stats(stats)
+
+    clear_caches()
+    assert chanda.cache_stats()['Chanda._editops']['size'] == 0
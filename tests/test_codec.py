@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the gaṇa/laghu-guru codec.
+
+Extended Summary
+----------------
+Validates that ``GanaCodec`` agrees with the ``Chanda`` conversion methods
+and that the bitmask and NumPy-backed batch forms are consistent.
+"""
+
+import random
+
+import pytest
+
+from chanda import Chanda, GanaCodec
+from chanda.utils import get_default_data_path
+
+
+@pytest.fixture(scope="module")
+def patterns():
+    rng = random.Random(31)
+    return [
+        ''.join(rng.choice('LG') for _ in range(rng.randint(0, 30)))
+        for _ in range(200)
+    ]
+
+
+def test_chanda_delegates_to_codec(patterns):
+    chanda = Chanda(get_default_data_path())
+    codec = GanaCodec()
+    for lg in patterns:
+        gana = chanda.lg_to_gana(lg)
+        assert gana == codec.lg_to_gana(lg)
+        assert chanda.gana_to_lg(gana) == lg
+        assert chanda.count_matra(gana) == lg.count('L') + 2 * lg.count('G')
+
+
+def test_batch_and_mask(patterns):
+    codec = GanaCodec()
+    ganas = codec.lg_to_gana_many(patterns)
+    assert codec.gana_to_lg_many(ganas) == patterns
+    matras = codec.count_matra_many(ganas)
+    assert matras == [codec.count_matra(lg) for lg in patterns]
+
+    for lg, matra in zip(patterns, matras):
+        mask, length = codec.lg_to_mask(lg)
+        assert codec.mask_to_lg(mask, length) == lg
+        assert codec.mask_matra(mask, length) == matra
+
+    assert codec.lg_to_gana('LGGGGG') == 'YM'
+    assert codec.lg_to_mask('LGG') == (6, 3)
+
+
+def test_numpy_packed(patterns):
+    np = pytest.importorskip("numpy")
+    codec = GanaCodec()
+    masks, lengths = codec.pack_many(patterns)
+    counts = codec.count_matra_packed(masks, lengths)
+    expected = codec.count_matra_many(patterns, as_array=True)
+    assert np.array_equal(counts, expected)
+
+    with pytest.raises(ValueError):
+        codec.pack_many(['G' * 65])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the differential comparison harness.
+
+Extended Summary
+----------------
+Compares the packaged definitions with a copy that lacks one meter, and
+checks the reported line, verse and meter count differences, the
+``compare`` subcommand, and saved-run baselines.
+"""
+
+import json
+import shutil
+
+import pytest
+
+from chanda.cli import main
+from chanda.compare import compare, compare_runs, format_comparison, run_configuration
+from chanda.utils import get_default_data_path
+
+TEXT = "\n".join([
+    "माता रामो मत्पिता रामचन्द्रः",
+    "स्वामी रामो मत्सखा रामचन्द्रः।",
+    "सर्वस्वं मे रामचन्द्रो दयालुर्",
+    "नान्यं‌ जाने नैव जाने न जाने॥",
+    "लोकाभिरामं रणरङ्गधीरं",
+    "राजीवनेत्रं रघुवंशनाथम्।",
+    "कारुण्यरूपं करुणाकरं तं",
+    "श्रीरामचन्द्रं शरणं प्रपद्ये॥",
+])
+
+
+@pytest.fixture
+def reduced_data(tmp_path):
+    """
+    Copy of the packaged definitions without शालिनी.
+    """
+    data_path = tmp_path / 'data'
+    shutil.copytree(get_default_data_path(), data_path)
+    sama = data_path / 'chanda_sama.csv'
+    lines = sama.read_text(encoding='utf-8').splitlines(keepends=True)
+    sama.write_text(
+        ''.join(line for line in lines if not line.startswith('शालिनी')),
+        encoding='utf-8'
+    )
+    return str(data_path)
+
+
+def test_compare_definition_sets(reduced_data):
+    report = compare(TEXT, None, reduced_data, verse=True)
+
+    assert report['lines'] == 8
+    assert [d['index'] for d in report['line_differences']] == [0, 1, 2, 3]
+    assert all('शालिनी' in d['a']['chanda'] for d in report['line_differences'])
+    assert not any(d['b']['found'] for d in report['line_differences'])
+    assert report['verse_differences'][0]['a'] == ['शालिनी']
+    assert report['meter_counts']['line_match']['शालिनी'] == [4, 0]
+    assert report['meter_counts']['verse']['शालिनी'] == [1, 0]
+    assert 'scansion' in report['stages']
+    assert 'Lines with different results: 4 / 8' in format_comparison(report)
+
+    same = compare(TEXT, None, None, parallel=True)
+    assert not same['line_differences'] and not same['meter_counts']
+
+
+def test_compare_cli_and_baseline(reduced_data, tmp_path, capsys):
+    corpus = tmp_path / 'corpus.txt'
+    corpus.write_text(TEXT, encoding='utf-8')
+    run = tmp_path / 'run.json'
+
+    assert main(['compare', str(corpus), '--save-run', str(run)]) == 0
+    assert main([
+        'compare', str(corpus), '--data-path', reduced_data,
+        '--baseline', str(run), '--format', 'json'
+    ]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert len(report['line_differences']) == 4
+
+    other = run_configuration("रामो राजमणिः सदा विजयते")
+    with pytest.raises(ValueError):
+        compare_runs(json.loads(run.read_text(encoding='utf-8')), other)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the analysis daemon and its CLI client.
+
+Extended Summary
+----------------
+Runs a ``ChandaDaemon`` in a background thread and checks that results
+served over the Unix socket match in-process analysis, including the
+``chanda --connect`` output and its fallback when no daemon is running.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+import pytest
+
+from chanda import Chanda
+from chanda.exceptions import ChandaError
+from chanda.cli import main
+from chanda.daemon import ChandaDaemon, DaemonClient, DaemonError
+from chanda.utils import get_default_data_path
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'),
+    reason="Unix domain sockets are not supported"
+)
+
+LINE = "रामो राजमणिः सदा विजयते रामं रमेशं भजे"
+TEXT = "\n".join([
+    "माता रामो मत्पिता रामचन्द्रः",
+    "स्वामी रामो मत्सखा रामचन्द्रः।",
+    "सर्वस्वं मे रामचन्द्रो दयालुर्",
+    "नान्यं‌ जाने नैव जाने न जाने॥",
+])
+
+
+@pytest.fixture(scope="module")
+def daemon():
+    # Short path: AF_UNIX paths are limited to ~100 bytes
+    directory = tempfile.mkdtemp(prefix='chanda-')
+    socket_path = os.path.join(directory, 'd.sock')
+    server = ChandaDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    os.rmdir(directory)
+
+
+def test_client_matches_in_process(daemon):
+    chanda = Chanda(get_default_data_path())
+    with DaemonClient(daemon.socket_path) as client:
+        assert client.ping()['pid'] == os.getpid()
+
+        remote = client.analyze_line(LINE, fuzzy=True)
+        local = chanda.analyze_line(LINE, fuzzy=True)
+        assert remote.to_json() == local.to_json()
+
+        remote = client.analyze_text(TEXT, verse=True, fuzzy=True)
+        local = chanda.analyze_text(TEXT, verse=True, fuzzy=True)
+        assert remote.to_json() == local.to_json()
+
+        assert client.meters().total > 0
+
+        with pytest.raises(DaemonError):
+            client.request('analyze_line')
+        # The connection stays usable after an error response
+        assert client.analyze_line(LINE, fuzzy=True).to_json() == \
+            chanda.analyze_line(LINE, fuzzy=True).to_json()
+
+
+def test_cli_connect_and_fallback(daemon, capsys):
+    for extra in (['--format', 'json'], ['--format', 'simple', '-v']):
+        args = [TEXT if '-v' in extra else LINE] + extra
+        assert main(args) == 0
+        expected = capsys.readouterr().out
+
+        assert main(args + ['--connect', '--socket', daemon.socket_path]) == 0
+        assert capsys.readouterr().out == expected
+
+        missing = os.path.join(os.path.dirname(daemon.socket_path), 'none.sock')
+        assert main(args + ['--connect', '--socket', missing]) == 0
+        assert capsys.readouterr().out == expected
+
+
+def test_connect_client_stays_thin(daemon):
+    code = (
+        "import sys\n"
+        "from chanda.cli import main\n"
+        "assert main(sys.argv[1:]) == 0\n"
+        "assert 'chanda.core' not in sys.modules\n"
+    )
+    for extra in (['--format', 'simple'], ['--format', 'simple', '-v']):
+        args = [TEXT if '-v' in extra else LINE] + extra
+        process = subprocess.run(
+            [sys.executable, '-c', code, *args,
+             '--connect', '--socket', daemon.socket_path],
+            capture_output=True,
+            text=True,
+        )
+        assert process.returncode == 0, process.stderr
+
+
+def test_refuses_non_socket_path(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_text('keep me', encoding='utf-8')
+    with pytest.raises(ChandaError):
+        ChandaDaemon(str(path), service=object())
+    assert path.read_text(encoding='utf-8') == 'keep me'
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for analysis against expected meters.
+
+Extended Summary
+----------------
+Checks that constrained analysis reports the expected subset of the open
+identification, flags lines fitting no expected meter, restricts fuzzy
+matching and verse aggregation, and rejects unknown meter names.
+"""
+
+import pytest
+
+from chanda import Chanda
+from chanda.utils import get_default_data_path
+
+TEXT = "\n".join([
+    "धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः ।",
+    "मामकाः पाण्डवाश्चैव किमकुर्वत सञ्जय ॥",
+    "रामं राजमणिः सदा विजयते",
+    "फुलं वसन्ततिलकं तिलकं वनाल्याः",
+])
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return Chanda(get_default_data_path())
+
+
+def test_expected_line(analyzer):
+    line = TEXT.split("\n")[0]
+    result = analyzer.analyze_line(line, expected=['अनुष्टुभ्'])
+    assert result.found and not result.unexpected
+    assert result.chanda == analyzer.analyze_line(line).chanda
+
+    other = analyzer.analyze_line(line, fuzzy=True, expected=['वसन्ततिलका'])
+    assert not other.found and other.unexpected
+    assert not other.chanda and not other.fuzzy
+
+    # Fuzzy matching sees only the expected signatures
+    line = TEXT.split("\n")[3]
+    assert analyzer.analyze_line(line, fuzzy=True).fuzzy[0]['chanda'] == [('ऋषभ', ('',))]
+    result = analyzer.analyze_line(line, fuzzy=True, expected=['वसन्ततिलका'])
+    assert result.unexpected
+    assert [match['chanda'] for match in result.fuzzy] == [[('वसन्ततिलका', ('',))]]
+
+    assert not analyzer.analyze_line(line).unexpected
+    with pytest.raises(ValueError):
+        analyzer.analyze_line(line, expected=['no such meter'])
+
+
+def test_expected_shared_signature(analyzer):
+    # LLLGLLLG is a single-pada signature (गजगति) and a half of सती
+    line = "हरिहरौ हरिहरौ"
+    tables = analyzer._expected_signatures(['सती'])
+    assert all(tables['SINGLE_CHANDA'].values())
+    assert all(tables['MULTI_CHANDA'].values())
+
+    result = analyzer.analyze_line(line, expected=['सती'])
+    assert result.found and not result.unexpected
+    assert {name for name, _ in result.chanda} == {'सती'}
+    assert 'अनुष्टुप्' in analyzer.analyze_line(line).jaati
+    assert 'अनुष्टुप्' not in result.jaati
+
+
+def test_expected_text(analyzer):
+    expected = ['अनुष्टुभ्']
+    result = analyzer.analyze_text(TEXT, verse=True, fuzzy=True, expected=expected)
+    lines = [line.result for line in result.result.line]
+    assert [line.unexpected for line in lines] == [False, False, True, True]
+    assert all(
+        name in expected
+        for line in lines for match in line.fuzzy for name, _ in match['chanda']
+    )
+    assert result.result.verse[0].chanda[0] == expected
+
+    full = analyzer.analyze_text(TEXT, verse=True, fuzzy=True)
+    assert [line.result.chanda for line in full.result.line][:2] == \
+        [line.chanda for line in lines][:2]
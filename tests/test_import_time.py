@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import-time regression tests.
+
+Extended Summary
+----------------
+Runs ``python -X importtime`` in a subprocess and checks that
+``import chanda`` and the lightweight CLI paths (``--version``,
+``--list-meters``) do not import heavy dependencies, and that the
+package import stays within a time budget.
+
+Notes
+-----
+The budget (in microseconds) can be overridden with the
+``CHANDA_IMPORT_BUDGET_US`` environment variable on slow machines.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import chanda
+
+
+HEAVY_MODULES = {
+    'chanda.core',
+    'Levenshtein',
+    'indic_transliteration',
+    'sanskrit_text',
+    'numpy',
+}
+
+IMPORT_BUDGET_US = int(os.environ.get('CHANDA_IMPORT_BUDGET_US', 150000))
+
+
+def _importtime(*args):
+    """Run Python with ``-X importtime``; return ``{module: cumulative_us}``."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert process.returncode == 0, process.stderr
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize('args', [
+    ('-c', 'import chanda'),
+    ('-m', 'chanda.cli', '--version'),
+    ('-m', 'chanda.cli', '--list-meters'),
+])
+def test_no_heavy_imports(args):
+    """
+    Test that lightweight entry points do not import heavy modules.
+    """
+    modules = _importtime(*args)
+    assert 'chanda' in modules
+    assert not HEAVY_MODULES & set(modules)
+
+
+def test_import_budget():
+    """
+    Test that ``import chanda`` stays within the time budget.
+    """
+    modules = _importtime('-c', 'import chanda')
+    assert modules['chanda'] < IMPORT_BUDGET_US
+
+
+def test_lazy_attributes():
+    """
+    Test that lazily exported names resolve on first access.
+    """
+    assert 'Chanda' in dir(chanda)
+    assert chanda.Chanda.__module__ == 'chanda.core'
+    for name in chanda.__all__:
+        assert getattr(chanda, name) is not None
+    with pytest.raises(AttributeError):
+        chanda.does_not_exist
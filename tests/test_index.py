@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the corpus index.
+
+Extended Summary
+----------------
+Checks boolean queries over indexed analysis results against the results
+themselves, and that a saved index answers the same queries.
+"""
+
+from array import array
+
+from chanda import Chanda, CorpusIndex
+from chanda.index import difference, intersect, union
+from chanda.utils import get_default_data_path
+
+TEXT = "\n".join([
+    "वागर्थाविव सम्पृक्तौ वागर्थप्रतिपत्तये ।",
+    "जगतः पितरौ वन्दे पार्वतीपरमेश्वरौ ॥",
+    "धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः ।",
+    "मामकाः पाण्डवाश्चैव किमकुर्वत सञ्जय ॥",
+    "रामं राजमणिः सदा विजयते",
+])
+
+
+def test_posting_operations():
+    a = array('I', [1, 3, 5, 7])
+    b = array('I', [3, 4, 7])
+    assert list(intersect(a, b)) == [3, 7]
+    assert list(union(a, b)) == [1, 3, 4, 5, 7]
+    assert list(difference(a, b)) == [1, 5]
+
+
+def test_corpus_index(tmp_path):
+    analyzer = Chanda(get_default_data_path())
+    result = analyzer.analyze_text(TEXT, verse=True, fuzzy=True, verse_lines=2)
+    index = CorpusIndex()
+    index.add(result, document='a')
+    index.add(result.to_dict(), document='b')
+    assert len(index) == 10
+
+    lines = result.result.line
+    expected = [
+        ('b', idx // 2, idx) for idx, line in enumerate(lines)
+        if 'अनुष्टुभ्' in dict(line.result.chanda)
+    ]
+    found = index.find(chanda='अनुष्टुभ्', document='b')
+    assert index.locate(found) == expected
+    assert index.verses(found) == [('b', 0), ('b', 1)]
+    assert list(index.find(length=[lines[0].result.length, 999])) == \
+        list(index.find(length=lines[0].result.length))
+    assert len(index.find(exclude={'document': 'a'})) == 5
+
+    path = str(tmp_path / 'corpus.idx')
+    index.save(path)
+    loaded = CorpusIndex.load(path)
+    assert loaded.documents == ['a', 'b']
+    for name in ('chanda', 'fuzzy', 'gana', 'length', 'verse_chanda', 'position'):
+        for value in index.values(name):
+            assert list(loaded.postings(name, value)) == list(index.postings(name, value))
+    assert loaded.locate(range(len(loaded))) == index.locate(range(len(index)))
+
+    loaded.add(result, document='c')
+    assert loaded.verses(loaded.find(chanda='अनुष्टुभ्', position=0))[-1] == ('c', 1)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for as-you-type matching.
+
+Extended Summary
+----------------
+Checks the signature trie (including wildcard branches and the final
+laghu rule) and that the incremental matcher keeps the same scansion as
+a full scan while text is typed and edited.
+"""
+
+from chanda import Chanda
+from chanda.prefix import SignatureTrie
+from chanda.utils import get_default_data_path
+
+LINE = "धर्मक्षेत्रे कुरुक्षेत्रे"
+
+
+def test_signature_trie():
+    trie = SignatureTrie({
+        'GGL': [('a', ('',))],
+        'G[LG]G': [('b', ('',))],
+        'LL': [('c', ('',))],
+    })
+    assert [c['signature'] for c in trie.candidates('G')] == ['GGL', 'G[LG]G']
+    assert [c['next'] for c in trie.candidates('G')] == ['G', '[LG]']
+    assert [c['remaining'] for c in trie.candidates('GL')] == [1]
+    assert trie.candidates('LG') == []
+
+    # A final laghu completes signatures ending in guru
+    complete = {c['signature']: c['complete'] for c in trie.candidates('GGL')}
+    assert complete == {'GGL': True, 'G[LG]G': True}
+
+
+def test_prefix_matcher():
+    analyzer = Chanda(get_default_data_path())
+    matcher = analyzer.prefix_matcher()
+    for end in range(1, len(LINE) + 1):
+        matcher.append(LINE[end - 1])
+        assert matcher.lg == analyzer._scan_line(LINE[:end])['lg_str']
+
+    assert matcher.candidates() == analyzer.match_prefix(matcher.lg)
+    anustubh = [c for c in matcher.candidates() if c['remaining'] == 0]
+    assert anustubh and all(c['complete'] for c in anustubh)
+
+    # Edits before the end re-scan the affected syllables
+    for text in ["धर्मक्षे", "धर्मक्षेत्र", "धर्म", "धर", "धर्", ""]:
+        matcher.update(text)
+        scan = analyzer._scan_line(text)
+        assert matcher.lg == (scan['lg_str'] if scan else '')
+
+
+def test_prefix_matcher_replace():
+    analyzer = Chanda(get_default_data_path())
+    matcher = analyzer.prefix_matcher()
+
+    # Replacements of several characters in one update, including a
+    # virāma that changes the weight of an earlier settled syllable
+    edits = [
+        ("मतपत", "मत्प"),
+        ("रामो मतपत", "रामो मत्प"),
+        (" कसस", "कसस"),
+        (LINE, "धर्मक्षेत्रे कुरुक्षत्र"),
+        (LINE, "धर्मक्षेत्रं कुरुक्षेत्रे"),
+    ]
+    for before, after in edits:
+        matcher.reset()
+        matcher.update(before)
+        matcher.update(after)
+        assert matcher.lg == analyzer._scan_line(after)['lg_str']
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for stage-level timing instrumentation.
+
+Extended Summary
+----------------
+Checks that enabled instrumentation records every pipeline stage, calls
+hooks, leaves results unchanged, and records nothing when disabled.
+"""
+
+from chanda import Chanda
+from chanda.profiling import Instrumentation, format_stats
+from chanda.utils import get_default_data_path
+
+TEXT = "\n".join([
+    "माता रामो मत्पिता रामचन्द्रः",
+    "स्वामी रामो मत्सखा रामचन्द्रः।",
+    "रामं राजमणिः सदा विजयते",
+    "नान्यं‌ जाने नैव जाने न जाने॥",
+])
+
+
+def test_stage_stats_and_hooks():
+    chanda = Chanda(get_default_data_path())
+    expected = chanda.analyze_text(TEXT, verse=True, fuzzy=True, scheme='iast').to_json()
+    assert chanda.stats() == {}
+
+    events = []
+    chanda.enable_instrumentation([lambda stage, ms: events.append(stage)])
+    result = chanda.analyze_text(TEXT, verse=True, fuzzy=True, scheme='iast')
+    assert result.to_json() == expected
+
+    stats = chanda.stats()
+    assert list(stats) == [
+        'process_text', 'scansion', 'lookup', 'wildcard',
+        'fuzzy', 'transform', 'verse', 'format'
+    ]
+    assert stats['scansion']['calls'] == 4
+    assert stats['lookup']['calls'] == 8
+    assert stats['verse']['calls'] == 1
+    assert sum(s['calls'] for s in stats.values()) == len(events)
+    assert all(s['total_ms'] >= s['max_ms'] >= 0 for s in stats.values())
+    assert 'wildcard' in format_stats(stats)
+
+    instrumentation = chanda.disable_instrumentation()
+    chanda.analyze_line("माता रामो मत्पिता रामचन्द्रः")
+    assert chanda.stats() == {}
+    assert instrumentation.stats() == stats
+
+
+def test_instrumentation_reset():
+    instrumentation = Instrumentation()
+    instrumentation.record('custom', 2.0)
+    instrumentation.record('scansion', 1.0)
+    instrumentation.record('custom', 4.0)
+    assert instrumentation.stats() == {
+        'scansion': {'calls': 1, 'total_ms': 1.0, 'mean_ms': 1.0, 'max_ms': 1.0},
+        'custom': {'calls': 2, 'total_ms': 6.0, 'mean_ms': 3.0, 'max_ms': 4.0},
+    }
+    instrumentation.reset()
+    assert instrumentation.stats() == {}
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for incremental re-analysis.
+
+Extended Summary
+----------------
+Checks that ``Chanda.reanalyze`` gives the same result as a full
+``analyze_text`` of the edited text while scanning only the edited lines.
+"""
+
+import pytest
+
+from chanda import Chanda
+from chanda.utils import get_default_data_path
+
+LINES = [
+    "वागर्थाविव सम्पृक्तौ वागर्थप्रतिपत्तये ।",
+    "जगतः पितरौ वन्दे पार्वतीपरमेश्वरौ ॥",
+    "रामं राजमणिः सदा विजयते",
+    "धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः ।",
+    "मामकाः पाण्डवाश्चैव किमकुर्वत सञ्जय ॥",
+    "यदा यदा हि धर्मस्य ग्लानिर्भवति भारत",
+]
+
+
+@pytest.mark.parametrize('options', [
+    dict(verse=True, fuzzy=True, verse_lines=2),
+    dict(verse=True, fuzzy=True, segment=True),
+    dict(fuzzy=True, scheme='iast'),
+])
+def test_reanalyze(options, monkeypatch):
+    analyzer = Chanda(get_default_data_path())
+    previous = analyzer.analyze_text('\n'.join(LINES), **options)
+    before = previous.to_json()
+
+    edited = list(LINES)
+    edited[2] = "रामं राजमणी सदा विजयते"
+    edited.insert(4, "परित्राणाय साधूनां विनाशाय च दुष्कृताम्")
+    del edited[0]
+    edited_text = '\n'.join(edited)
+
+    scanned = []
+    analyze_line = analyzer.analyze_line
+    monkeypatch.setattr(
+        analyzer, 'analyze_line',
+        lambda line, **kwargs: scanned.append(line) or analyze_line(line, **kwargs)
+    )
+    result = analyzer.reanalyze(previous, edited_text, **options)
+    assert scanned == [edited[1], edited[3]]
+    monkeypatch.undo()
+
+    assert result.to_json() == analyzer.analyze_text(edited_text, **options).to_json()
+    assert previous.to_json() == before
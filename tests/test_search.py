@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for scansion pattern search.
+
+Extended Summary
+----------------
+Checks exact, wildcard and approximate pattern search over an indexed
+corpus against a direct scan of the line scansions.
+"""
+
+import re
+
+import pytest
+
+from chanda import Chanda, CorpusIndex
+from chanda.search import ScansionSearch
+from chanda.utils import get_default_data_path
+
+TEXT = "\n".join([
+    "वागर्थाविव सम्पृक्तौ वागर्थप्रतिपत्तये ।",
+    "जगतः पितरौ वन्दे पार्वतीपरमेश्वरौ ॥",
+    "धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः ।",
+    "मामकाः पाण्डवाश्चैव किमकुर्वत सञ्जय ॥",
+    "रामं राजमणिः सदा विजयते",
+    "",
+    "उद्यानेषु विचित्रभोजनविधिस्तीव्रातितीव्रं तपः",
+])
+
+
+def edit_distance(a, b):
+    row = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j, y in enumerate(b, 1):
+            previous, row[j] = row[j], min(
+                row[j] + 1, row[j - 1] + 1, previous + (x != y)
+            )
+    return row[-1]
+
+
+@pytest.fixture(scope='module')
+def search():
+    analyzer = Chanda(get_default_data_path())
+    index = CorpusIndex()
+    index.add(analyzer.analyze_text(TEXT), document='a')
+    return ScansionSearch(index, analyzer)
+
+
+def scansions(search):
+    return search.index.scansions().decode().split('\n')[1:-1]
+
+
+@pytest.mark.parametrize('pattern', ['GLG', 'LG-G', 'GG--L', 'LLLL'])
+def test_exact(search, pattern):
+    regex = pattern.replace('-', '[LG]')
+    lines = scansions(search)
+    assert list(search.lines(pattern)) == [
+        idx for idx, lg in enumerate(lines) if lg and re.search(regex, lg)
+    ]
+    assert list(search.lines(pattern, whole=True)) == [
+        idx for idx, lg in enumerate(lines) if lg and re.fullmatch(regex, lg)
+    ]
+    for match in search.search(pattern):
+        lg = lines[match['line']]
+        found = lg[match['offset']:match['offset'] + match['length']]
+        assert re.fullmatch(regex, found)
+
+
+def test_gana_pattern(search):
+    lines = scansions(search)
+    first = search.analyzer.analyze_line(TEXT.split('\n')[0]).gana
+    matches = search.search(first, whole=True)
+    assert [match['line'] for match in matches] == [
+        idx for idx, lg in enumerate(lines) if lg == lines[0]
+    ]
+    assert matches[0]['length'] == len(lines[0])
+    with pytest.raises(ValueError):
+        search.parse('LGX')
+
+
+@pytest.mark.parametrize('max_edits', [1, 2])
+def test_approximate(search, max_edits):
+    lines = scansions(search)
+    pattern = lines[4][:5] + 'L' + lines[4][5:9]
+    expected = {}
+    for idx, lg in enumerate(lines):
+        edits = min(
+            (edit_distance(pattern, lg[i:j])
+             for i in range(len(lg)) for j in range(i + 1, len(lg) + 1)),
+            default=max_edits + 1
+        )
+        if edits <= max_edits:
+            expected[idx] = edits
+    matches = search.search(pattern, max_edits=max_edits)
+    assert {match['line']: match['edits'] for match in matches} == expected
+    assert [match['edits'] for match in matches] == \
+        sorted(match['edits'] for match in matches)
+
+    whole = search.search(lines[1] + 'G', max_edits=max_edits, whole=True)
+    assert [match['line'] for match in whole if match['edits']] == [1]
+
+
+def test_saved_index(search, tmp_path):
+    path = str(tmp_path / 'corpus.idx')
+    search.index.save(path)
+    loaded = CorpusIndex.load(path)
+    assert loaded.scansions() == search.index.scansions()
+    other = ScansionSearch(loaded, search.analyzer)
+    assert other.search('LG-G', max_edits=1) == search.search('LG-G', max_edits=1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the HTTP JSON service.
+
+Extended Summary
+----------------
+Runs a ``ChandaHTTPServer`` on an ephemeral port and checks endpoint
+results against in-process analysis, keep-alive connection reuse,
+micro-batching of concurrent line requests, and latency statistics.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+
+import pytest
+
+from chanda import Chanda
+from chanda.server import ChandaHTTPServer, LatencyHistogram
+from chanda.utils import get_default_data_path
+
+LINES = [
+    "रामो राजमणिः सदा विजयते रामं रमेशं भजे",
+    "माता रामो मत्पिता रामचन्द्रः",
+    "लोकाभिरामं रणरङ्गधीरं",
+    "को न्वस्मिन् साम्प्रतं लोके गुणवान् कश्च वीर्यवान्",
+]
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ChandaHTTPServer(('127.0.0.1', 0), batch_window_ms=50, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(connection, method, path, payload=None):
+    body = json.dumps(payload).encode('utf-8') if payload is not None else None
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_endpoints_keep_alive(server):
+    chanda = Chanda(get_default_data_path())
+    connection = HTTPConnection('127.0.0.1', server.server_address[1])
+
+    status, result = _request(connection, 'POST', '/analyze_line', {
+        'text': LINES[0], 'fuzzy': True
+    })
+    assert status == 200
+    expected = chanda.analyze_line(LINES[0], fuzzy=True).to_json()
+    assert json.dumps(result, ensure_ascii=False, indent=2) == expected
+    sock = connection.sock
+
+    status, result = _request(connection, 'POST', '/analyze_text', {
+        'text': '\n'.join(LINES), 'verse': True
+    })
+    assert status == 200
+    assert len(result['result']['line']) == len(LINES)
+
+    status, result = _request(connection, 'GET', '/meters')
+    assert status == 200 and result['total'] > 0
+
+    assert _request(connection, 'POST', '/analyze_line', {'txt': ''})[0] == 400
+    assert _request(connection, 'POST', '/analyze_line', {
+        'text': LINES[0], 'bogus': 1
+    })[0] == 400
+    for options in ({'k': [1]}, {'fuzzy': 'yes'}, {'k': True},
+                    {'expected': ['अनुष्टुभ्', 1]}, {'expected': 'अनुष्टुभ्'}):
+        assert _request(connection, 'POST', '/analyze_line', {
+            'text': LINES[0], **options
+        })[0] == 400
+    for path in ('/analyze_line', '/analyze_text'):
+        assert _request(connection, 'POST', path, {
+            'text': LINES[0], 'data_path': '/tmp'
+        })[0] == 400
+    for options in ({'bogus': 1}, {'verse': 'yes'}, {'segment': 1},
+                    {'deadline_ms': '5'}, {'expected': [1]}):
+        assert _request(connection, 'POST', '/analyze_text', {
+            'text': LINES[0], **options
+        })[0] == 400
+    status, result = _request(connection, 'POST', '/analyze_text', {
+        'text': LINES[0], 'expected': ['वसन्ततिलका'], 'deadline_ms': 50
+    })
+    assert status == 200
+    assert _request(connection, 'GET', '/nothing')[0] == 404
+
+    # All requests went over the same connection
+    assert connection.sock is sock
+    connection.close()
+
+
+def test_micro_batching(server):
+    port = server.server_address[1]
+    before = server.batcher.batches
+
+    def analyze(line):
+        connection = HTTPConnection('127.0.0.1', port)
+        try:
+            return _request(connection, 'POST', '/analyze_line', {'text': line})
+        finally:
+            connection.close()
+
+    requests = LINES * 4
+    with ThreadPoolExecutor(len(requests)) as executor:
+        responses = list(executor.map(analyze, requests))
+
+    assert all(status == 200 for status, _ in responses)
+    assert [r['line'] for _, r in responses] == requests
+    assert server.batcher.batches - before < len(requests)
+
+    stats = _request(HTTPConnection('127.0.0.1', port), 'GET', '/stats')[1]
+    latency = stats['latency']['/analyze_line']
+    assert latency['count'] >= len(requests)
+    assert latency['buckets']['+Inf'] == latency['count']
+    assert stats['caches']['Chanda.mark_syllable_weights']['size'] >= len(LINES)
+
+
+def test_batcher_unhashable_options(server):
+    future = server.batcher.submit(LINES[0], k=[1])
+    with pytest.raises(TypeError):
+        future.result(timeout=10)
+    assert server.batcher.submit(LINES[0]).result(timeout=10)['found']
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=(1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+    snapshot = histogram.to_dict()
+    assert snapshot['buckets'] == {'1': 2, '10': 3, '+Inf': 4}
+    assert snapshot['max_ms'] == 50
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for metrically similar verse search.
+
+Extended Summary
+----------------
+Checks the verse distance, that exhaustive search ranks every verse by
+it, and that hashing finds a verse borrowed into another document.
+"""
+
+from chanda import Chanda, CorpusIndex
+from chanda.similar import SimilarVerses
+from chanda.utils import get_default_data_path
+
+TEXT = "\n".join([
+    "वागर्थाविव सम्पृक्तौ वागर्थप्रतिपत्तये ।",
+    "जगतः पितरौ वन्दे पार्वतीपरमेश्वरौ ॥",
+    "धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः ।",
+    "मामकाः पाण्डवाश्चैव किमकुर्वत सञ्जय ॥",
+    "उद्यानेषु विचित्रभोजनविधिस्तीव्रातितीव्रं तपः",
+    "कौपीनावरणं सुवस्त्रममितं भिक्षाटनं मण्डनम् ।",
+])
+
+
+def test_similar_verses():
+    analyzer = Chanda(get_default_data_path())
+    result = analyzer.analyze_text(TEXT, verse=True, verse_lines=2)
+    index = CorpusIndex()
+    index.add(result, document='a')
+    index.add(result, document='b')
+    similar = SimilarVerses(index, analyzer)
+    assert len(similar.verses) == 6
+
+    assert similar.distance(['LGG', 'GG'], ['LLG']) == 3
+
+    query = [similar.verses[1][3][0], similar.verses[2][3][1]]
+    expected = sorted(
+        similar.distance(query, padas) for *_, padas in similar.verses
+    )
+    found = similar.nearest(query, k=10, exhaustive=True)
+    assert [match['distance'] for match in found] == expected
+
+    for verse in range(3):
+        nearest = similar.similar('a', verse, k=1)
+        assert nearest[0]['document'] == 'b'
+        assert nearest[0]['verse'] == verse
+        assert nearest[0]['distance'] == 0
+        assert nearest[0]['lines'] == [6 + 2 * verse, 7 + 2 * verse]
+
+    text = "\n".join(TEXT.split("\n")[4:])
+    assert similar.nearest(text, k=1)[0]['distance'] == 0
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the result store.
+
+Extended Summary
+----------------
+Checks that ``analyze_text(save_path=...)`` reads back saved results for
+the same input, options and definitions, saves new ones otherwise, and
+that the store evicts least recently used entries beyond its limit.
+"""
+
+import json
+import os
+
+from chanda import Chanda
+from chanda.store import INDEX_FILE, ResultStore
+from chanda.utils import get_default_data_path
+
+TEXT = "रामं राजमणिः सदा विजयते\nवागर्थाविव सम्पृक्तौ वागर्थप्रतिपत्तये"
+
+
+def test_read_through(tmp_path, monkeypatch):
+    analyzer = Chanda(get_default_data_path())
+    first = analyzer.analyze_text(TEXT, save_path=str(tmp_path))
+    assert first.path['json'].startswith('result_')
+    assert os.path.exists(tmp_path / first.path['json'])
+    assert os.path.exists(tmp_path / first.path['txt'])
+
+    # A hit does not analyze the text again
+    monkeypatch.setattr(analyzer, 'analyze_line', None)
+    second = analyzer.analyze_text(TEXT, save_path=str(tmp_path))
+    assert second.to_json() == first.to_json()
+    monkeypatch.undo()
+
+    # Other options are stored separately
+    other = analyzer.analyze_text(TEXT, save_path=str(tmp_path), scheme='iast')
+    assert other.path['json'] != first.path['json']
+
+    with open(tmp_path / INDEX_FILE, encoding='utf-8') as f:
+        entries = json.load(f)['entries']
+    assert len(entries) == 2
+    # The hit was recorded with the index update of the second result
+    assert sum(entry['hits'] for entry in entries.values()) == 1
+
+
+def test_batched_hits(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.put('id0', {'line': []}, '')
+    index_path = tmp_path / INDEX_FILE
+    mtime = os.stat(index_path).st_mtime_ns
+
+    # Hits on a recently accessed entry do not rewrite the index
+    for _ in range(3):
+        assert store.get('id0') is not None
+    assert os.stat(index_path).st_mtime_ns == mtime
+    assert store.stats()['hits'] == 3
+
+    store.flush()
+    with open(index_path, encoding='utf-8') as f:
+        assert json.load(f)['entries']['id0']['hits'] == 3
+
+    # Without an interval, every hit is written
+    store = ResultStore(str(tmp_path), access_interval=0)
+    store.get('id0')
+    with open(index_path, encoding='utf-8') as f:
+        assert json.load(f)['entries']['id0']['hits'] == 4
+
+
+def test_definitions_fingerprint(tmp_path):
+    data_path = get_default_data_path()
+    a = Chanda(data_path)
+    b = Chanda(data_path)
+    assert a.fingerprint == b.fingerprint
+    b.fingerprint = 'changed'
+
+    first = a.analyze_text(TEXT, save_path=str(tmp_path))
+    second = b.analyze_text(TEXT, save_path=str(tmp_path))
+    assert first.path['json'] != second.path['json']
+
+
+def test_eviction(tmp_path):
+    store = ResultStore(str(tmp_path), max_bytes=300)
+    for idx in range(5):
+        store.put(f'id{idx}', {'line': ['x' * 50]}, 'y' * 50)
+    stats = store.stats()
+    assert stats['bytes'] <= 300
+    assert store.get('id4') is not None
+    assert store.get('id0') is None
+    assert not os.path.exists(tmp_path / 'result_id0.json')
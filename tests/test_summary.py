@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for streaming analysis and summary accumulators.
+
+Extended Summary
+----------------
+Validates that ``SummaryAccumulator`` reproduces ``summarize_results``,
+that partial accumulators merge into the full-corpus summary, and that
+``analyze_text`` processes its text only once.
+"""
+
+import pytest
+
+from chanda import Chanda, SummaryAccumulator
+from chanda.processor import SanskritTextProcessor
+from chanda.types import LineResult, VerseResult
+from chanda.utils import get_default_data_path
+
+
+TEXT = "\n".join([
+    "माता रामो मत्पिता रामचन्द्रः",
+    "स्वामी रामो मत्सखा रामचन्द्रः।",
+    "सर्वस्वं मे रामचन्द्रो दयालुर्",
+    "नान्यं‌ जाने नैव जाने न जाने॥",
+    "लोकाभिरामं रणरङ्गधीरं",
+    "राजीवनेत्रं रघुवंशनाथम्।",
+    "कारुण्यरूपं करुणाकरं तं",
+    "श्रीरामचन्द्रं शरणं प्रपद्ये॥",
+    "रामो राजमणिः सदा विजयते",
+])
+
+
+@pytest.fixture(scope="module")
+def chanda():
+    """
+    Create a Chanda instance.
+
+    Returns
+    -------
+    Chanda
+        Analyzer instance using the default data path.
+    """
+    return Chanda(get_default_data_path())
+
+
+def test_iter_matches_analyze_text(chanda):
+    """
+    Test that streamed items reproduce ``analyze_text`` results.
+    """
+    items = list(chanda.iter_analyze_text(TEXT, verse=True, fuzzy=True))
+    lines = [item for item in items if isinstance(item, LineResult)]
+    verses = [item for item in items if isinstance(item, VerseResult)]
+
+    result = chanda.analyze_text(TEXT, verse=True, fuzzy=True).result
+    assert [line.to_dict() for line in lines] == [line.to_dict() for line in result.line]
+    assert [verse.to_dict() for verse in verses] == [verse.to_dict() for verse in result.verse]
+    assert [verse.line_indices for verse in verses] == [[0, 1, 2, 3], [4, 5, 6, 7], [8]]
+
+
+@pytest.mark.parametrize('segment', [False, True])
+def test_analyze_text_processes_text_once(chanda, monkeypatch, segment):
+    """
+    Test that ``analyze_text`` cleans and scans the full text only once.
+    """
+    calls = []
+    for name in ('process_and_detect_scheme', 'process_and_detect_markers'):
+        method = getattr(SanskritTextProcessor, name)
+
+        def counting(text, method=method):
+            calls.append(text)
+            return method(text)
+
+        monkeypatch.setattr(SanskritTextProcessor, name, staticmethod(counting))
+
+    chanda.analyze_text(TEXT, verse=True, segment=segment)
+    assert calls.count(TEXT) == 1
+
+def test_accumulator_matches_summarize_results(chanda):
+    """
+    Test that the accumulator reproduces ``summarize_results``.
+    """
+    result = chanda.analyze_text(TEXT, verse=True, fuzzy=True)
+    expected = Chanda.summarize_results(result)
+
+    accumulator = SummaryAccumulator()
+    for item in chanda.iter_analyze_text(TEXT, verse=True, fuzzy=True):
+        accumulator.add(item)
+
+    assert accumulator.summary() == expected
+    assert Chanda.format_summary(accumulator.summary()) == Chanda.format_summary(expected)
+
+
+def test_accumulator_merge(chanda):
+    """
+    Test that merged shard accumulators equal a single accumulator.
+    """
+    lines = TEXT.split("\n")
+    shards = ["\n".join(lines[:4]), "\n".join(lines[4:])]
+
+    merged = SummaryAccumulator()
+    for shard in shards:
+        partial = SummaryAccumulator().update(
+            chanda.iter_analyze_text(shard, verse=True, fuzzy=True)
+        )
+        merged.merge(partial)
+
+    full = SummaryAccumulator().update(
+        chanda.iter_analyze_text(TEXT, verse=True, fuzzy=True)
+    )
+    assert merged.summary() == full.summary()